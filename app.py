@@ -45,10 +45,10 @@ from components.gemini_analyzer import GeminiAIAnalyzer
 from components.watchlist_manager import WatchlistManager
 from components.recommendation_learning import RecommendationTracker
 from components.firebase_integration import FirebaseSync
-from components.cache_manager import CacheManager
+from components.cache_manager import get_cache_manager
 from components.swing_strategy import SwingTradingStrategy
 from components.email_notifications import EmailNotificationManager, AlertType, AlertPriority
-from components.equity_loader import EquityLoader
+from components.equity_loader import get_equity_loader
 from components.price_monitor import PriceMonitor
 from components.notification_settings import NotificationSettingsManager, NotificationChannel
 from components.data_persistence import DataPersistenceManager
@@ -58,6 +58,9 @@ from components.portfolio_manager import PortfolioManager
 from components.performance_learning import PerformanceLearning
 from components.user_manager import UserManager
 from components.login_interface import LoginInterface
+from components.analysis_pipeline import AnalysisPipeline
+from components.rate_limiter import get_yahoo_rate_limiter
+from components.liveness_registry import get_liveness_registry
 
 # Page configuration
 st.set_page_config(
@@ -222,7 +225,7 @@ class StreamlitTradingApp:
         if 'saved_gemini_key' not in st.session_state:
             st.session_state.saved_gemini_key = ''
         if 'cache_manager' not in st.session_state:
-            st.session_state.cache_manager = CacheManager()
+            st.session_state.cache_manager = get_cache_manager()
         if 'swing_strategy' not in st.session_state:
             st.session_state.swing_strategy = SwingTradingStrategy()
         if 'email_notifications' not in st.session_state:
@@ -237,8 +240,8 @@ class StreamlitTradingApp:
             st.session_state.data_persistence = DataPersistenceManager(username=current_user)
         if 'scheduled_analysis' not in st.session_state:
             st.session_state.scheduled_analysis = ScheduledAnalysis(self.analyze_market)
-        if 'equity_loader' not in st.session_state:
-            st.session_state.equity_loader = EquityLoader()
+        # Shared across sessions; reloaded only when EQUITY.csv changes
+        st.session_state.equity_loader = get_equity_loader()
         if 'portfolio_manager' not in st.session_state:
             st.session_state.portfolio_manager = PortfolioManager()
         if 'performance_learning' not in st.session_state:
@@ -273,10 +276,14 @@ class StreamlitTradingApp:
             self.ai_engine = AIRecommendationEngine()
             self.technical_analyzer = TechnicalAnalyzer()
             self.fundamental_analyzer = FundamentalAnalyzer()
-            self.news_analyzer = NewsAnalyzer()
+            if 'news_analyzer' not in st.session_state:
+                st.session_state.news_analyzer = NewsAnalyzer()
+            self.news_analyzer = st.session_state.news_analyzer
             self.groq_analyzer = GroqNewsAnalyzer()
             self.gemini_analyzer = GeminiAIAnalyzer()
             self.watchlist_manager = WatchlistManager()
+            self.analysis_pipeline = AnalysisPipeline()
+            self.liveness_registry = get_liveness_registry()
             
             # Set fundamental analyzer in AI engine
             self.ai_engine.set_fundamental_analyzer(self.fundamental_analyzer)
@@ -840,9 +847,22 @@ class StreamlitTradingApp:
             cache_stats = cache_manager.get_cache_stats()
             st.metric("Articles", cache_stats.get('articles', 0))
             st.metric("Stocks", cache_stats.get('stocks', 0))
+            memory_lookups = cache_stats.get('memory_hits', 0) + cache_stats.get('memory_misses', 0)
+            disk_lookups = cache_stats.get('disk_hits', 0) + cache_stats.get('disk_misses', 0)
+            if memory_lookups:
+                st.caption(f"Memory hits: {cache_stats.get('memory_hits', 0) / memory_lookups:.0%} · "
+                           f"Disk hits: {cache_stats.get('disk_hits', 0) / disk_lookups if disk_lookups else 0:.0%}")
+            st.metric("Fundamentals", self.fundamental_analyzer.fundamentals_cache.get_stats().get('fresh_statements', 0))
+            llm_cache_stats = self.groq_analyzer.response_cache.get_stats()
+            st.metric("AI Responses", llm_cache_stats.get('entries', 0), help=f"Hit rate this session: {llm_cache_stats.get('hit_rate', 0):.0%}")
+            
+            if st.button("🔥 Warm Fundamentals", key="warm_fundamentals_btn", help="Pre-fetch fundamentals for watchlist and portfolio stocks"):
+                self.warm_fundamentals_cache()
             
             if st.button("🗑️ Clear Cache", key="clear_cache_btn"):
                 cache_manager.clear_cache('all')
+                self.groq_analyzer.response_cache.clear()
+                self.fundamental_analyzer.fundamentals_cache.clear()
                 st.success("Cache cleared!")
                 st.rerun()
             
@@ -1528,6 +1548,15 @@ class StreamlitTradingApp:
                 help="Enter NSE stock symbol without .NS suffix"
             )
         
+            # Suggest matching symbols while the entry is not an exact NSE symbol
+            equity_loader = st.session_state.equity_loader
+            if symbol and not equity_loader.is_valid_stock(symbol.strip().upper()):
+                suggestions = equity_loader.search_top_k(symbol, limit=5)
+                if suggestions:
+                    st.caption("Did you mean: " + ", ".join(
+                        f"**{match['symbol']}** ({match['company_name'].title()})" for match in suggestions
+                    ))
+        
         with col2:
             if st.button("🔍 Analyze Stock", type="primary", key="analyze_stock_btn"):
                 if symbol:
@@ -1707,18 +1736,23 @@ class StreamlitTradingApp:
             try:
                 # Get current prices for all portfolio symbols
                 price_data = {}
+                rate_limiter = get_yahoo_rate_limiter()
                 for item in portfolio_manager.portfolio_data:
                     symbol = item.get('symbol')
                     if symbol:
                         try:
                             symbol_with_suffix = f"{symbol}.NS"
+                            rate_limiter.acquire()
                             ticker = yf.Ticker(symbol_with_suffix)
                             hist = ticker.history(period="1d")
+                            rate_limiter.report_success()
                             
                             if not hist.empty:
                                 current_price = float(hist['Close'].iloc[-1])
                                 price_data[symbol] = current_price
                         except Exception as e:
+                            if rate_limiter.is_throttle_error(e):
+                                rate_limiter.report_throttled()
                             logger.warning(f"Could not get price for {symbol}: {str(e)}")
                 
                 # Update portfolio with new prices
@@ -1750,6 +1784,7 @@ class StreamlitTradingApp:
                 
                 analyzed_count = 0
                 progress_bar = st.progress(0)
+                sentiment_batch = self.news_analyzer.build_symbol_sentiment(st.session_state.news_articles)
                 
                 for i, item in enumerate(items_to_analyze):
                     symbol = item.get('symbol')
@@ -1759,23 +1794,20 @@ class StreamlitTradingApp:
                     try:
                         symbol_with_suffix = f"{symbol}.NS"
                         
-                        # Validate stock before analysis
-                        if not self.fundamental_analyzer.is_stock_valid(symbol_with_suffix):
-                            logger.warning(f"Skipping {symbol} - appears to be delisted or has no data")
-                            continue
-                        
-                        # Get technical analysis
+                        # Get technical analysis (delisted symbols are skipped by the analyzer)
                         technical_data = self.technical_analyzer.analyze_stock(symbol_with_suffix)
                         if not technical_data:
                             continue
                         
+                        if self.liveness_registry.get_status(symbol_with_suffix) == 'stale':
+                            logger.warning(f"Skipping {symbol} - no recent trading data, might be delisted")
+                            continue
+                        
                         # Get fundamental analysis
                         fundamental_data = self.fundamental_analyzer.get_financial_data(symbol_with_suffix)
                         
                         # Get news sentiment
-                        news_sentiment = 0.5  # Default neutral
-                        if st.session_state.news_articles:
-                            news_sentiment = self.news_analyzer.analyze_news_sentiment(st.session_state.news_articles)
+                        news_sentiment = sentiment_batch['symbols'].get(symbol, sentiment_batch['overall'])
                         
                         # Get Groq analysis
                         groq_analysis = self.groq_analyzer.get_comprehensive_stock_analysis(
@@ -2526,6 +2558,77 @@ class StreamlitTradingApp:
             logger.error(f"Error validating NSE stocks: {str(e)}")
             return stock_symbols  # Return original list if validation fails
     
+    def _split_cached_symbols(self, symbols: List[str]) -> Tuple[Dict[str, Dict], List[str]]:
+        """Split symbols into cached stock analyses and symbols that still need fetching."""
+        cache_manager = get_cache_manager()
+        cached = {}
+        uncached = []
+        for symbol in symbols:
+            cached_analysis = cache_manager.get_cached_stock_analysis(symbol)
+            if cached_analysis and cached_analysis.get('technical_data'):
+                cached[symbol] = cached_analysis
+            else:
+                uncached.append(symbol)
+        return cached, uncached
+    
+    def _fetch_symbol_analysis(self, symbol: str, all_news: List[Dict], news_articles: List[Dict],
+                               use_gemini: bool = True, technical_data: Optional[Dict] = None,
+                               cached_analysis: Optional[Dict] = None) -> Optional[Dict]:
+        """Run the network-bound analysis stages for one symbol.
+        
+        Runs on an AnalysisPipeline worker thread, so it must not call Streamlit APIs.
+        Pass technical_data from a batch download to skip the per-symbol fetch.
+        A cached_analysis from _split_cached_symbols is returned as is, marked with from_cache.
+        Returns None when the symbol should be skipped.
+        """
+        pipeline = self.analysis_pipeline
+        symbol_with_suffix = f"{symbol}.NS"
+        
+        if cached_analysis:
+            logger.info(f"Using cached analysis for {symbol}")
+            return {
+                'technical_data': cached_analysis['technical_data'],
+                'fundamental_data': cached_analysis.get('fundamental_data', {}),
+                'groq_analysis': cached_analysis.get('groq_analysis', {}),
+                'gemini_analysis': cached_analysis.get('gemini_analysis'),
+                'from_cache': True
+            }
+        
+        # Get technical analysis (delisted symbols are skipped by the analyzer)
+        if not technical_data:
+            technical_data = pipeline.run_stage('technical', self.technical_analyzer.analyze_stock, symbol_with_suffix)
+        if not technical_data:
+            return None
+        
+        # The bar fetch above recorded the last trading date, no separate validation probe needed
+        if self.liveness_registry.get_status(symbol_with_suffix) == 'stale':
+            logger.warning(f"Skipping {symbol} - no recent trading data, might be delisted")
+            return None
+        
+        # Get fundamental analysis
+        fundamental_data = pipeline.run_stage('fundamental', self.fundamental_analyzer.get_financial_data, symbol_with_suffix)
+        
+        # Get comprehensive Groq AI analysis using the analyzed news, batched with other workers' symbols
+        groq_analysis = pipeline.run_stage(
+            'groq', self.groq_analyzer.get_comprehensive_stock_analysis_batched,
+            symbol, technical_data, fundamental_data, all_news
+        )
+        
+        # Get Gemini AI analysis
+        gemini_analysis = None
+        if use_gemini and self.gemini_analyzer.initialized:
+            gemini_analysis = pipeline.run_stage(
+                'gemini', self.gemini_analyzer.analyze_stock_comprehensive,
+                symbol, technical_data, fundamental_data, news_articles, groq_analysis
+            )
+        
+        return {
+            'technical_data': technical_data,
+            'fundamental_data': fundamental_data,
+            'groq_analysis': groq_analysis,
+            'gemini_analysis': gemini_analysis
+        }
+    
     def analyze_market(self):
         """Analyze market and generate recommendations."""
         if st.session_state.analysis_in_progress:
@@ -2579,8 +2682,9 @@ class StreamlitTradingApp:
                     st.info(f"📈 Getting additional stocks from EQUITY.csv to ensure at least 5 recommendations...")
                     additional_stocks = equity_loader.get_top_stocks(20)  # Get top 20 stocks
                     # Filter out stocks already in news and watchlist
-                    watchlist_symbols = [item.get('symbol', '') for item in st.session_state.watchlist]
-                    additional_stocks = [s for s in additional_stocks if s not in news_stocks and s not in watchlist_symbols]
+                    watchlist_symbols = cache_manager.build_watchlist_index(st.session_state.watchlist)
+                    excluded = set(news_stocks)
+                    additional_stocks = [s for s in additional_stocks if s not in excluded and s.upper() not in watchlist_symbols]
                     news_stocks.extend(additional_stocks[:10])  # Add up to 10 additional stocks
                 
                 # Filter out stocks already in watchlist (unless very negative news)
@@ -2604,55 +2708,42 @@ class StreamlitTradingApp:
                 
                 progress_bar = st.progress(0)
                 total_stocks = len(all_analysis_stocks)
+                news_articles = list(st.session_state.news_articles)
+                performance_learning = st.session_state.performance_learning
+                swing_strategy = st.session_state.swing_strategy
+                
+                # Score every article once; the loops below only look up per-symbol values
+                sentiment_batch = self.news_analyzer.build_symbol_sentiment(all_news)
+                
+                # Download price history in a few grouped requests, only for symbols without a cached analysis
+                cached_analyses, uncached_stocks = self._split_cached_symbols(all_analysis_stocks)
+                technical_batch = self.technical_analyzer.analyze_stocks([f"{s}.NS" for s in uncached_stocks])
                 
-                for i, symbol in enumerate(all_analysis_stocks):
+                # Network-bound stages run on the worker pool; results are consumed here as they finish
+                def analyze_news_stock(symbol):
+                    return self._fetch_symbol_analysis(
+                        symbol, all_news, news_articles,
+                        technical_data=technical_batch.get(f"{symbol}.NS"),
+                        cached_analysis=cached_analyses.get(symbol)
+                    )
+                
+                completed = 0
+                for symbol, analysis, error in self.analysis_pipeline.run(all_analysis_stocks, analyze_news_stock):
+                    completed += 1
+                    progress_bar.progress(completed / total_stocks, text=f"Analyzed {symbol} ({completed}/{total_stocks})")
+                    
+                    if error is not None or not analysis:
+                        continue
+                    
                     try:
-                        symbol_with_suffix = f"{symbol}.NS"
-                        
-                        # Check cache for stock analysis
-                        cached_analysis = cache_manager.get_cached_stock_analysis(symbol)
-                        
-                        if cached_analysis:
-                            # Use cached analysis
-                            technical_data = cached_analysis.get('technical_data', {})
-                            fundamental_data = cached_analysis.get('fundamental_data', {})
-                            groq_analysis = cached_analysis.get('groq_analysis', {})
-                            gemini_analysis = cached_analysis.get('gemini_analysis', {})
-                            recommendation = cached_analysis.get('recommendation', {})
-                            
-                            logger.info(f"Using cached analysis for {symbol}")
-                        else:
-                            # Perform fresh analysis
-                            # Validate stock before analysis
-                            if not self.fundamental_analyzer.is_stock_valid(symbol_with_suffix):
-                                logger.warning(f"Skipping {symbol} - appears to be delisted or has no data")
-                                continue
-                        
-                        # Get technical analysis
-                        technical_data = self.technical_analyzer.analyze_stock(symbol_with_suffix)
-                        if not technical_data:
-                            continue
-                        
-                        # Get fundamental analysis
-                        fundamental_data = self.fundamental_analyzer.get_financial_data(symbol_with_suffix)
-                        
-                        # Get comprehensive Groq AI analysis using the analyzed news
-                        groq_analysis = self.groq_analyzer.get_comprehensive_stock_analysis(
-                                symbol, technical_data, fundamental_data, all_news
-                        )
-                        
-                        # Get Gemini AI analysis
-                        gemini_analysis = None
-                        if self.gemini_analyzer.initialized:
-                            gemini_analysis = self.gemini_analyzer.analyze_stock_comprehensive(
-                                symbol, technical_data, fundamental_data, st.session_state.news_articles, groq_analysis
-                            )
+                        technical_data = analysis['technical_data']
+                        fundamental_data = analysis['fundamental_data']
+                        groq_analysis = analysis['groq_analysis']
+                        gemini_analysis = analysis['gemini_analysis']
                         
                         # Generate AI recommendation
-                        # Calculate news sentiment for this stock
-                        news_sentiment = 0.5  # Default neutral
-                        if all_news:
-                            news_sentiment = self.news_analyzer.analyze_news_sentiment(all_news)
+                        # News sentiment for this stock, falling back to the overall market mood
+                        news_sentiment = sentiment_batch['symbols'].get(symbol, sentiment_batch['overall'])
                         
                         recommendation = self.ai_engine.generate_ai_recommendation(
                             fundamental_data, technical_data, news_sentiment, [], groq_analysis, gemini_analysis
@@ -2665,8 +2756,10 @@ class StreamlitTradingApp:
                             if impact_level in ['HIGH', 'MEDIUM', 'LOW']:
                                 news_impact = impact_level
                         
-                        # Check if stock is relevant for caching
-                        if cache_manager.is_stock_relevant_for_caching(symbol, recommendation, news_impact):
+                        # Check if stock is relevant for caching; a cached analysis keeps its original timestamp
+                        if analysis.get('from_cache'):
+                            logger.debug(f"Keeping cached analysis for {symbol}")
+                        elif cache_manager.is_stock_relevant_for_caching(symbol, recommendation, news_impact):
                             # Cache the recommendation with change detection
                             recommendation = cache_manager.cache_recommendation(symbol, recommendation)
                             
@@ -2685,7 +2778,6 @@ class StreamlitTradingApp:
                         # Only include BUY recommendations (SKIP others)
                         if recommendation.get('action') == 'BUY':
                             # Apply performance learning to improve recommendation
-                            performance_learning = st.session_state.performance_learning
                             improved_recommendation = performance_learning.apply_learning_to_recommendation(
                                 symbol, technical_data, groq_analysis, recommendation
                             )
@@ -2700,7 +2792,6 @@ class StreamlitTradingApp:
                             recommendation = improved_recommendation
                             
                             # Generate swing trading plan
-                            swing_strategy = st.session_state.swing_strategy
                             # Get company name from groq analysis or use symbol as fallback
                             company_name = ''
                             if groq_analysis and groq_analysis.get('status') == 'success':
@@ -2748,9 +2839,6 @@ class StreamlitTradingApp:
                         else:
                             logger.info(f"Skipped {symbol} - not a BUY recommendation")
                         
-                        # Update progress
-                        progress_bar.progress((i + 1) / total_stocks)
-                        
                     except Exception as e:
                         logger.error(f"Error analyzing news stock {symbol}: {str(e)}")
                         continue
@@ -2765,34 +2853,30 @@ class StreamlitTradingApp:
                     already_analyzed = [rec.get('symbol', '') for rec in news_recommendations]
                     additional_stocks = [s for s in additional_stocks if s not in already_analyzed and s not in all_analysis_stocks]
                     
-                    # Analyze additional stocks
-                    for symbol in additional_stocks[:20]:  # Analyze up to 20 more stocks
-                        if len(news_recommendations) >= 5:
-                            break
+                    additional_stocks = additional_stocks[:20]
+                    additional_cached, additional_uncached = self._split_cached_symbols(additional_stocks)
+                    additional_batch = self.technical_analyzer.analyze_stocks([f"{s}.NS" for s in additional_uncached])
+                    
+                    def analyze_additional_stock(symbol):
+                        return self._fetch_symbol_analysis(
+                            symbol, all_news, news_articles, use_gemini=False,
+                            technical_data=additional_batch.get(f"{symbol}.NS"),
+                            cached_analysis=additional_cached.get(symbol)
+                        )
+                    
+                    # Analyze up to 20 more stocks; pending ones are cancelled once 5 are found
+                    additional_results = self.analysis_pipeline.run(additional_stocks, analyze_additional_stock)
+                    for symbol, analysis, error in additional_results:
+                        if error is not None or not analysis:
+                            continue
                             
                         try:
-                            symbol_with_suffix = f"{symbol}.NS"
-                            
-                            # Validate stock before analysis
-                            if not self.fundamental_analyzer.is_stock_valid(symbol_with_suffix):
-                                logger.warning(f"Skipping additional stock {symbol} - appears to be delisted or has no data")
-                                continue
-                            
-                            # Get technical analysis
-                            technical_data = self.technical_analyzer.analyze_stock(symbol_with_suffix)
-                            if not technical_data:
-                                continue
-                            
-                            # Get fundamental analysis
-                            fundamental_data = self.fundamental_analyzer.get_financial_data(symbol_with_suffix)
-                            
-                            # Get Groq analysis
-                            groq_analysis = self.groq_analyzer.get_comprehensive_stock_analysis(
-                                symbol, technical_data, fundamental_data, all_news
-                            )
+                            technical_data = analysis['technical_data']
+                            fundamental_data = analysis['fundamental_data']
+                            groq_analysis = analysis['groq_analysis']
                             
                             # Calculate news sentiment
-                            news_sentiment = self.news_analyzer.analyze_news_sentiment(all_news)
+                            news_sentiment = sentiment_batch['symbols'].get(symbol, sentiment_batch['overall'])
                             
                             # Generate AI recommendation
                             recommendation = self.ai_engine.generate_ai_recommendation(
@@ -2802,7 +2886,6 @@ class StreamlitTradingApp:
                             # Only include BUY recommendations
                             if recommendation.get('action') == 'BUY':
                                 # Apply performance learning to improve recommendation
-                                performance_learning = st.session_state.performance_learning
                                 improved_recommendation = performance_learning.apply_learning_to_recommendation(
                                     symbol, technical_data, groq_analysis, recommendation
                                 )
@@ -2852,7 +2935,10 @@ class StreamlitTradingApp:
                         
                         except Exception as e:
                             logger.error(f"Error analyzing additional stock {symbol}: {str(e)}")
-                        continue
+                        
+                        if len(news_recommendations) >= 5:
+                            additional_results.close()
+                            break
                 
                 # Set final recommendations
                 st.session_state.recommendations = news_recommendations
@@ -2873,6 +2959,8 @@ class StreamlitTradingApp:
         except Exception as e:
             st.error(f"❌ Error analyzing market: {str(e)}")
         finally:
+            # Persist cache writes queued during the analysis
+            st.session_state.cache_manager.flush()
             st.session_state.analysis_in_progress = False
     
     def analyze_manual_stock(self, symbol: str):
@@ -2881,17 +2969,16 @@ class StreamlitTradingApp:
             try:
                 symbol_with_suffix = f"{symbol}.NS"
                 
-                # Validate stock before analysis
-                if not self.fundamental_analyzer.is_stock_valid(symbol_with_suffix):
-                    st.warning(f"Stock {symbol} appears to be delisted or has no data available. Skipping analysis.")
-                    return
-                
-                # Get technical analysis
+                # Get technical analysis (delisted symbols are skipped by the analyzer)
                 technical_data = self.technical_analyzer.analyze_stock(symbol_with_suffix)
                 if not technical_data:
                     st.error(f"No technical data available for {symbol}")
                     return
                 
+                if self.liveness_registry.get_status(symbol_with_suffix) == 'stale':
+                    st.warning(f"Stock {symbol} appears to be delisted or has no recent data. Skipping analysis.")
+                    return
+                
                 # Get fundamental analysis
                 fundamental_data = self.fundamental_analyzer.get_financial_data(symbol_with_suffix)
                 
@@ -3027,6 +3114,8 @@ class StreamlitTradingApp:
                 total_count = len(st.session_state.watchlist)
                 
                 progress_bar = st.progress(0)
+                rate_limiter = get_yahoo_rate_limiter()
+                sentiment_batch = self.news_analyzer.build_symbol_sentiment(st.session_state.news_articles)
                 
                 for i, item in enumerate(st.session_state.watchlist):
                     symbol = item.get('symbol')
@@ -3066,9 +3155,7 @@ class StreamlitTradingApp:
                             fundamental_data = self.fundamental_analyzer.get_financial_data(symbol_with_suffix)
                             
                             # Get news sentiment
-                            news_sentiment = 0.5  # Default neutral
-                            if st.session_state.news_articles:
-                                news_sentiment = self.news_analyzer.analyze_news_sentiment(st.session_state.news_articles)
+                            news_sentiment = sentiment_batch['symbols'].get(symbol, sentiment_batch['overall'])
                             
                             # Get Groq analysis
                             groq_analysis = self.groq_analyzer.get_comprehensive_stock_analysis(
@@ -3158,8 +3245,10 @@ class StreamlitTradingApp:
                     if symbol:
                         try:
                             symbol_with_suffix = f"{symbol}.NS"
+                            rate_limiter.acquire()
                             ticker = yf.Ticker(symbol_with_suffix)
                             hist = ticker.history(period="1d")
+                            rate_limiter.report_success()
                             
                             if not hist.empty:
                                 current_price = hist['Close'].iloc[-1]
@@ -3170,6 +3259,8 @@ class StreamlitTradingApp:
                             progress_bar.progress((i + 1) / total_count)
                             
                         except Exception as e:
+                            if rate_limiter.is_throttle_error(e):
+                                rate_limiter.report_throttled()
                             logger.error(f"Error updating price for {symbol}: {str(e)}")
                 
                 # Auto-save updated watchlist
@@ -3180,6 +3271,23 @@ class StreamlitTradingApp:
             except Exception as e:
                 st.error(f"❌ Error updating watchlist prices: {str(e)}")
     
+    def warm_fundamentals_cache(self):
+        """Pre-fetch fundamentals for all watchlist and portfolio stocks."""
+        symbols = [item.get('symbol') for item in st.session_state.watchlist]
+        symbols += [item.get('symbol') for item in st.session_state.portfolio_manager.portfolio_data]
+        symbols = [f"{symbol}.NS" for symbol in symbols if symbol]
+        
+        if not symbols:
+            st.info("No watchlist or portfolio stocks to warm up")
+            return
+        
+        with st.spinner(f"🔥 Warming fundamentals cache for {len(symbols)} stocks..."):
+            try:
+                warmed = self.fundamental_analyzer.warm_up_cache(symbols)
+                st.success(f"✅ Fetched fundamentals for {warmed} stocks, the rest were already cached")
+            except Exception as e:
+                st.error(f"❌ Error warming fundamentals cache: {str(e)}")
+    
     def update_watchlist_item(self, symbol: str):
         """Update a specific watchlist item."""
         st.info(f"Updating {symbol}...")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Analysis Pipeline Component
+Bounded worker-pool engine that fans per-symbol analysis stages out across symbols.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class AnalysisPipeline:
+    """Runs a per-symbol analysis function on a bounded thread pool with per-stage concurrency limits."""
+
+    # Maximum number of symbols allowed inside each stage at the same time
+    DEFAULT_STAGE_CONCURRENCY = {
+        'technical': 4,
+        'fundamental': 2,
+        'groq': 4,          # Symbols sharing one batched Groq request (GroqNewsAnalyzer.batch_size)
+        'gemini': 1
+    }
+
+    def __init__(self, max_workers: int = 6, stage_concurrency: Optional[Dict[str, int]] = None):
+        """Initialize analysis pipeline.
+
+        Args:
+            max_workers: Number of symbols analyzed concurrently
+            stage_concurrency: Per-stage limits overriding DEFAULT_STAGE_CONCURRENCY
+        """
+        self.max_workers = max(1, max_workers)
+        self.stage_concurrency = dict(self.DEFAULT_STAGE_CONCURRENCY)
+        if stage_concurrency:
+            self.stage_concurrency.update(stage_concurrency)
+
+        self._stage_semaphores = {
+            stage: threading.BoundedSemaphore(max(1, limit))
+            for stage, limit in self.stage_concurrency.items()
+        }
+        self._lock = threading.Lock()
+        logger.info(f"Analysis Pipeline initialized with {self.max_workers} workers, stage limits: {self.stage_concurrency}")
+
+    def _get_semaphore(self, stage: str) -> threading.BoundedSemaphore:
+        """Get the semaphore guarding a stage, creating one for unknown stages."""
+        with self._lock:
+            if stage not in self._stage_semaphores:
+                limit = self.stage_concurrency.get(stage, self.max_workers)
+                self._stage_semaphores[stage] = threading.BoundedSemaphore(max(1, limit))
+            return self._stage_semaphores[stage]
+
+    @contextmanager
+    def stage(self, name: str):
+        """Context manager that holds a slot of the named stage while the block runs."""
+        semaphore = self._get_semaphore(name)
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    def run_stage(self, name: str, func: Callable, *args, **kwargs) -> Any:
+        """Call func inside the named stage."""
+        with self.stage(name):
+            return func(*args, **kwargs)
+
+    def run(self, symbols: List[str], analyze_func: Callable[[str], Any]) -> Iterator[Tuple[str, Any, Optional[Exception]]]:
+        """Analyze symbols concurrently and yield (symbol, result, error) as each one finishes.
+
+        The worker function must not touch Streamlit APIs; consume the results on the
+        calling thread to update the UI. Closing the generator early cancels symbols
+        that have not started yet.
+        """
+        if not symbols:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(symbols)),
+                                      thread_name_prefix='analysis')
+        futures = {executor.submit(analyze_func, symbol): symbol for symbol in symbols}
+        try:
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    yield symbol, future.result(), None
+                except Exception as e:
+                    logger.error(f"Pipeline error analyzing {symbol}: {str(e)}")
+                    yield symbol, None, e
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
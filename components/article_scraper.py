@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Article Scraper Component
+Concurrent article body scraping over a pooled session with an on-disk content cache.
+"""
+
+import json
+import os
+import re
+import logging
+import threading
+import time
+import requests
+from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class ArticleScraper:
+    """Fetches article bodies in parallel over one long-lived connection pool.
+    
+    Downloads run on a thread pool with a per-host concurrency limit so a batch
+    of articles from the same site does not trip its bot protection. Extracted
+    text is cached on disk by URL; failed fetches are cached for a shorter time
+    so the description fallback is used without hitting the site again.
+    """
+    
+    USER_AGENTS = [
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15'
+    ]
+    
+    CONTENT_SELECTORS = [
+        '.article-content',
+        '.article-body',
+        '.content',
+        '.post-content',
+        '.entry-content',
+        '[data-test="article-content"]',
+        '.article-text',
+        '.articlePage',
+        '.article-wrapper',
+        '.article__content',
+        '.article-content-wrapper',
+        '.post-body',
+        '.entry-body',
+        '.story-body',
+        '.article-main-content'
+    ]
+    
+    def __init__(self, cache_file: str = os.path.join("cache", "article_cache.json"),
+                 max_workers: int = 8, per_host_limit: int = 4, timeout: float = 10.0):
+        """Initialize article scraper.
+        
+        Args:
+            cache_file: JSON file holding extracted article text by URL
+            max_workers: Total concurrent downloads
+            per_host_limit: Concurrent downloads allowed against one host
+            timeout: Connect/read timeout per request in seconds
+        """
+        self.cache_file = cache_file
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.content_cache_days = 7      # Published articles rarely change
+        self.failure_cache_hours = 6     # Retry blocked/empty pages after this
+        
+        self._lock = threading.Lock()
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper')
+        
+        self.session = requests.Session()
+        retry_strategy = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS"]
+        )
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry_strategy)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        cache_dir = os.path.dirname(cache_file)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.cache = self._load_cache()
+        logger.info(f"Article Scraper initialized with {len(self.cache)} cached articles")
+    
+    def _load_cache(self) -> Dict:
+        """Load cached article text from file."""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load article cache from {self.cache_file}: {str(e)}")
+        return {}
+    
+    def _save_cache(self):
+        """Drop expired entries and save the cache atomically (lock must be held)."""
+        try:
+            self.cache = {url: entry for url, entry in self.cache.items() if self._is_valid(entry)}
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, 'w') as f:
+                json.dump(self.cache, f)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            logger.error(f"Could not save article cache to {self.cache_file}: {str(e)}")
+    
+    def _is_valid(self, entry: Dict) -> bool:
+        """Whether a cache entry is still within its TTL."""
+        ttl = self.content_cache_days * 86400 if entry.get('content') else self.failure_cache_hours * 3600
+        return time.time() - entry.get('fetched_at', 0) < ttl
+    
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        """Semaphore bounding concurrent downloads against the URL's host."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_limits[host]
+    
+    def _browser_headers(self, url: str) -> Dict[str, str]:
+        """Browser-like request headers to avoid 403 responses."""
+        return {
+            'User-Agent': self.USER_AGENTS[hash(url) % len(self.USER_AGENTS)],  # Rotate user agents
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+            'Accept-Language': 'en-US,en;q=0.9,hi;q=0.8',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-User': '?1',
+            'Cache-Control': 'max-age=0',
+            'Referer': 'https://www.google.com/',
+            'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+            'sec-ch-ua-mobile': '?0',
+            'sec-ch-ua-platform': '"Windows"'
+        }
+    
+    def _extract_text(self, html: bytes) -> str:
+        """Extract the article text from a page."""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Try to find article content in common containers
+        content = ""
+        for selector in self.CONTENT_SELECTORS:
+            elements = soup.select(selector)
+            if elements:
+                content = ' '.join([elem.get_text(strip=True) for elem in elements])
+                if len(content) > 100:  # Ensure we got meaningful content
+                    break
+        
+        # If no specific content found, try to get all paragraph text
+        if not content or len(content) < 100:
+            paragraphs = soup.find_all('p')
+            content = ' '.join([p.get_text(strip=True) for p in paragraphs])
+        
+        # Clean up the content
+        content = re.sub(r'\s+', ' ', content)  # Replace multiple spaces with single space
+        return content[:5000]  # Limit to 5000 characters
+    
+    def _download(self, url: str) -> str:
+        """Download and extract one article; empty string when it cannot be fetched."""
+        headers = self._browser_headers(url)
+        
+        for attempt in range(2):
+            try:
+                if attempt == 1 and 'investing.com' in url:
+                    # Second attempt: with different headers for investing.com specifically
+                    headers.update({
+                        'User-Agent': self.USER_AGENTS[0],
+                        'Referer': 'https://in.investing.com/',
+                        'Origin': 'https://in.investing.com'
+                    })
+                
+                with self._host_limit(url):
+                    response = self.session.get(url, headers=headers, timeout=self.timeout, allow_redirects=True)
+                
+                if response.status_code >= 400:
+                    logger.warning(f"HTTP {response.status_code} when fetching {url} (attempt {attempt + 1})")
+                    continue
+                
+                content = self._extract_text(response.content)
+                if len(content) > 50:  # Only return if we got meaningful content
+                    logger.info(f"Successfully fetched content for {url} ({len(content)} characters)")
+                    return content
+                
+                logger.warning(f"Minimal content fetched for {url} - using description as fallback")
+                return ""
+            
+            except requests.exceptions.Timeout:
+                logger.warning(f"Timeout when fetching {url} (attempt {attempt + 1})")
+            except requests.exceptions.ConnectionError:
+                logger.warning(f"Connection error when fetching {url} (attempt {attempt + 1})")
+            except Exception as e:
+                logger.warning(f"Unexpected error when fetching {url}: {str(e)}")
+                return ""
+        
+        # If we get here, all attempts failed
+        logger.warning(f"All attempts failed for {url} - using description as fallback")
+        return ""
+    
+    def _get_cached(self, url: str) -> Optional[str]:
+        """Cached text for a URL, None on a miss."""
+        with self._lock:
+            entry = self.cache.get(url)
+            if entry and self._is_valid(entry):
+                return entry.get('content', '')
+        return None
+    
+    def fetch(self, url: str) -> str:
+        """Fetch the text of one article, using the content cache."""
+        return self.fetch_many([url]).get(url, '') if url else ''
+    
+    def fetch_many(self, urls: List[str]) -> Dict[str, str]:
+        """Fetch the text of many articles concurrently.
+        
+        Returns a dict of url -> extracted text (empty string when unavailable).
+        """
+        results = {}
+        pending = []
+        for url in dict.fromkeys(url for url in urls if url):
+            cached = self._get_cached(url)
+            if cached is None:
+                pending.append(url)
+            else:
+                results[url] = cached
+        
+        if not pending:
+            return results
+        
+        logger.info(f"Scraping {len(pending)} articles ({len(results)} served from cache)")
+        for url, content in zip(pending, self._executor.map(self._download, pending)):
+            results[url] = content
+        
+        with self._lock:
+            now = time.time()
+            for url in pending:
+                self.cache[url] = {'content': results[url], 'fetched_at': now}
+            self._save_cache()
+        
+        return results
+    
+    def get_stats(self) -> Dict:
+        """Get scraper statistics."""
+        with self._lock:
+            return {
+                'cached_articles': sum(1 for entry in self.cache.values() if entry.get('content')),
+                'cached_failures': sum(1 for entry in self.cache.values() if not entry.get('content')),
+                'cache_file': self.cache_file
+            }
+
+_article_scraper: Optional[ArticleScraper] = None
+_article_scraper_lock = threading.Lock()
+
+def get_article_scraper() -> ArticleScraper:
+    """Get the article scraper shared by every news analyzer in this process."""
+    global _article_scraper
+    with _article_scraper_lock:
+        if _article_scraper is None:
+            _article_scraper = ArticleScraper()
+        return _article_scraper
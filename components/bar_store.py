@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Bar Store Component
+Persistent per-symbol daily OHLCV store with incremental tail updates.
+"""
+
+import json
+import os
+import tempfile
+import time
+import logging
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class BarStore:
+    """On-disk columnar store of daily OHLCV bars, one memory-mapped NumPy file per symbol.
+    
+    Each symbol has a structured array file ``<symbol>.npy`` (date + OHLCV columns)
+    and a small ``<symbol>.json`` sidecar recording when it was last refreshed and how
+    far back its history is known to be complete. Callers fetch only the bars after the
+    last stored date and merge them in; the full history is re-downloaded only when it
+    is missing, too short, or the provider has re-adjusted past prices.
+    """
+    
+    COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+    DTYPE = np.dtype([('date', 'i8')] + [(column, 'f8') for column in COLUMNS])
+    
+    PERIOD_OFFSETS = {
+        '1d': pd.DateOffset(days=1),
+        '5d': pd.DateOffset(days=5),
+        '1mo': pd.DateOffset(months=1),
+        '3mo': pd.DateOffset(months=3),
+        '6mo': pd.DateOffset(months=6),
+        '1y': pd.DateOffset(years=1),
+        '2y': pd.DateOffset(years=2),
+        '5y': pd.DateOffset(years=5),
+        '10y': pd.DateOffset(years=10)
+    }
+    
+    def __init__(self, store_dir: str = os.path.join("cache", "bars"), refresh_interval: int = 900):
+        """Initialize bar store.
+        
+        Args:
+            store_dir: Directory holding the per-symbol bar files
+            refresh_interval: Seconds a stored series is served without checking for new bars
+        """
+        self.store_dir = store_dir
+        self.refresh_interval = refresh_interval
+        self.adjustment_tolerance = 1e-4  # Relative close difference that signals re-adjusted history
+        os.makedirs(store_dir, exist_ok=True)
+        logger.info(f"Bar Store initialized at {store_dir}")
+    
+    def _safe_name(self, symbol: str) -> str:
+        """File-system safe name for a symbol."""
+        return symbol.upper().replace('/', '_').replace('\\', '_')
+    
+    def _bars_file(self, symbol: str) -> str:
+        return os.path.join(self.store_dir, f"{self._safe_name(symbol)}.npy")
+    
+    def _meta_file(self, symbol: str) -> str:
+        return os.path.join(self.store_dir, f"{self._safe_name(symbol)}.json")
+    
+    def _load_meta(self, symbol: str) -> Dict:
+        """Load the sidecar metadata for a symbol."""
+        try:
+            meta_file = self._meta_file(symbol)
+            if os.path.exists(meta_file):
+                with open(meta_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load bar metadata for {symbol}: {str(e)}")
+        return {}
+    
+    def _write_atomic(self, target_file: str, write: Callable, mode: str = 'w'):
+        """Write a file through a uniquely named temp file and rename it into place.
+        
+        Concurrent writers (pipeline workers, other sessions) each get their own temp
+        file, so a published file is always one writer's complete output.
+        """
+        fd, temp_file = tempfile.mkstemp(dir=self.store_dir, prefix=f"{os.path.basename(target_file)}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, mode) as f:
+                write(f)
+            os.replace(temp_file, target_file)
+        except Exception:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+    
+    def _save_meta(self, symbol: str, meta: Dict):
+        """Save the sidecar metadata for a symbol."""
+        self._write_atomic(self._meta_file(symbol), lambda f: json.dump(meta, f))
+    
+    def stored_files(self) -> Dict[str, int]:
+        """Symbol -> modification time (ns) of its bar file, for every stored symbol."""
+        files = {}
+        try:
+            with os.scandir(self.store_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.npy'):
+                        files[entry.name[:-len('.npy')]] = entry.stat().st_mtime_ns
+        except OSError as e:
+            logger.warning(f"Could not list bar store {self.store_dir}: {str(e)}")
+        return files
+    
+    def average_traded_value(self, symbol: str, lookback: int = 20) -> Optional[float]:
+        """Mean daily Close x Volume over the last lookback stored bars, None if unknown."""
+        try:
+            bars_file = self._bars_file(symbol)
+            if not os.path.exists(bars_file):
+                return None
+            
+            bars = np.load(bars_file, mmap_mode='r')[-lookback:]
+            traded = np.asarray(bars['Close']) * np.asarray(bars['Volume'])
+            traded = traded[np.isfinite(traded)]
+            return float(traded.mean()) if len(traded) else None
+        
+        except Exception as e:
+            logger.warning(f"Could not read traded value for {symbol}: {str(e)}")
+            return None
+    
+    def period_start(self, period: str) -> Optional[pd.Timestamp]:
+        """First calendar date covered by a yfinance-style period, None for 'max'."""
+        today = pd.Timestamp.now().normalize()
+        if period == 'ytd':
+            return pd.Timestamp(year=today.year, month=1, day=1)
+        offset = self.PERIOD_OFFSETS.get(period)
+        return today - offset if offset is not None else None
+    
+    def load(self, symbol: str) -> pd.DataFrame:
+        """Load all stored bars for a symbol (empty frame if none)."""
+        try:
+            bars_file = self._bars_file(symbol)
+            if not os.path.exists(bars_file):
+                return pd.DataFrame(columns=list(self.COLUMNS))
+            
+            bars = np.load(bars_file, mmap_mode='r')
+            frame = pd.DataFrame(
+                {column: np.array(bars[column]) for column in self.COLUMNS},
+                index=pd.DatetimeIndex(np.array(bars['date']).astype('datetime64[ns]'), name='Date')
+            )
+            del bars
+            return frame
+        
+        except Exception as e:
+            logger.warning(f"Could not load stored bars for {symbol}: {str(e)}")
+            return pd.DataFrame(columns=list(self.COLUMNS))
+    
+    def _save(self, symbol: str, frame: pd.DataFrame):
+        """Write the full bar series for a symbol atomically."""
+        bars = np.empty(len(frame), dtype=self.DTYPE)
+        bars['date'] = frame.index.values.astype('datetime64[ns]').astype('i8')
+        for column in self.COLUMNS:
+            bars[column] = frame[column].to_numpy(dtype=float)
+        
+        self._write_atomic(self._bars_file(symbol), lambda f: np.save(f, bars), mode='wb')
+    
+    def _normalize(self, hist: pd.DataFrame) -> pd.DataFrame:
+        """Reduce a provider frame to tz-naive daily OHLCV rows."""
+        frame = hist.reindex(columns=list(self.COLUMNS)).astype(float)
+        index = pd.DatetimeIndex(frame.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        frame.index = index.normalize()
+        frame.index.name = 'Date'
+        frame = frame.dropna(how='all')
+        return frame[~frame.index.duplicated(keep='last')].sort_index()
+    
+    def is_fresh(self, symbol: str, max_age: Optional[int] = None) -> bool:
+        """Whether the stored series was refreshed within max_age seconds."""
+        max_age = self.refresh_interval if max_age is None else max_age
+        updated_at = self._load_meta(symbol).get('updated_at', 0)
+        return time.time() - updated_at < max_age
+    
+    def covers(self, symbol: str, period: str) -> bool:
+        """Whether stored history is complete back to the start of period."""
+        meta = self._load_meta(symbol)
+        if 'covered_from' not in meta or not os.path.exists(self._bars_file(symbol)):
+            return False
+        start = self.period_start(period)
+        covered_from = meta['covered_from']
+        if start is None:
+            return covered_from == 'max'
+        return covered_from == 'max' or pd.Timestamp(covered_from) <= start
+    
+    def fetch_start(self, symbol: str) -> Optional[pd.Timestamp]:
+        """Date to request new bars from: the second-to-last stored bar.
+        
+        The overlap re-fetches the latest bar (which may have been stored mid-session)
+        and one completed bar used to detect re-adjusted history.
+        """
+        stored = self.load(symbol)
+        if stored.empty:
+            return None
+        return stored.index[-2] if len(stored) > 1 else stored.index[-1]
+    
+    def slice_period(self, frame: pd.DataFrame, period: str) -> pd.DataFrame:
+        """Restrict a bar frame to a yfinance-style period."""
+        start = self.period_start(period)
+        if start is None or frame.empty:
+            return frame
+        return frame[frame.index >= start]
+    
+    def replace(self, symbol: str, hist: pd.DataFrame, period: str) -> pd.DataFrame:
+        """Store a full period download, replacing anything stored for the symbol."""
+        frame = self._normalize(hist)
+        if frame.empty:
+            return frame
+        
+        start = self.period_start(period)
+        self._save(symbol, frame)
+        self._save_meta(symbol, {
+            'covered_from': 'max' if start is None else start.isoformat(),
+            'updated_at': time.time(),
+            'last_date': frame.index[-1].isoformat()
+        })
+        return frame
+    
+    def merge(self, symbol: str, tail: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Merge newly fetched tail bars into the stored series.
+        
+        Returns the merged series, or None when overlapping completed bars disagree with
+        what is stored (dividend/split re-adjustment) and the caller must re-download.
+        """
+        stored = self.load(symbol)
+        meta = self._load_meta(symbol)
+        new_bars = self._normalize(tail) if tail is not None and not tail.empty else pd.DataFrame(columns=list(self.COLUMNS))
+        
+        if not new_bars.empty and len(stored) > 1:
+            # The last stored bar may be partial; earlier overlapping bars must match
+            overlap = new_bars.index.intersection(stored.index[:-1])
+            if len(overlap) > 0:
+                old_close = stored.loc[overlap, 'Close'].to_numpy()
+                new_close = new_bars.loc[overlap, 'Close'].to_numpy()
+                if not np.allclose(old_close, new_close, rtol=self.adjustment_tolerance, equal_nan=True):
+                    logger.info(f"Stored bars for {symbol} were re-adjusted by the provider, full refresh needed")
+                    return None
+        
+        if new_bars.empty:
+            # Nothing fetched (failed or throttled download): keep the stored bars stale
+            return stored
+        
+        merged = pd.concat([stored[~stored.index.isin(new_bars.index)], new_bars]).sort_index()
+        self._save(symbol, merged)
+        
+        meta['updated_at'] = time.time()
+        meta['last_date'] = merged.index[-1].isoformat()
+        self._save_meta(symbol, meta)
+        return merged
+    
+    def get_history(self, symbol: str, period: str,
+                    fetcher: Callable[..., pd.DataFrame], max_age: Optional[int] = None) -> pd.DataFrame:
+        """Get bars for a period, downloading only what the store is missing.
+        
+        Args:
+            symbol: Ticker symbol (e.g. RELIANCE.NS)
+            period: yfinance-style period such as '3mo'
+            fetcher: Callable fetcher(symbol, period=..., start=...) returning an OHLCV frame
+            max_age: Override of refresh_interval in seconds
+        """
+        try:
+            if self.covers(symbol, period):
+                if self.is_fresh(symbol, max_age):
+                    return self.slice_period(self.load(symbol), period)
+                
+                # The stored file may have been emptied since covers() checked it
+                start = self.fetch_start(symbol)
+                if start is not None:
+                    tail = fetcher(symbol, start=start.strftime('%Y-%m-%d'))
+                    merged = self.merge(symbol, tail)
+                    if merged is not None:
+                        return self.slice_period(merged, period)
+            
+            hist = fetcher(symbol, period=period)
+            if hist is None or hist.empty:
+                return pd.DataFrame()
+            return self.slice_period(self.replace(symbol, hist, period), period)
+        
+        except Exception as e:
+            logger.error(f"Error reading bar store for {symbol}: {str(e)}")
+            return fetcher(symbol, period=period)
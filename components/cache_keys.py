@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Cache Keys Component
+Stable, cheap cache keys for articles built from their normalized URL and title.
+"""
+
+import hashlib
+import logging
+from typing import Dict, Iterable, Set
+
+logger = logging.getLogger(__name__)
+
+# Separates the key parts; cannot occur in a normalized URL or title
+_SEPARATOR = '\x1f'
+
+def normalize_url(url: str) -> str:
+    """Canonical form of an article URL for deduplication.
+    
+    Surrounding whitespace, the #fragment and trailing slashes are dropped and the
+    scheme and host are lower-cased; the path and query keep their case.
+    """
+    url = (url or '').strip().split('#', 1)[0].rstrip('/')
+    scheme, sep, rest = url.partition('://')
+    if not sep:
+        return url
+    host, slash, path = rest.partition('/')
+    return f"{scheme.lower()}://{host.lower()}{slash}{path}"
+
+def normalize_title(title: str) -> str:
+    """Case-folded title with runs of whitespace collapsed to one space."""
+    return ' '.join((title or '').split()).casefold()
+
+def fast_key(text: str) -> str:
+    """16-hex-digit hash of a string, stable across processes (unlike hash())."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+def article_cache_key(article: Dict) -> str:
+    """Cache key of an article from its normalized URL and title."""
+    return fast_key(f"{normalize_url(article.get('url', ''))}{_SEPARATOR}{normalize_title(article.get('title', ''))}")
+
+def symbol_index(items: Iterable) -> Set[str]:
+    """Upper-cased symbols of watchlist/portfolio items for O(1) membership tests.
+    
+    Items may be dicts with a 'symbol' field or plain symbol strings.
+    """
+    symbols = set()
+    for item in items:
+        symbol = item.get('symbol', '') if isinstance(item, dict) else item
+        if symbol:
+            symbols.add(str(symbol).upper())
+    return symbols
@@ -4,22 +4,70 @@ Cache Manager Component
 Manages caching for articles and stock analysis to avoid redundant processing.
 """
 
-import json
-import pickle
-import hashlib
+import atexit
+import heapq
 import logging
-from typing import Dict, List, Optional, Any
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
 import os
+from components.cache_keys import article_cache_key, symbol_index
+from components.cache_store import CacheStore
 
 logger = logging.getLogger(__name__)
 
+def _synchronized(method):
+    """Run a CacheManager method under the manager's lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class CacheManager:
-    """Manages caching for articles and stock analysis with smart relevance tracking."""
+    """Manages caching for articles and stock analysis with smart relevance tracking.
+    
+    Each cache has two tiers: a bounded in-memory LRU of ``memory_entries`` values
+    over a namespace of an SQLite cache store. A memory miss is served from the
+    store and promoted; hits and misses are counted per tier. One manager is meant
+    to be shared by every session of the process (see ``get_cache_manager``), and
+    its public methods are serialized by a lock.
     
-    def __init__(self, cache_dir: str = "cache"):
-        """Initialize cache manager."""
+    Writes and deletions touch only the affected keys. In write-behind mode
+    (the default) changed keys are only marked dirty and a background thread
+    persists them every ``flush_interval`` seconds, or sooner once
+    ``flush_batch_size`` keys are pending; ``flush()`` writes them immediately.
+    
+    Expiry times are kept as epoch seconds in a per-namespace min-heap, so removing
+    expired entries only visits the expired ones and lookups never parse
+    timestamps. Each cache is also bounded by ``max_entries`` and ``max_bytes``
+    (pickled size) across both tiers, evicting the least recently used entries first.
+    """
+    
+    NAMESPACES = ('articles', 'stocks', 'analysis', 'recommendations')
+    _DELETED = object()  # Pending-write marker for a removed key
+    
+    def __init__(self, cache_dir: str = "cache", write_behind: bool = True,
+                 flush_interval: float = 2.0, flush_batch_size: int = 50,
+                 max_entries: int = 5000, max_bytes: int = 64 * 1024 * 1024,
+                 memory_entries: int = 1000):
+        """Initialize cache manager.
+        
+        Args:
+            cache_dir: Directory holding the cache store
+            write_behind: Persist changes from a background thread instead of inline
+            flush_interval: Seconds between background flushes
+            flush_batch_size: Pending keys that trigger an early flush
+            max_entries: Entries kept per cache before LRU eviction
+            max_bytes: Pickled bytes kept per cache before LRU eviction
+            memory_entries: Values kept in memory per cache; the rest stay on disk
+        """
         self.cache_dir = cache_dir
+        # Whole-dict pickles written by earlier versions, imported into the store once
         self.articles_cache_file = os.path.join(cache_dir, "articles_cache.pkl")
         self.stocks_cache_file = os.path.join(cache_dir, "stocks_cache.pkl")
         self.analysis_cache_file = os.path.join(cache_dir, "analysis_cache.pkl")
@@ -27,12 +75,7 @@ class CacheManager:
         
         # Create cache directory if it doesn't exist
         os.makedirs(cache_dir, exist_ok=True)
-        
-        # Load existing caches
-        self.articles_cache = self._load_cache(self.articles_cache_file)
-        self.stocks_cache = self._load_cache(self.stocks_cache_file)
-        self.analysis_cache = self._load_cache(self.analysis_cache_file)
-        self.recommendations_cache = self._load_cache(self.recommendations_cache_file)
+        self.store = CacheStore(os.path.join(cache_dir, "cache_store.db"))
         
         # Cache expiration times (in hours)
         self.articles_cache_hours = 168  # Articles cache for 7 days (168 hours)
@@ -40,93 +83,343 @@ class CacheManager:
         self.analysis_cache_hours = 168  # Groq analysis cache for 7 days (168 hours)
         self.recommendations_cache_hours = 168  # Recommendations cache for 7 days (168 hours)
         
+        # Size bounds and expiry index: heap of (expires_at, key) plus the current
+        # expiry (in LRU order over both tiers) and pickled size of every key, per namespace
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.evictions = 0
+        self._expiry_heap: Dict[str, List[Tuple[float, str]]] = {namespace: [] for namespace in self.NAMESPACES}
+        self._expires_at: Dict[str, "OrderedDict[str, float]"] = {namespace: OrderedDict() for namespace in self.NAMESPACES}
+        self._sizes: Dict[str, Dict[str, int]] = {namespace: {} for namespace in self.NAMESPACES}
+        self._bytes: Dict[str, int] = {namespace: 0 for namespace in self.NAMESPACES}
+        
+        # Per-tier lookup counters
+        self._lock = threading.RLock()
+        self.memory_hits = 0
+        self.memory_misses = 0
+        self.disk_hits = 0
+        self.disk_misses = 0
+        
+        # Write-behind state: namespace -> key -> value (or _DELETED), for queued
+        # changes and for the batch a flush is currently writing
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._in_flight: Dict[str, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if write_behind:
+            atexit.register(self.flush)
+        
+        # Load existing caches
+        self.articles_cache = self._load_cache('articles', self.articles_cache_file)
+        self.stocks_cache = self._load_cache('stocks', self.stocks_cache_file)
+        self.analysis_cache = self._load_cache('analysis', self.analysis_cache_file)
+        self.recommendations_cache = self._load_cache('recommendations', self.recommendations_cache_file)
+        for namespace in self.NAMESPACES:
+            self._clean_expired_cache(namespace)
+            self._evict(namespace)
+        
         logger.info("Smart Cache Manager initialized successfully")
     
-    def _load_cache(self, cache_file: str) -> Dict:
-        """Load cache from file."""
+    def _load_cache(self, namespace: str, legacy_file: str) -> "OrderedDict[str, Any]":
+        """Load a cache from the store, importing its legacy pickle on first run.
+        
+        Timestamps are parsed once here to build the expiry index, which starts in
+        oldest-first LRU order; only the newest ``memory_entries`` values stay in memory.
+        """
         try:
-            if os.path.exists(cache_file):
-                with open(cache_file, 'rb') as f:
-                    cache = pickle.load(f)
-                    logger.info(f"Loaded cache from {cache_file}")
-                    return cache
+            self.store.import_pickle(namespace, legacy_file)
+            entries = self.store.load(namespace)
+            sizes = self.store.sizes(namespace)
+            _, cache_hours = self._cache_for(namespace)
+            
+            expiries = {}
+            for key, value in entries.items():
+                expiries[key] = float('inf')  # Entries without timestamp (legacy entries) never expire
+                if isinstance(value, dict) and 'timestamp' in value:
+                    expiries[key] = self._expiry_epoch(value['timestamp'], cache_hours)
+            
+            ordered = sorted(entries, key=expiries.get)
+            for key in ordered:
+                self._index_entry(namespace, key, expiries[key], sizes.get(key, 0))
+            
+            resident = ordered[-self.memory_entries:] if self.memory_entries > 0 else []
+            cache = OrderedDict((key, entries[key]) for key in resident)
+            logger.info(f"Loaded {len(entries)} {namespace} cache entries ({len(cache)} in memory)")
+            return cache
         except Exception as e:
-            logger.warning(f"Could not load cache from {cache_file}: {str(e)}")
+            logger.warning(f"Could not load {namespace} cache: {str(e)}")
+        
+        return OrderedDict()
+    
+    def _cache_for(self, namespace: str) -> Tuple["OrderedDict[str, Any]", int]:
+        """In-memory tier and expiry hours of a namespace."""
+        return getattr(self, f"{namespace}_cache", None), getattr(self, f"{namespace}_cache_hours")
+    
+    def _index_entry(self, namespace: str, key: str, expires_at: float, size: int):
+        """Record the expiry and size of a key; older heap items for it go stale."""
+        expires = self._expires_at[namespace]
+        expires[key] = expires_at
+        expires.move_to_end(key)
+        heap = self._expiry_heap[namespace]
+        if expires_at != float('inf'):
+            heapq.heappush(heap, (expires_at, key))
+        if len(heap) > 2 * len(expires) + 64:
+            # Mostly stale items from rewritten keys: rebuild from the live expiries
+            heap[:] = [(when, name) for name, when in expires.items() if when != float('inf')]
+            heapq.heapify(heap)
+        self._bytes[namespace] += size - self._sizes[namespace].get(key, 0)
+        self._sizes[namespace][key] = size
+    
+    def _unindex_entry(self, namespace: str, key: str):
+        """Drop a key from the expiry and size index."""
+        self._expires_at[namespace].pop(key, None)
+        self._bytes[namespace] -= self._sizes[namespace].pop(key, 0)
+    
+    def _remember(self, namespace: str, key: str, value: Any):
+        """Put a value in the memory tier as most recently used, demoting the oldest to disk only."""
+        cache, _ = self._cache_for(namespace)
+        if self.memory_entries <= 0:
+            return
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.memory_entries:
+            cache.popitem(last=False)
+    
+    def _store_entry(self, namespace: str, key: str, value: Dict):
+        """Insert or replace a cache entry as most recently used, evicting if over the bounds."""
+        _, cache_hours = self._cache_for(namespace)
+        self._remember(namespace, key, value)
+        size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        self._index_entry(namespace, key, time.time() + cache_hours * 3600, size)
+        self._save_entries(namespace, {key: value})
+        self._evict(namespace)
+    
+    def _get_entry(self, namespace: str, key: str) -> Optional[Any]:
+        """Look a key up in memory, then on disk (promoting it to memory); None if absent."""
+        cache, _ = self._cache_for(namespace)
+        expires = self._expires_at[namespace]
+        if key in cache:
+            self.memory_hits += 1
+            cache.move_to_end(key)
+            expires.move_to_end(key)
+            return cache[key]
+        
+        self.memory_misses += 1
+        if key not in expires:
+            self.disk_misses += 1
+            return None
+        
+        # Changes not yet in the store are newer than what it holds. A change that is
+        # in neither map here has already been written, so the store read cannot miss it
+        # and never waits for a running flush.
+        value = self._queued_value(namespace, key)
+        if value is None:
+            try:
+                value = self.store.get(namespace, key)
+            except Exception as e:
+                logger.warning(f"Could not read {namespace} cache entry {key}: {str(e)}")
+        
+        if value is None or value is self._DELETED:
+            self.disk_misses += 1
+            self._unindex_entry(namespace, key)
+            return None
+        
+        self.disk_hits += 1
+        expires.move_to_end(key)
+        self._remember(namespace, key, value)
+        return value
+    
+    def _all_entries(self, namespace: str) -> List[Tuple[str, Any]]:
+        """Every live entry of a cache without promoting disk entries to memory."""
+        cache, _ = self._cache_for(namespace)
+        expires = self._expires_at[namespace]
+        if len(cache) >= len(expires):
+            return list(cache.items())
+        
+        # Snapshot the queued changes before reading the store (see _get_entry)
+        with self._pending_lock:
+            queued = dict(self._in_flight.get(namespace, {}))
+            queued.update(self._pending.get(namespace, {}))
+        entries = self.store.load(namespace)
+        entries.update(queued)
+        entries.update(cache)
+        return [(key, entries[key]) for key in expires
+                if key in entries and entries[key] is not self._DELETED]
+    
+    def _queued_value(self, namespace: str, key: str) -> Optional[Any]:
+        """Value of a key queued or being flushed (possibly _DELETED), None if not queued."""
+        with self._pending_lock:
+            value = self._pending.get(namespace, {}).get(key)
+            if value is None:
+                value = self._in_flight.get(namespace, {}).get(key)
+            return value
+    
+    def _is_live(self, namespace: str, key: str) -> bool:
+        """Whether a cached key has not expired yet."""
+        return self._expires_at[namespace].get(key, float('inf')) > time.time()
+    
+    def _evict(self, namespace: str):
+        """Drop least recently used entries from both tiers while a cache exceeds its bounds."""
+        expires = self._expires_at[namespace]
+        evicted = []
+        while expires and (len(expires) > self.max_entries or self._bytes[namespace] > self.max_bytes):
+            key = next(iter(expires))
+            self._unindex_entry(namespace, key)
+            evicted.append(key)
         
-        return {}
+        if evicted:
+            self.evictions += len(evicted)
+            self._delete_entries(namespace, evicted)
+            logger.info(f"Evicted {len(evicted)} least recently used {namespace} cache entries")
     
-    def _save_cache(self, cache: Dict, cache_file: str):
-        """Save cache to file."""
+    def _save_entries(self, namespace: str, entries: Dict):
+        """Persist changed entries of a cache (queued in write-behind mode)."""
+        if not entries:
+            return
+        if self.write_behind:
+            self._queue_writes(namespace, entries)
+            return
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(cache, f)
-                logger.info(f"Saved cache to {cache_file}")
+            self.store.put_many(namespace, entries)
         except Exception as e:
-            logger.error(f"Could not save cache to {cache_file}: {str(e)}")
+            logger.error(f"Could not save {namespace} cache entries: {str(e)}")
     
-    def _generate_cache_key(self, data: Any) -> str:
-        """Generate a cache key from data."""
+    def _delete_entries(self, namespace: str, keys: List[str]):
+        """Remove entries from a cache and from the store."""
+        cache, _ = self._cache_for(namespace)
+        for key in keys:
+            cache.pop(key, None)
+            self._unindex_entry(namespace, key)
+        if self.write_behind:
+            self._queue_writes(namespace, {key: self._DELETED for key in keys})
+            return
         try:
-            # Convert data to string and create hash
-            data_str = json.dumps(data, sort_keys=True, default=str)
-            return hashlib.md5(data_str.encode()).hexdigest()
+            self.store.delete(namespace, keys)
         except Exception as e:
-            logger.warning(f"Could not generate cache key: {str(e)}")
-            return str(hash(str(data)))
+            logger.error(f"Could not delete {namespace} cache entries: {str(e)}")
+    
+    def _queue_writes(self, namespace: str, changes: Dict[str, Any]):
+        """Mark keys dirty and make sure the background flusher is running."""
+        with self._pending_lock:
+            self._pending.setdefault(namespace, {}).update(changes)
+            pending_count = sum(len(keys) for keys in self._pending.values())
+            if self._flusher is None or not self._flusher.is_alive():
+                self._flusher = threading.Thread(target=self._flush_loop, name="cache-flusher", daemon=True)
+                self._flusher.start()
+        if pending_count >= self.flush_batch_size:
+            self._flush_requested.set()
     
-    def _is_cache_valid(self, timestamp: str, cache_hours: int) -> bool:
-        """Check if cache entry is still valid."""
+    def _flush_loop(self):
+        """Background thread persisting pending changes until none are left (failed batches are retried)."""
+        while True:
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            self.flush()
+            with self._pending_lock:
+                if not self._pending:
+                    self._flusher = None
+                    return
+    
+    def flush(self) -> int:
+        """Write all pending cache changes to the store now.
+        
+        Returns the number of keys written or deleted.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+                self._in_flight = pending
+            
+            written = 0
+            for namespace, changes in pending.items():
+                puts = {key: value for key, value in changes.items() if value is not self._DELETED}
+                deletes = [key for key, value in changes.items() if value is self._DELETED]
+                try:
+                    self.store.put_many(namespace, puts)
+                    self.store.delete(namespace, deletes)
+                    written += len(changes)
+                except Exception as e:
+                    logger.error(f"Could not flush {namespace} cache entries, will retry: {str(e)}")
+                    # Requeue the batch; changes made since the swap are newer and win
+                    with self._pending_lock:
+                        requeued = self._pending.setdefault(namespace, {})
+                        for key, value in changes.items():
+                            requeued.setdefault(key, value)
+            
+            with self._pending_lock:
+                self._in_flight = {}
+            if written:
+                logger.debug(f"Flushed {written} cache changes")
+            return written
+    
+    def _clear_namespace(self, namespace: str):
+        """Empty a cache, its pending changes and its store namespace."""
+        cache, _ = self._cache_for(namespace)
+        with self._flush_lock:
+            with self._pending_lock:
+                self._pending.pop(namespace, None)
+            cache.clear()
+            self._expiry_heap[namespace] = []
+            self._expires_at[namespace] = OrderedDict()
+            self._sizes[namespace] = {}
+            self._bytes[namespace] = 0
+            self.store.clear(namespace)
+    
+    def _expiry_epoch(self, timestamp: str, cache_hours: int) -> float:
+        """Epoch seconds at which an entry written at an ISO timestamp expires."""
         try:
-            cache_time = datetime.fromisoformat(timestamp)
-            expiry_time = cache_time + timedelta(hours=cache_hours)
-            return datetime.now() < expiry_time
+            expiry_time = datetime.fromisoformat(timestamp) + timedelta(hours=cache_hours)
+            return expiry_time.timestamp()
         except Exception as e:
             logger.warning(f"Could not check cache validity: {str(e)}")
-            return False
+            return 0.0
     
-    def _clean_expired_cache(self, cache: Dict, cache_hours: int) -> Dict:
-        """Remove expired entries from cache."""
-        cleaned_cache = {}
-        for key, value in cache.items():
-            if isinstance(value, dict) and 'timestamp' in value:
-                if self._is_cache_valid(value['timestamp'], cache_hours):
-                    cleaned_cache[key] = value
-            else:
-                # Keep entries without timestamp (legacy entries)
-                cleaned_cache[key] = value
-        
-        return cleaned_cache
+    def _clean_expired_cache(self, namespace: str):
+        """Remove expired entries from a cache, visiting only the expired ones."""
+        heap = self._expiry_heap[namespace]
+        expires = self._expires_at[namespace]
+        now = time.time()
+        expired = []
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            # Skip heap items made stale by a rewrite or deletion of the key
+            if expires.get(key) == expires_at:
+                expired.append(key)
+        if expired:
+            self._delete_entries(namespace, expired)
     
+    @_synchronized
     def cache_articles(self, articles: List[Dict]) -> List[Dict]:
         """Cache articles and return only new ones."""
         try:
             # Clean expired cache entries
-            self.articles_cache = self._clean_expired_cache(self.articles_cache, self.articles_cache_hours)
+            self._clean_expired_cache('articles')
             
             new_articles = []
             current_time = datetime.now().isoformat()
             
             for article in articles:
-                # Create cache key from article URL and title
-                cache_key = self._generate_cache_key({
-                    'url': article.get('url', ''),
-                    'title': article.get('title', '')
-                })
+                # Create cache key from normalized article URL and title
+                cache_key = article_cache_key(article)
                 
-                if cache_key not in self.articles_cache:
+                if cache_key not in self._expires_at['articles']:
                     # New article - add to cache and include in new articles
-                    self.articles_cache[cache_key] = {
+                    self._store_entry('articles', cache_key, {
                         'article': article,
                         'timestamp': current_time
-                    }
+                    })
                     new_articles.append(article)
                     logger.debug(f"Cached new article: {article.get('title', '')[:50]}...")
                 else:
+                    self._expires_at['articles'].move_to_end(cache_key)
                     logger.debug(f"Article already cached: {article.get('title', '')[:50]}...")
             
-            # Save updated cache
-            self._save_cache(self.articles_cache, self.articles_cache_file)
-            
             logger.info(f"Cached {len(new_articles)} new articles out of {len(articles)} total articles")
             return new_articles
             
@@ -134,22 +427,20 @@ class CacheManager:
             logger.error(f"Error caching articles: {str(e)}")
             return articles  # Return all articles if caching fails
     
+    @_synchronized
     def cache_stock_analysis(self, symbol: str, analysis_data: Dict) -> bool:
         """Cache stock analysis data."""
         try:
             # Clean expired cache entries
-            self.stocks_cache = self._clean_expired_cache(self.stocks_cache, self.stocks_cache_hours)
+            self._clean_expired_cache('stocks')
             
             cache_key = f"stock_{symbol.upper()}"
             current_time = datetime.now().isoformat()
             
-            self.stocks_cache[cache_key] = {
+            self._store_entry('stocks', cache_key, {
                 'analysis': analysis_data,
                 'timestamp': current_time
-            }
-            
-            # Save updated cache
-            self._save_cache(self.stocks_cache, self.stocks_cache_file)
+            })
             
             logger.info(f"Cached analysis for stock: {symbol}")
             return True
@@ -158,22 +449,22 @@ class CacheManager:
             logger.error(f"Error caching stock analysis for {symbol}: {str(e)}")
             return False
     
+    @_synchronized
     def get_cached_stock_analysis(self, symbol: str) -> Optional[Dict]:
         """Get cached stock analysis if available and valid."""
         try:
             cache_key = f"stock_{symbol.upper()}"
             
-            if cache_key in self.stocks_cache:
-                cache_entry = self.stocks_cache[cache_key]
+            cache_entry = self._get_entry('stocks', cache_key)
+            if cache_entry is not None:
                 
                 if isinstance(cache_entry, dict) and 'timestamp' in cache_entry:
-                    if self._is_cache_valid(cache_entry['timestamp'], self.stocks_cache_hours):
+                    if self._is_live('stocks', cache_key):
                         logger.info(f"Retrieved cached analysis for stock: {symbol}")
                         return cache_entry['analysis']
                     else:
                         # Remove expired entry
-                        del self.stocks_cache[cache_key]
-                        self._save_cache(self.stocks_cache, self.stocks_cache_file)
+                        self._delete_entries('stocks', [cache_key])
                         logger.info(f"Removed expired cache for stock: {symbol}")
                 else:
                     # Legacy entry without timestamp
@@ -186,21 +477,19 @@ class CacheManager:
             logger.error(f"Error retrieving cached stock analysis for {symbol}: {str(e)}")
             return None
     
+    @_synchronized
     def cache_groq_analysis(self, analysis_key: str, analysis_data: Dict) -> bool:
         """Cache Groq analysis data."""
         try:
             # Clean expired cache entries
-            self.analysis_cache = self._clean_expired_cache(self.analysis_cache, self.analysis_cache_hours)
+            self._clean_expired_cache('analysis')
             
             current_time = datetime.now().isoformat()
             
-            self.analysis_cache[analysis_key] = {
+            self._store_entry('analysis', analysis_key, {
                 'analysis': analysis_data,
                 'timestamp': current_time
-            }
-            
-            # Save updated cache
-            self._save_cache(self.analysis_cache, self.analysis_cache_file)
+            })
             
             logger.info(f"Cached Groq analysis: {analysis_key}")
             return True
@@ -209,20 +498,20 @@ class CacheManager:
             logger.error(f"Error caching Groq analysis {analysis_key}: {str(e)}")
             return False
     
+    @_synchronized
     def get_cached_groq_analysis(self, analysis_key: str) -> Optional[Dict]:
         """Get cached Groq analysis if available and valid."""
         try:
-            if analysis_key in self.analysis_cache:
-                cache_entry = self.analysis_cache[analysis_key]
+            cache_entry = self._get_entry('analysis', analysis_key)
+            if cache_entry is not None:
                 
                 if isinstance(cache_entry, dict) and 'timestamp' in cache_entry:
-                    if self._is_cache_valid(cache_entry['timestamp'], self.analysis_cache_hours):
+                    if self._is_live('analysis', analysis_key):
                         logger.info(f"Retrieved cached Groq analysis: {analysis_key}")
                         return cache_entry['analysis']
                     else:
                         # Remove expired entry
-                        del self.analysis_cache[analysis_key]
-                        self._save_cache(self.analysis_cache, self.analysis_cache_file)
+                        self._delete_entries('analysis', [analysis_key])
                         logger.info(f"Removed expired Groq cache: {analysis_key}")
                 else:
                     # Legacy entry without timestamp
@@ -235,14 +524,20 @@ class CacheManager:
             logger.error(f"Error retrieving cached Groq analysis {analysis_key}: {str(e)}")
             return None
     
-    def is_stock_in_watchlist(self, symbol: str, watchlist: List[Dict]) -> bool:
-        """Check if stock is already in watchlist."""
+    def build_watchlist_index(self, watchlist: Iterable) -> Set[str]:
+        """Set of upper-cased watchlist symbols to reuse across many lookups."""
+        return symbol_index(watchlist)
+    
+    def is_stock_in_watchlist(self, symbol: str, watchlist: Iterable) -> bool:
+        """Check if stock is already in watchlist.
+        
+        ``watchlist`` is the list of watchlist items or an index from
+        ``build_watchlist_index``; only the index makes the check O(1).
+        """
         try:
-            symbol_upper = symbol.upper()
-            for item in watchlist:
-                if item.get('symbol', '').upper() == symbol_upper:
-                    return True
-            return False
+            if not isinstance(watchlist, (set, frozenset)):
+                watchlist = symbol_index(watchlist)
+            return symbol.upper() in watchlist
         except Exception as e:
             logger.error(f"Error checking watchlist for {symbol}: {str(e)}")
             return False
@@ -252,11 +547,12 @@ class CacheManager:
         """Filter out stocks already in watchlist unless there's very negative news."""
         try:
             filtered_stocks = []
+            watchlist_index = symbol_index(watchlist)
             
             for stock in stocks:
                 symbol = stock.get('symbol', '')
                 
-                if not self.is_stock_in_watchlist(symbol, watchlist):
+                if not self.is_stock_in_watchlist(symbol, watchlist_index):
                     # Stock not in watchlist - include it
                     filtered_stocks.append(stock)
                 elif allow_negative_news:
@@ -283,51 +579,60 @@ class CacheManager:
             logger.error(f"Error filtering watchlist stocks: {str(e)}")
             return stocks  # Return all stocks if filtering fails
     
+    @_synchronized
     def get_cache_stats(self) -> Dict:
         """Get cache statistics."""
         try:
             # Clean all caches first
-            self.articles_cache = self._clean_expired_cache(self.articles_cache, self.articles_cache_hours)
-            self.stocks_cache = self._clean_expired_cache(self.stocks_cache, self.stocks_cache_hours)
-            self.analysis_cache = self._clean_expired_cache(self.analysis_cache, self.analysis_cache_hours)
-            self.recommendations_cache = self._clean_expired_cache(self.recommendations_cache, self.recommendations_cache_hours)
+            for namespace in self.NAMESPACES:
+                self._clean_expired_cache(namespace)
             
             # Count recommendation changes
             changes_count = 0
-            for cache_entry in self.recommendations_cache.values():
+            for _, cache_entry in self._all_entries('recommendations'):
                 if isinstance(cache_entry, dict) and 'recommendation' in cache_entry:
                     if cache_entry['recommendation'].get('change_detected', False):
                         changes_count += 1
             
             return {
-                'articles': len(self.articles_cache),
-                'stocks': len(self.stocks_cache),
-                'analysis': len(self.analysis_cache),
-                'recommendations': len(self.recommendations_cache),
+                'articles': len(self._expires_at['articles']),
+                'stocks': len(self._expires_at['stocks']),
+                'analysis': len(self._expires_at['analysis']),
+                'recommendations': len(self._expires_at['recommendations']),
                 'recommendation_changes': changes_count,
                 'articles_cache_hours': self.articles_cache_hours,
                 'stocks_cache_hours': self.stocks_cache_hours,
                 'analysis_cache_hours': self.analysis_cache_hours,
                 'recommendations_cache_hours': self.recommendations_cache_hours,
+                'cache_bytes': sum(self._bytes.values()),
+                'evictions': self.evictions,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'memory_entries': sum(len(self._cache_for(namespace)[0]) for namespace in self.NAMESPACES),
+                'memory_hits': self.memory_hits,
+                'memory_misses': self.memory_misses,
+                'disk_hits': self.disk_hits,
+                'disk_misses': self.disk_misses,
                 'cache_dir': self.cache_dir
             }
         except Exception as e:
             logger.error(f"Error getting cache stats: {str(e)}")
             return {}
     
+    @_synchronized
     def cache_recommendation(self, symbol: str, recommendation: Dict) -> Dict:
         """Cache recommendation and detect changes."""
         try:
             # Clean expired cache entries
-            self.recommendations_cache = self._clean_expired_cache(self.recommendations_cache, self.recommendations_cache_hours)
+            self._clean_expired_cache('recommendations')
             
             cache_key = f"rec_{symbol.upper()}"
             current_time = datetime.now().isoformat()
             
             # Check if we have a previous recommendation
             previous_rec = None
-            if cache_key in self.recommendations_cache:
-                cache_entry = self.recommendations_cache[cache_key]
+            cache_entry = self._get_entry('recommendations', cache_key)
+            if cache_entry is not None:
                 if isinstance(cache_entry, dict) and 'recommendation' in cache_entry:
                     previous_rec = cache_entry['recommendation']
             
@@ -389,14 +694,11 @@ class CacheManager:
             recommendation['last_updated'] = current_time
             
             # Cache the recommendation
-            self.recommendations_cache[cache_key] = {
+            self._store_entry('recommendations', cache_key, {
                 'recommendation': recommendation,
                 'timestamp': current_time,
                 'change_history': self._get_change_history(cache_key, change_detected, change_type, change_details)
-            }
-            
-            # Save updated cache
-            self._save_cache(self.recommendations_cache, self.recommendations_cache_file)
+            })
             
             if change_detected:
                 logger.info(f"Recommendation change detected for {symbol}: {change_type}")
@@ -409,22 +711,22 @@ class CacheManager:
             logger.error(f"Error caching recommendation for {symbol}: {str(e)}")
             return recommendation
     
+    @_synchronized
     def get_cached_recommendation(self, symbol: str) -> Optional[Dict]:
         """Get cached recommendation if available and valid."""
         try:
             cache_key = f"rec_{symbol.upper()}"
             
-            if cache_key in self.recommendations_cache:
-                cache_entry = self.recommendations_cache[cache_key]
+            cache_entry = self._get_entry('recommendations', cache_key)
+            if cache_entry is not None:
                 
                 if isinstance(cache_entry, dict) and 'timestamp' in cache_entry:
-                    if self._is_cache_valid(cache_entry['timestamp'], self.recommendations_cache_hours):
+                    if self._is_live('recommendations', cache_key):
                         logger.info(f"Retrieved cached recommendation for {symbol}")
                         return cache_entry['recommendation']
                     else:
                         # Remove expired entry
-                        del self.recommendations_cache[cache_key]
-                        self._save_cache(self.recommendations_cache, self.recommendations_cache_file)
+                        self._delete_entries('recommendations', [cache_key])
                         logger.info(f"Removed expired recommendation cache for {symbol}")
                 else:
                     # Legacy entry without timestamp
@@ -440,8 +742,8 @@ class CacheManager:
     def _get_change_history(self, cache_key: str, change_detected: bool, change_type: str, change_details: Dict) -> List[Dict]:
         """Get or create change history for a stock."""
         try:
-            if cache_key in self.recommendations_cache:
-                existing_entry = self.recommendations_cache[cache_key]
+            existing_entry = self._get_entry('recommendations', cache_key)
+            if existing_entry is not None:
                 if isinstance(existing_entry, dict) and 'change_history' in existing_entry:
                     change_history = existing_entry['change_history']
                 else:
@@ -493,12 +795,13 @@ class CacheManager:
             logger.error(f"Error checking relevance for {symbol}: {str(e)}")
             return False
     
+    @_synchronized
     def get_recommendation_changes(self, symbol: str = None) -> Dict:
         """Get all recommendation changes or changes for a specific symbol."""
         try:
             changes = {}
             
-            for cache_key, cache_entry in self.recommendations_cache.items():
+            for cache_key, cache_entry in self._all_entries('recommendations'):
                 if isinstance(cache_entry, dict) and 'recommendation' in cache_entry:
                     rec = cache_entry['recommendation']
                     stock_symbol = cache_key.replace('rec_', '')
@@ -518,6 +821,7 @@ class CacheManager:
             logger.error(f"Error getting recommendation changes: {str(e)}")
             return {}
     
+    @_synchronized
     def clear_cache(self, cache_type: str = 'safe'):
         """Clear cache entries. Default 'safe' mode only clears news and analysis cache."""
         try:
@@ -528,27 +832,23 @@ class CacheManager:
                 cache_type = 'news_analysis'
             
             if cache_type in ['all', 'news_analysis', 'articles']:
-                self.articles_cache = {}
-                self._save_cache(self.articles_cache, self.articles_cache_file)
+                self._clear_namespace('articles')
                 cleared_items.append("articles")
                 logger.info("Cleared articles cache")
             
             if cache_type in ['all', 'news_analysis', 'stocks']:
-                self.stocks_cache = {}
-                self._save_cache(self.stocks_cache, self.stocks_cache_file)
+                self._clear_namespace('stocks')
                 cleared_items.append("stocks")
                 logger.info("Cleared stocks cache")
             
             if cache_type in ['all', 'news_analysis', 'analysis']:
-                self.analysis_cache = {}
-                self._save_cache(self.analysis_cache, self.analysis_cache_file)
+                self._clear_namespace('analysis')
                 cleared_items.append("analysis")
                 logger.info("Cleared analysis cache")
             
             # Only clear recommendations if explicitly requested
             if cache_type in ['all', 'recommendations']:
-                self.recommendations_cache = {}
-                self._save_cache(self.recommendations_cache, self.recommendations_cache_file)
+                self._clear_namespace('recommendations')
                 cleared_items.append("recommendations")
                 logger.info("Cleared recommendations cache")
             
@@ -598,3 +898,14 @@ class CacheManager:
                     
         except Exception as e:
             logger.error(f"Error clearing additional cache files: {str(e)}")
+
+_cache_manager: Optional[CacheManager] = None
+_cache_manager_lock = threading.Lock()
+
+def get_cache_manager() -> CacheManager:
+    """Get the cache manager shared by every session in this process."""
+    global _cache_manager
+    with _cache_manager_lock:
+        if _cache_manager is None:
+            _cache_manager = CacheManager()
+        return _cache_manager
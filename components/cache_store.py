@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Cache Store Component
+Embedded SQLite key-value store with per-key writes for the cache manager.
+"""
+
+import os
+import pickle
+import sqlite3
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+class CacheStore:
+    """Namespaced key-value store backed by one SQLite database file.
+    
+    Each logical cache (articles, stocks, ...) is a namespace. Values are pickled
+    and written per key inside a transaction, so updating one entry no longer
+    rewrites the whole cache and an interrupted write leaves the previous state
+    intact. The database runs in WAL mode for cheap commits; reads use a second
+    connection so they do not wait for a write in progress.
+    """
+    
+    def __init__(self, db_file: str = os.path.join("cache", "cache_store.db")):
+        """Initialize cache store."""
+        self.db_file = db_file
+        db_dir = os.path.dirname(db_file)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value BLOB NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key)"
+            ") WITHOUT ROWID"
+        )
+        self._read_lock = threading.Lock()
+        self._read_conn = sqlite3.connect(db_file, check_same_thread=False, isolation_level=None)
+        logger.info(f"Cache Store opened at {db_file}")
+    
+    def load(self, namespace: str) -> Dict[str, Any]:
+        """All entries of a namespace; unreadable values are skipped."""
+        with self._read_lock:
+            rows = self._read_conn.execute("SELECT key, value FROM entries WHERE namespace = ?", (namespace,)).fetchall()
+        
+        entries = {}
+        for key, value in rows:
+            try:
+                entries[key] = pickle.loads(value)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable cache entry {namespace}/{key}: {str(e)}")
+        return entries
+    
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """One entry, None if missing."""
+        with self._read_lock:
+            row = self._read_conn.execute("SELECT value FROM entries WHERE namespace = ? AND key = ?",
+                                          (namespace, key)).fetchone()
+        return pickle.loads(row[0]) if row else None
+    
+    def put(self, namespace: str, key: str, value: Any):
+        """Insert or replace one entry."""
+        self.put_many(namespace, {key: value})
+    
+    def put_many(self, namespace: str, items: Dict[str, Any]):
+        """Insert or replace several entries in one transaction."""
+        if not items:
+            return
+        now = time.time()
+        rows = [(namespace, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), now)
+                for key, value in items.items()]
+        with self._lock:
+            with self._transaction():
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries (namespace, key, value, updated_at) VALUES (?, ?, ?, ?)", rows
+                )
+    
+    def delete(self, namespace: str, keys: Iterable[str]):
+        """Delete entries by key in one transaction."""
+        rows = [(namespace, key) for key in keys]
+        if not rows:
+            return
+        with self._lock:
+            with self._transaction():
+                self._conn.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", rows)
+    
+    def clear(self, namespace: Optional[str] = None):
+        """Delete every entry of a namespace, or of all namespaces."""
+        with self._lock:
+            with self._transaction():
+                if namespace is None:
+                    self._conn.execute("DELETE FROM entries")
+                else:
+                    self._conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+    
+    def sizes(self, namespace: str) -> Dict[str, int]:
+        """Stored (pickled) size in bytes of every entry of a namespace."""
+        with self._read_lock:
+            rows = self._read_conn.execute("SELECT key, length(value) FROM entries WHERE namespace = ?", (namespace,)).fetchall()
+        return dict(rows)
+    
+    def count(self, namespace: str) -> int:
+        """Number of entries in a namespace."""
+        with self._read_lock:
+            return self._read_conn.execute("SELECT COUNT(*) FROM entries WHERE namespace = ?", (namespace,)).fetchone()[0]
+    
+    @contextmanager
+    def _transaction(self):
+        """Commit the block's statements together, rolling back on error (lock must be held)."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+    
+    def import_pickle(self, namespace: str, pickle_file: str) -> int:
+        """Import a whole-dict pickle written by earlier versions into an empty namespace.
+        
+        The pickle is renamed to ``<file>.migrated`` afterwards. Returns the number
+        of imported entries.
+        """
+        if not os.path.exists(pickle_file) or self.count(namespace) > 0:
+            return 0
+        try:
+            with open(pickle_file, 'rb') as f:
+                legacy = pickle.load(f)
+            if isinstance(legacy, dict):
+                self.put_many(namespace, {str(key): value for key, value in legacy.items()})
+            os.replace(pickle_file, f"{pickle_file}.migrated")
+            logger.info(f"Imported {len(legacy)} entries from {pickle_file} into cache store")
+            return len(legacy)
+        except Exception as e:
+            logger.warning(f"Could not import legacy cache {pickle_file}: {str(e)}")
+            return 0
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock, self._read_lock:
+            self._conn.close()
+            self._read_conn.close()
@@ -4,65 +4,91 @@ Equity Loader Component
 Loads stock symbols from EQUITY.csv file for analysis and filtering.
 """
 
-import pandas as pd
 import logging
 import os
-from typing import List, Dict, Set
+import threading
+import numpy as np
+from typing import List, Dict, Optional, Set
+from components.symbol_registry import SymbolRegistry, get_symbol_registry
+from components.stock_search_index import StockSearchIndex
+from components.liquidity_ranker import get_liquidity_ranker
 
 logger = logging.getLogger(__name__)
 
 class EquityLoader:
-    """Loads and manages stock symbols from EQUITY.csv file."""
+    """Loads and manages stock symbols from EQUITY.csv file.
+    
+    Equity-series rows are kept column-wise (one array per EQUITY.csv field) with a
+    symbol -> row index; per-symbol dicts are only built when asked for.
+    """
     
     def __init__(self, equity_file: str = "EQUITY.csv"):
         """Initialize equity loader."""
         self.equity_file = equity_file
         self.stock_symbols = set()
-        self.stock_data = {}
+        self.columns: Dict[str, np.ndarray] = {}
+        self.row_index: Dict[str, int] = {}
+        self.source_stamp = None
+        self._registry: Optional[SymbolRegistry] = None
+        self._search_index: Optional[StockSearchIndex] = None
         self.load_equity_data()
         logger.info(f"EquityLoader initialized with {len(self.stock_symbols)} stocks")
     
+    def _get_registry(self) -> SymbolRegistry:
+        """Symbol registry for this loader's EQUITY.csv (the shared one for the default file)."""
+        if os.path.abspath(self.equity_file) == os.path.abspath(get_symbol_registry().equity_file):
+            return get_symbol_registry()
+        if self._registry is None or self._registry.is_stale():
+            self._registry = SymbolRegistry(self.equity_file)
+        return self._registry
+    
     def load_equity_data(self):
-        """Load stock symbols and data from EQUITY.csv file."""
+        """Load stock symbols and data from the EQUITY.csv symbol registry."""
         try:
             if not os.path.exists(self.equity_file):
                 logger.error(f"EQUITY.csv file not found at {self.equity_file}")
                 return
             
-            # Read the CSV file
-            df = pd.read_csv(self.equity_file)
+            registry = self._get_registry()
             
-            # Extract stock symbols and company names
-            for _, row in df.iterrows():
-                symbol = row.get('SYMBOL', '').strip()
-                company_name = row.get('NAME OF COMPANY', '').strip()
-                series = row.get(' SERIES', '').strip()
-                
-                if symbol and series == 'EQ':  # Only include equity series
-                    self.stock_symbols.add(symbol)
-                    self.stock_data[symbol] = {
-                        'symbol': symbol,
-                        'company_name': company_name,
-                        'series': series,
-                        'date_of_listing': row.get(' DATE OF LISTING', ''),
-                        'paid_up_value': row.get(' PAID UP VALUE', ''),
-                        'market_lot': row.get(' MARKET LOT', ''),
-                        'isin_number': row.get(' ISIN NUMBER', ''),
-                        'face_value': row.get(' FACE VALUE', '')
-                    }
+            # Only include equity series, selected with one mask over the registry columns
+            equity_rows = np.flatnonzero(np.asarray(registry.columns['series'], dtype=object) == 'EQ')
+            self.columns = {field: np.asarray(values, dtype=object)[equity_rows]
+                            for field, values in registry.columns.items()}
             
-            logger.info(f"Loaded {len(self.stock_symbols)} equity stocks from {self.equity_file}")
+            symbols = self.columns['symbol']
+            self.row_index = dict(zip(symbols, range(len(symbols))))
+            self.stock_symbols = set(symbols)
+            self.source_stamp = registry.source_stamp
+            self._search_index = None
             
+            logger.info(f"Loaded {len(self.stock_symbols)} equity stocks from {self.equity_file}")
+        
         except Exception as e:
             logger.error(f"Error loading equity data: {str(e)}")
     
+    def refresh_if_changed(self) -> bool:
+        """Reload when EQUITY.csv has been modified since the last load."""
+        if self._get_registry().source_stamp != self.source_stamp:
+            self.load_equity_data()
+            return True
+        return False
+    
+    @property
+    def stock_data(self) -> Dict[str, Dict]:
+        """Symbol -> EQUITY.csv fields for every equity stock."""
+        return {symbol: self.get_stock_data(symbol) for symbol in self.row_index}
+    
     def get_stock_symbols(self) -> Set[str]:
         """Get all stock symbols."""
         return self.stock_symbols.copy()
     
     def get_stock_data(self, symbol: str) -> Dict:
         """Get data for a specific stock symbol."""
-        return self.stock_data.get(symbol, {})
+        row = self.row_index.get(symbol)
+        if row is None:
+            return {}
+        return {field: values[row] for field, values in self.columns.items()}
     
     def get_company_name(self, symbol: str) -> str:
         """Get company name for a stock symbol."""
@@ -86,24 +112,56 @@ class EquityLoader:
         return valid_symbols
     
     def get_top_stocks(self, limit: int = 100) -> List[str]:
-        """Get top N stocks by market cap or other criteria."""
-        # For now, return first N stocks alphabetically
-        # In a real implementation, you might want to sort by market cap
-        sorted_symbols = sorted(list(self.stock_symbols))
-        return sorted_symbols[:limit]
+        """Get top N stocks by average traded value and market cap.
+        
+        Ranks come from the locally cached bars and fundamentals; stocks with no
+        cached data yet follow in alphabetical order.
+        """
+        try:
+            return get_liquidity_ranker().rank(self.stock_symbols, limit)
+        except Exception as e:
+            logger.error(f"Error ranking stocks by liquidity: {str(e)}")
+            return sorted(self.stock_symbols)[:limit]
+    
+    def _get_search_index(self) -> StockSearchIndex:
+        """Search index over the loaded stocks, built on first use."""
+        if self._search_index is None:
+            self._search_index = StockSearchIndex(zip(self.columns.get('symbol', []), self.columns.get('company_name', [])))
+        return self._search_index
     
     def search_stocks(self, query: str) -> List[Dict]:
         """Search stocks by symbol or company name."""
-        results = []
-        query_lower = query.lower()
-        
-        for symbol, data in self.stock_data.items():
-            if (query_lower in symbol.lower() or 
-                query_lower in data.get('company_name', '').lower()):
-                results.append(data)
+        index = self._get_search_index()
+        return [self.get_stock_data(index.symbols[row]) for row in index.substring_matches(query)]
+    
+    def search_top_k(self, query: str, limit: int = 10) -> List[Dict]:
+        """Ranked top matches for a partially typed symbol or company name.
         
-        return results
+        Exact symbols rank first, then symbol prefixes, company-name prefixes,
+        substrings and finally typo-tolerant matches.
+        """
+        try:
+            return self._get_search_index().search(query, limit)
+        except Exception as e:
+            logger.error(f"Error searching stocks for '{query}': {str(e)}")
+            return []
     
     def get_stock_count(self) -> int:
         """Get total number of stocks."""
         return len(self.stock_symbols)
+
+_equity_loader: Optional[EquityLoader] = None
+_equity_loader_lock = threading.Lock()
+
+def get_equity_loader() -> EquityLoader:
+    """Get the equity loader shared by every component in this process.
+    
+    The loader is reloaded in place when EQUITY.csv has been modified.
+    """
+    global _equity_loader
+    with _equity_loader_lock:
+        if _equity_loader is None:
+            _equity_loader = EquityLoader()
+        else:
+            _equity_loader.refresh_if_changed()
+        return _equity_loader
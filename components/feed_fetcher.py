@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Feed Fetcher Component
+Concurrent RSS feed fetching with conditional GET and a persistent feed cache.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import logging
+import threading
+import time
+import requests
+import feedparser
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class FeedFetcher:
+    """Fetches many RSS feeds at once over a shared connection pool.
+    
+    Every feed is requested concurrently from an asyncio event loop with its own
+    timeout. The ETag / Last-Modified validators of each response are kept, so a
+    feed that has not changed answers 304 and its previously parsed entries are
+    reused without downloading or parsing it again.
+    """
+    
+    ENTRY_FIELDS = ('title', 'summary', 'link', 'published')
+    
+    def __init__(self, cache_file: str = os.path.join("cache", "feed_cache.json"),
+                 timeout: float = 10.0, max_connections: int = 8):
+        """Initialize feed fetcher.
+        
+        Args:
+            cache_file: JSON file holding validators and parsed entries per feed
+            timeout: Per-feed timeout in seconds
+            max_connections: Size of the shared connection pool
+        """
+        self.cache_file = cache_file
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix='feed')
+        
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'application/rss+xml, application/xml;q=0.9, */*;q=0.8'
+        })
+        retry_strategy = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET"]
+        )
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections, max_retries=retry_strategy)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        cache_dir = os.path.dirname(cache_file)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.feeds = self._load_cache()
+        
+        self.stats = {'downloaded': 0, 'not_modified': 0, 'unchanged': 0, 'failed': 0}
+        logger.info(f"Feed Fetcher initialized with {len(self.feeds)} cached feeds")
+    
+    def _load_cache(self) -> Dict:
+        """Load cached feeds from file."""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load feed cache from {self.cache_file}: {str(e)}")
+        return {}
+    
+    def _save_cache(self):
+        """Save cached feeds to file atomically (lock must be held)."""
+        try:
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, 'w') as f:
+                json.dump(self.feeds, f)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            logger.error(f"Could not save feed cache to {self.cache_file}: {str(e)}")
+    
+    def _fetch_feed(self, url: str) -> List[Dict]:
+        """Fetch and parse one feed, reusing cached entries when it is unchanged."""
+        with self._lock:
+            cached = dict(self.feeds.get(url, {}))
+        
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        
+        if response.status_code == 304 and 'entries' in cached:
+            with self._lock:
+                self.stats['not_modified'] += 1
+            logger.debug(f"Feed not modified: {url}")
+            return cached['entries']
+        
+        response.raise_for_status()
+        
+        # Servers that ignore validators still often return identical bytes
+        content_hash = hashlib.md5(response.content).hexdigest()
+        unchanged = content_hash == cached.get('content_hash') and 'entries' in cached
+        if unchanged:
+            entries = cached['entries']
+        else:
+            feed = feedparser.parse(response.content)
+            entries = [{field: entry.get(field, '') for field in self.ENTRY_FIELDS} for entry in feed.entries]
+        
+        with self._lock:
+            self.stats['unchanged' if unchanged else 'downloaded'] += 1
+            self.feeds[url] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'content_hash': content_hash,
+                'entries': entries,
+                'fetched_at': time.time()
+            }
+        return entries
+    
+    async def _fetch_all_async(self, urls: List[str]) -> Dict[str, Optional[List[Dict]]]:
+        """Fetch every feed concurrently, each bounded by the per-feed timeout."""
+        loop = asyncio.get_running_loop()
+        tasks = [
+            asyncio.wait_for(loop.run_in_executor(self._executor, self._fetch_feed, url), timeout=self.timeout)
+            for url in urls
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        feeds = {}
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                self.stats['failed'] += 1
+                reason = 'timed out' if isinstance(result, asyncio.TimeoutError) else str(result)
+                logger.warning(f"Error fetching from {url}: {reason}")
+                feeds[url] = None
+            else:
+                feeds[url] = result
+        return feeds
+    
+    def fetch_all(self, urls: List[str]) -> Dict[str, Optional[List[Dict]]]:
+        """Fetch many feeds concurrently.
+        
+        Returns a dict of url -> list of entry dicts (title, summary, link, published),
+        or None for feeds that failed or timed out.
+        """
+        try:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                feeds = asyncio.run(self._fetch_all_async(urls))
+            else:
+                # Called from inside a running event loop: run ours on a separate thread
+                with ThreadPoolExecutor(max_workers=1) as runner:
+                    feeds = runner.submit(asyncio.run, self._fetch_all_async(urls)).result()
+            
+            with self._lock:
+                self._save_cache()
+            
+            fetched = sum(1 for entries in feeds.values() if entries is not None)
+            logger.info(f"Fetched {fetched}/{len(urls)} feeds ({self.stats['not_modified']} not modified so far)")
+            return feeds
+        
+        except Exception as e:
+            logger.error(f"Error fetching feeds: {str(e)}")
+            return {url: None for url in urls}
+    
+    def get_stats(self) -> Dict:
+        """Get fetcher statistics."""
+        return dict(self.stats, cached_feeds=len(self.feeds))
+
+_feed_fetcher: Optional[FeedFetcher] = None
+_feed_fetcher_lock = threading.Lock()
+
+def get_feed_fetcher() -> FeedFetcher:
+    """Get the feed fetcher shared by every news analyzer in this process."""
+    global _feed_fetcher
+    with _feed_fetcher_lock:
+        if _feed_fetcher is None:
+            _feed_fetcher = FeedFetcher()
+        return _feed_fetcher
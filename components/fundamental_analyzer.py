@@ -10,7 +10,11 @@ import numpy as np
 import logging
 import time
 import random
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from components.rate_limiter import get_yahoo_rate_limiter
+from components.fundamentals_cache import get_fundamentals_cache
+from components.liveness_registry import get_liveness_registry
 
 logger = logging.getLogger(__name__)
 
@@ -18,28 +22,32 @@ class FundamentalAnalyzer:
     """Fundamental analysis for stocks."""
     
     def __init__(self):
-        self.request_delay = 1.5  # Base delay between requests (longer than technical)
         self.max_retries = 3
-        self.last_request_time = 0
+        self.rate_limiter = get_yahoo_rate_limiter()
+        self.fundamentals_cache = get_fundamentals_cache()
+        self.liveness_registry = get_liveness_registry()
         logger.info("Fundamental Analyzer initialized")
     
     def _fetch_financial_data_with_retry(self, symbol: str, max_retries: int = 3) -> Optional[Dict]:
         """Fetch financial data with retry logic for rate limiting."""
+        cached_info = self.fundamentals_cache.get_info(symbol)
+        if cached_info:
+            logger.debug(f"Using cached financial info for {symbol}")
+            return cached_info
+        
+        if self.liveness_registry.is_delisted(symbol):
+            logger.info(f"Skipping financial data for {symbol}: marked as delisted")
+            return None
+        
         for attempt in range(max_retries):
             try:
-                # Add delay to prevent rate limiting
-                current_time = time.time()
-                time_since_last_request = current_time - self.last_request_time
-                if time_since_last_request < self.request_delay:
-                    sleep_time = self.request_delay - time_since_last_request + random.uniform(0, 0.5)
-                    logger.debug(f"Rate limiting delay: {sleep_time:.2f}s")
-                    time.sleep(sleep_time)
-                
-                self.last_request_time = time.time()
+                # Wait for budget on the shared Yahoo Finance limiter
+                self.rate_limiter.acquire()
                 
                 # Fetch financial data
                 ticker = yf.Ticker(symbol)
                 info = ticker.info
+                self.rate_limiter.report_success()
                 
                 if not info or len(info) < 5:  # Basic check for valid data
                     if attempt < max_retries - 1:
@@ -51,21 +59,24 @@ class FundamentalAnalyzer:
                         logger.error(f"No financial data available for {symbol} after {max_retries} attempts")
                         return None
                 
+                self.fundamentals_cache.set_info(symbol, info)
                 return info
                 
             except Exception as e:
                 error_msg = str(e).lower()
-                if 'rate limited' in error_msg or 'too many requests' in error_msg:
+                if self.rate_limiter.is_throttle_error(e):
+                    # The limiter pauses every caller, the next acquire() waits out the cooldown
+                    self.rate_limiter.report_throttled()
                     if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt) + random.uniform(1, 3)
-                        logger.warning(f"Rate limited for {symbol}, waiting {wait_time:.1f}s before retry {attempt + 1}/{max_retries}")
-                        time.sleep(wait_time)
+                        logger.warning(f"Rate limited for {symbol}, retry {attempt + 1}/{max_retries} after limiter backoff")
                         continue
                     else:
                         logger.error(f"Rate limited for {symbol} after {max_retries} attempts")
                         return None
                 elif 'delisted' in error_msg or 'no price data' in error_msg:
                     logger.warning(f"Stock {symbol} appears to be delisted or has no financial data")
+                    if 'delisted' in error_msg:
+                        self.liveness_registry.mark_delisted(symbol, str(e))
                     return None
                 else:
                     if attempt < max_retries - 1:
@@ -79,15 +90,36 @@ class FundamentalAnalyzer:
         
         return None
     
+    def _limited_call(self, fetch: Callable[[], Any]) -> Any:
+        """Run one Yahoo Finance request under the shared limiter and report its outcome."""
+        self.rate_limiter.acquire()
+        try:
+            result = fetch()
+        except Exception as e:
+            if self.rate_limiter.is_throttle_error(e):
+                self.rate_limiter.report_throttled()
+            raise
+        self.rate_limiter.report_success()
+        return result
+    
     def is_stock_valid(self, symbol: str) -> bool:
-        """Check if a stock is valid and has data available with multiple validation checks."""
+        """Check if a stock is valid and has data available with multiple validation checks.
+        
+        Symbols seen by a recent data fetch are answered from the liveness registry;
+        only unknown symbols are probed against Yahoo Finance.
+        """
+        status = self.liveness_registry.get_status(symbol)
+        if status != 'unknown':
+            logger.debug(f"Stock {symbol} liveness from registry: {status}")
+            return status == 'live'
+        
         try:
             # Multiple validation checks to prevent false positives
             ticker = yf.Ticker(symbol)
             
             # Check 1: Try to get basic info first
             try:
-                info = ticker.info
+                info = self._limited_call(lambda: ticker.info)
                 if info and len(info) > 5:
                     # If we have basic info, the stock likely exists
                     logger.debug(f"Stock {symbol} has basic info available")
@@ -100,7 +132,7 @@ class FundamentalAnalyzer:
             
             for period in periods_to_try:
                 try:
-                    hist = ticker.history(period=period)
+                    hist = self._limited_call(lambda: ticker.history(period=period))
                     if not hist.empty and len(hist) > 0:
                         logger.debug(f"Stock {symbol} has price data for period {period}")
                         break
@@ -112,7 +144,7 @@ class FundamentalAnalyzer:
             if hist is None or hist.empty:
                 try:
                     # Try to get current price
-                    current_price = ticker.history(period='1d', interval='1m')
+                    current_price = self._limited_call(lambda: ticker.history(period='1d', interval='1m'))
                     if not current_price.empty:
                         logger.debug(f"Stock {symbol} has current price data")
                         return True
@@ -123,6 +155,7 @@ class FundamentalAnalyzer:
             if hist is not None and not hist.empty:
                 # Check if we have recent data (within last 30 days)
                 latest_date = hist.index[-1]
+                self.liveness_registry.record_trading(symbol, latest_date)
                 # Handle timezone-aware vs timezone-naive datetime comparison
                 now = pd.Timestamp.now()
                 if latest_date.tz is not None and now.tz is None:
@@ -148,7 +181,7 @@ class FundamentalAnalyzer:
             # Check 5: If all else fails, try a different approach
             try:
                 # Try to get just the ticker info without price data
-                ticker_info = ticker.info
+                ticker_info = self._limited_call(lambda: ticker.info)
                 if ticker_info and 'symbol' in ticker_info:
                     logger.debug(f"Stock {symbol} exists but has no recent price data")
                     return True
@@ -173,6 +206,7 @@ class FundamentalAnalyzer:
             
             if any(indicator in error_msg for indicator in delisted_indicators):
                 logger.warning(f"Stock {symbol} appears to be delisted: {str(e)}")
+                self.liveness_registry.mark_delisted(symbol, str(e))
                 return False
             else:
                 # For other errors, don't assume delisted - might be temporary
@@ -189,12 +223,11 @@ class FundamentalAnalyzer:
                 logger.warning(f"No financial data available for {symbol}")
                 return None
             
-            # Get financial statements (with additional delay)
-            time.sleep(0.5)  # Additional delay for financial statements
-            ticker = yf.Ticker(symbol)
-            financials = ticker.financials
-            balance_sheet = ticker.balance_sheet
-            cashflow = ticker.cashflow
+            # Get financial statements (cached until the next reporting date)
+            statements = self._get_financial_statements(symbol, info)
+            financials = statements['financials']
+            balance_sheet = statements['balance_sheet']
+            cashflow = statements['cashflow']
             
             # Check if we have any financial data
             has_financial_data = not financials.empty or not balance_sheet.empty
@@ -340,6 +373,54 @@ class FundamentalAnalyzer:
             logger.error(f"Error getting financial data for {symbol}: {str(e)}")
             return None
     
+    def _get_financial_statements(self, symbol: str, info: Optional[Dict] = None) -> Dict[str, pd.DataFrame]:
+        """Get financials, balance sheet and cash flow, from cache when still current."""
+        statements = self.fundamentals_cache.get_statements(symbol)
+        if statements is not None:
+            logger.debug(f"Using cached financial statements for {symbol}")
+            return statements
+        
+        # Each statement is a separate Yahoo request
+        ticker = yf.Ticker(symbol)
+        financials = self._limited_call(lambda: ticker.financials)
+        balance_sheet = self._limited_call(lambda: ticker.balance_sheet)
+        cashflow = self._limited_call(lambda: ticker.cashflow)
+        
+        statements = {
+            'financials': financials,
+            'balance_sheet': balance_sheet,
+            'cashflow': cashflow
+        }
+        self.fundamentals_cache.set_statements(symbol, statements, info)
+        return statements
+    
+    def warm_up_cache(self, symbols: List[str], max_workers: int = 4) -> int:
+        """Pre-fetch info and statements for symbols not already cached.
+        
+        Requests go through the shared rate limiter, so several workers only help
+        while there is budget. Returns the number of symbols fetched.
+        """
+        pending = [symbol for symbol in dict.fromkeys(symbols) if symbol and not self.fundamentals_cache.is_warm(symbol)]
+        if not pending:
+            return 0
+        
+        def warm(symbol: str) -> bool:
+            try:
+                info = self._fetch_financial_data_with_retry(symbol)
+                if not info:
+                    return False
+                self._get_financial_statements(symbol, info)
+                return True
+            except Exception as e:
+                logger.warning(f"Could not warm fundamentals cache for {symbol}: {str(e)}")
+                return False
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            warmed = sum(1 for ok in executor.map(warm, pending) if ok)
+        
+        logger.info(f"Warmed fundamentals cache for {warmed}/{len(pending)} symbols")
+        return warmed
+    
     def _get_market_cap(self, info: Dict) -> Optional[float]:
         """Get market cap with fallback calculation. Returns None if data not available."""
         try:
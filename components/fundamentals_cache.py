@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Fundamentals Cache Component
+Persistent per-symbol cache of Yahoo Finance fundamentals with separate TTLs for info and statements.
+"""
+
+import os
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+from components.cache_store import CacheStore
+
+logger = logging.getLogger(__name__)
+
+class FundamentalsCache:
+    """Caches ticker.info and financial statements per symbol across restarts.
+    
+    ``info`` (prices, ratios, analyst data) expires daily. The financial statements
+    only change when a company reports, so they are kept until the next reporting
+    date published in ``info`` or, when that is unknown, for one quarter. Each
+    symbol is written on its own to a namespace of a cache store.
+    """
+    
+    STATEMENT_KEYS = ('financials', 'balance_sheet', 'cashflow')
+    EARNINGS_DATE_FIELDS = ('earningsTimestampStart', 'earningsTimestamp', 'nextEarningsDate')
+    NAMESPACE = 'fundamentals'
+    
+    def __init__(self, cache_dir: str = "cache"):
+        """Initialize fundamentals cache."""
+        self.db_file = os.path.join(cache_dir, "fundamentals_cache.db")
+        # Whole-dict pickle written by earlier versions, imported into the store once
+        self.legacy_file = os.path.join(cache_dir, "fundamentals_cache.pkl")
+        self.info_cache_hours = 24          # ticker.info refreshed daily
+        self.statements_default_days = 90   # Statements kept one quarter when no reporting date is known
+        self.statements_max_days = 100      # Never trust statements longer than this
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.store = CacheStore(self.db_file)
+        self.cache = self._load_cache()
+        logger.info(f"Fundamentals Cache initialized with {len(self.cache)} symbols")
+    
+    def _load_cache(self) -> Dict:
+        """Load cache from the store, importing the legacy pickle on first run."""
+        try:
+            self.store.import_pickle(self.NAMESPACE, self.legacy_file)
+            return self.store.load(self.NAMESPACE)
+        except Exception as e:
+            logger.warning(f"Could not load fundamentals cache from {self.db_file}: {str(e)}")
+        return {}
+    
+    def _save_symbol(self, symbol: str):
+        """Write one symbol's entry to the store (lock must be held)."""
+        try:
+            self.store.put(self.NAMESPACE, symbol, self.cache[symbol])
+        except Exception as e:
+            logger.error(f"Could not save fundamentals for {symbol} to {self.db_file}: {str(e)}")
+    
+    def _next_reporting_time(self, info: Optional[Dict], now: float) -> float:
+        """Epoch time when the statements should be refreshed."""
+        latest = now + self.statements_max_days * 86400
+        for field in self.EARNINGS_DATE_FIELDS:
+            value = (info or {}).get(field)
+            try:
+                if isinstance(value, str):
+                    value = datetime.fromisoformat(value).timestamp()
+                if value and now < float(value) < latest:
+                    return float(value)
+            except (TypeError, ValueError):
+                continue
+        return now + self.statements_default_days * 86400
+    
+    def get_info(self, symbol: str) -> Optional[Dict]:
+        """Get cached ticker.info if it is less than a day old."""
+        with self._lock:
+            entry = self.cache.get(symbol.upper(), {})
+            if entry.get('info') and time.time() - entry.get('info_time', 0) < self.info_cache_hours * 3600:
+                return entry['info']
+        return None
+    
+    def set_info(self, symbol: str, info: Dict):
+        """Store ticker.info for a symbol."""
+        symbol = symbol.upper()
+        with self._lock:
+            entry = self.cache.setdefault(symbol, {})
+            entry['info'] = info
+            entry['info_time'] = time.time()
+            self._save_symbol(symbol)
+    
+    def get_statements(self, symbol: str) -> Optional[Dict]:
+        """Get cached financial statements if the next reporting date has not passed."""
+        with self._lock:
+            entry = self.cache.get(symbol.upper(), {})
+            if entry.get('statements') is not None and time.time() < entry.get('statements_expiry', 0):
+                return entry['statements']
+        return None
+    
+    def set_statements(self, symbol: str, statements: Dict, info: Optional[Dict] = None):
+        """Store financial statements, valid until the next reporting date found in info."""
+        symbol = symbol.upper()
+        with self._lock:
+            now = time.time()
+            entry = self.cache.setdefault(symbol, {})
+            entry['statements'] = {key: statements.get(key) for key in self.STATEMENT_KEYS}
+            entry['statements_time'] = now
+            entry['statements_expiry'] = self._next_reporting_time(info or entry.get('info'), now)
+            self._save_symbol(symbol)
+    
+    def is_warm(self, symbol: str) -> bool:
+        """Whether both info and statements are cached and valid."""
+        return self.get_info(symbol) is not None and self.get_statements(symbol) is not None
+    
+    def get_market_caps(self) -> Dict[str, float]:
+        """Symbol -> last cached market capitalisation, including expired info."""
+        with self._lock:
+            market_caps = {}
+            for symbol, entry in self.cache.items():
+                value = (entry.get('info') or {}).get('marketCap')
+                if isinstance(value, (int, float)) and value > 0:
+                    market_caps[symbol] = float(value)
+            return market_caps
+    
+    def clear(self):
+        """Remove all cached fundamentals."""
+        with self._lock:
+            self.cache = {}
+            try:
+                self.store.clear(self.NAMESPACE)
+            except Exception as e:
+                logger.error(f"Could not clear fundamentals cache in {self.db_file}: {str(e)}")
+    
+    def get_stats(self) -> Dict:
+        """Get cache statistics."""
+        with self._lock:
+            now = time.time()
+            fresh_info = sum(1 for entry in self.cache.values()
+                             if entry.get('info') and now - entry.get('info_time', 0) < self.info_cache_hours * 3600)
+            fresh_statements = sum(1 for entry in self.cache.values()
+                                   if entry.get('statements') is not None and now < entry.get('statements_expiry', 0))
+            return {
+                'symbols': len(self.cache),
+                'fresh_info': fresh_info,
+                'fresh_statements': fresh_statements,
+                'info_cache_hours': self.info_cache_hours,
+                'db_file': self.db_file
+            }
+
+_fundamentals_cache: Optional[FundamentalsCache] = None
+_fundamentals_cache_lock = threading.Lock()
+
+def get_fundamentals_cache() -> FundamentalsCache:
+    """Get the fundamentals cache shared by every analyzer in this process."""
+    global _fundamentals_cache
+    with _fundamentals_cache_lock:
+        if _fundamentals_cache is None:
+            _fundamentals_cache = FundamentalsCache()
+        return _fundamentals_cache
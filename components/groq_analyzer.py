@@ -9,8 +9,12 @@ import json
 import logging
 from typing import Dict, List, Optional
 from datetime import datetime
+import threading
 import time
 import random
+from components.llm_response_cache import get_llm_response_cache
+from components.groq_client import get_groq_client
+from components.model_health import get_model_health
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,17 @@ class GroqNewsAnalyzer:
         self.api_key = None
         self.base_url = "https://api.groq.com/openai/v1/chat/completions"
         self.initialized = False
+        
+        # Comprehensive analyses requested together are sent as one batched prompt
+        self.batch_size = 4        # Stocks per batched request
+        self.batch_wait = 0.5      # Seconds the first caller waits for others to join its batch
+        self.batch_timeout = 120   # Seconds a joined caller waits for the batch before asking alone
+        self._batch_lock = threading.Lock()
+        self._pending_batches: Dict[str, Dict] = {}
+        self._batch_callers = 0    # Callers currently inside get_comprehensive_stock_analysis_batched
+        self.response_cache = get_llm_response_cache()
+        self.http_client = get_groq_client()
+        self.model_health = get_model_health()
         self._initialize()
     
     def _initialize(self):
@@ -70,8 +85,6 @@ class GroqNewsAnalyzer:
                 return False
             
             # Make a simple test request to validate the API key
-            import requests
-            
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
@@ -84,12 +97,7 @@ class GroqNewsAnalyzer:
                 "max_tokens": 10
             }
             
-            response = requests.post(
-                self.base_url,
-                headers=headers,
-                json=test_payload,
-                timeout=10
-            )
+            response = self.http_client.post(self.base_url, headers, test_payload, timeout=10)
             
             if response.status_code == 200:
                 return True
@@ -104,8 +112,48 @@ class GroqNewsAnalyzer:
             logger.error(f"Error validating Groq API key: {str(e)}")
             return False
     
-    def _make_request_with_retry(self, payload: Dict, max_retries: int = 3) -> Optional[Dict]:
-        """Make API request with retry logic for rate limiting."""
+    def _make_request_with_retry(self, payload: Dict, max_retries: int = 3, timeout: int = 30) -> Optional[Dict]:
+        """Make API request, answering repeated identical requests from the LLM response cache."""
+        cached = self.response_cache.get(payload, namespace='groq')
+        if cached is not None:
+            logger.info(f"Using cached Groq response for model {payload.get('model')}")
+            return cached
+        
+        response_data = self._post_with_retry(payload, max_retries, timeout)
+        if response_data and response_data.get('choices'):
+            self.response_cache.set(payload, response_data, namespace='groq')
+        return response_data
+    
+    def _discard_cached_response(self, response):
+        """Drop a response from the LLM response cache after its content failed to parse.
+        
+        Responses are cached as soon as they arrive; without this a malformed reply
+        would be replayed for the whole cache TTL, including on the retries meant to
+        get a better one.
+        """
+        payload = getattr(response, 'payload', None)
+        if payload is not None:
+            self.response_cache.delete(payload, namespace='groq')
+    
+    def _is_model_unavailable(self, response: requests.Response) -> bool:
+        """Whether an error response says the model itself is gone (decommissioned or unknown)."""
+        if response.status_code == 404:
+            return True
+        if response.status_code != 400:
+            return False
+        try:
+            error = response.json().get('error', {})
+            text = f"{error.get('code', '')} {error.get('message', '')}".lower()
+        except Exception:
+            text = response.text.lower()
+        return any(marker in text for marker in ('decommissioned', 'model_not_found', 'does not exist'))
+    
+    def _post_with_retry(self, payload: Dict, max_retries: int = 3, timeout: int = 30) -> Optional[Dict]:
+        """Make API request over the shared Groq client with retry logic for rate limiting.
+        
+        The final outcome of each call is reported to the model health tracker.
+        """
+        model = payload.get('model', '')
         for attempt in range(max_retries):
             try:
                 headers = {
@@ -113,30 +161,35 @@ class GroqNewsAnalyzer:
                     "Content-Type": "application/json"
                 }
                 
-                response = requests.post(
-                    self.base_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=30
-                )
+                started = time.time()
+                response = self.http_client.post(self.base_url, headers, payload, timeout=timeout)
                 
                 if response.status_code == 200:
+                    self.model_health.record_success(model, time.time() - started)
                     return response.json()
-                elif response.status_code == 429:  # Rate limited
+                elif response.status_code in (429, 503):  # Rate limited or temporarily overloaded
                     if attempt < max_retries - 1:
+                        retry_after = self.http_client.retry_after(response)
+                        if retry_after is not None:
+                            # The shared client holds every request until the server's deadline
+                            logger.warning(f"Rate limited (HTTP {response.status_code}), server asked to retry after {retry_after:.1f}s (retry {attempt + 1}/{max_retries})")
+                            continue
                         # Exponential backoff with jitter
                         wait_time = (2 ** attempt) + random.uniform(0, 1)
-                        logger.warning(f"Rate limited, waiting {wait_time:.1f}s before retry {attempt + 1}/{max_retries}")
+                        logger.warning(f"Rate limited (HTTP {response.status_code}), waiting {wait_time:.1f}s before retry {attempt + 1}/{max_retries}")
                         time.sleep(wait_time)
                         continue
                     else:
-                        logger.error("Rate limited after all retries")
+                        logger.error(f"Rate limited (HTTP {response.status_code}) after all retries")
+                        self.model_health.record_failure(model, f"HTTP {response.status_code} after all retries")
                         return None
                 elif response.status_code == 401:
                     logger.error("Authentication failed - invalid API key")
                     return None
                 else:
                     logger.error(f"API request failed with status {response.status_code}: {response.text}")
+                    self.model_health.record_failure(model, f"HTTP {response.status_code}",
+                                                     permanent=self._is_model_unavailable(response))
                     return None
                     
             except requests.exceptions.Timeout:
@@ -147,6 +200,7 @@ class GroqNewsAnalyzer:
                     continue
                 else:
                     logger.error("Request timeout after all retries")
+                    self.model_health.record_failure(model, "Timeout after all retries")
                     return None
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -156,6 +210,7 @@ class GroqNewsAnalyzer:
                     continue
                 else:
                     logger.error(f"Request failed after all retries: {str(e)}")
+                    self.model_health.record_failure(model, str(e))
                     return None
         
         return None
@@ -367,6 +422,7 @@ Provide analysis for the most impactful news affecting NSE-listed Indian stocks
                         
                     except json.JSONDecodeError as e:
                         logger.warning(f"JSON decode error (attempt {attempt + 1}): {str(e)}")
+                        self._discard_cached_response(response)
                         if attempt < 2:  # Try again with different model
                             continue
                         else:
@@ -521,6 +577,7 @@ Provide analysis for the most impactful news affecting NSE-listed Indian stocks
                     
                 except json.JSONDecodeError as e:
                     logger.error(f"Error parsing Groq response: {str(e)}")
+                    self._discard_cached_response(response)
                     return self._service_unavailable_response(f"Invalid JSON response from Groq API: {str(e)}")
             elif response is not None:
                 logger.error(f"Groq API error: {response.status_code} - {response.text}")
@@ -611,26 +668,10 @@ Provide only valid JSON response."""
                     # Try to fix the JSON response first
                     fixed_content = self._fix_json_response(content)
                     analysis_data = json.loads(fixed_content)
-                    return {
-                        'status': 'success',
-                        'overall_score': float(analysis_data.get('overall_score', 0.5)),
-                        'recommendation': analysis_data.get('recommendation', 'HOLD'),
-                        'confidence': float(analysis_data.get('confidence', 0.5)),
-                        'reasoning': analysis_data.get('reasoning', 'No reasoning provided'),
-                        'key_factors': analysis_data.get('key_factors', []),
-                        'risk_assessment': analysis_data.get('risk_assessment', 'MEDIUM'),
-                        'time_horizon': analysis_data.get('time_horizon', 'MEDIUM'),
-                        'price_target': analysis_data.get('price_target', 'N/A'),
-                        'stop_loss': analysis_data.get('stop_loss', 'N/A'),
-                        'technical_insights': analysis_data.get('technical_insights', 'No technical insights'),
-                        'fundamental_insights': analysis_data.get('fundamental_insights', 'No fundamental insights'),
-                        'sentiment_insights': analysis_data.get('sentiment_insights', 'No sentiment insights'),
-                        'market_outlook': analysis_data.get('market_outlook', 'No market outlook'),
-                        'source': 'Groq API',
-                        'timestamp': datetime.now().isoformat()
-                    }
+                    return self._comprehensive_result(analysis_data)
                 except json.JSONDecodeError as e:
                     logger.error(f"Error parsing comprehensive Groq response: {str(e)}")
+                    self._discard_cached_response(response)
                     return self._service_unavailable_response(f"Invalid JSON response: {str(e)}")
             elif response is not None:
                 logger.error(f"Groq API error for comprehensive analysis: {response.status_code}")
@@ -638,7 +679,7 @@ Provide only valid JSON response."""
             else:
                 logger.error("All Groq models failed for comprehensive analysis - no response received")
                 return self._service_unavailable_response("All available Groq models are currently unavailable. Please try again later.")
-            
+        
         except requests.exceptions.Timeout:
             logger.error("Groq API request timed out for comprehensive analysis")
             return self._service_unavailable_response("Groq API request timed out")
@@ -649,6 +690,261 @@ Provide only valid JSON response."""
             logger.error(f"Error in comprehensive analysis: {str(e)}")
             return self._service_unavailable_response(f"Analysis error: {str(e)}")
     
+    def _comprehensive_result(self, analysis_data: Dict) -> Dict:
+        """Normalize one parsed comprehensive analysis into the response dict."""
+        return {
+            'status': 'success',
+            'overall_score': float(analysis_data.get('overall_score', 0.5)),
+            'recommendation': analysis_data.get('recommendation', 'HOLD'),
+            'confidence': float(analysis_data.get('confidence', 0.5)),
+            'reasoning': analysis_data.get('reasoning', 'No reasoning provided'),
+            'key_factors': analysis_data.get('key_factors', []),
+            'risk_assessment': analysis_data.get('risk_assessment', 'MEDIUM'),
+            'time_horizon': analysis_data.get('time_horizon', 'MEDIUM'),
+            'price_target': analysis_data.get('price_target', 'N/A'),
+            'stop_loss': analysis_data.get('stop_loss', 'N/A'),
+            'technical_insights': analysis_data.get('technical_insights', 'No technical insights'),
+            'fundamental_insights': analysis_data.get('fundamental_insights', 'No fundamental insights'),
+            'sentiment_insights': analysis_data.get('sentiment_insights', 'No sentiment insights'),
+            'market_outlook': analysis_data.get('market_outlook', 'No market outlook'),
+            'source': 'Groq API',
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    def get_comprehensive_stock_analysis_batch(self, stocks: List[Dict], news_articles: List[Dict]) -> Dict[str, Dict]:
+        """Comprehensive analysis of several stocks per request with one shared news block.
+        
+        Args:
+            stocks: Dicts with symbol, technical_data and fundamental_data
+            news_articles: News shared by every stock in the batch
+        
+        Returns a dict of symbol -> analysis in the same format as
+        get_comprehensive_stock_analysis. Stocks missing from a batched response,
+        or whose batch could not be parsed, are analyzed one request at a time.
+        """
+        results: Dict[str, Dict] = {}
+        if not stocks:
+            return results
+        if not self.initialized:
+            unavailable = self._service_unavailable_response("Groq AI not initialized. Please set your GROQ_API_KEY.")
+            return {stock['symbol']: unavailable for stock in stocks}
+        
+        news_summary = self._format_news_data_for_groq(news_articles)
+        for start in range(0, len(stocks), self.batch_size):
+            chunk = stocks[start:start + self.batch_size]
+            if len(chunk) > 1:
+                results.update(self._request_comprehensive_batch(chunk, news_summary))
+            
+            for stock in chunk:
+                if stock['symbol'] not in results:
+                    results[stock['symbol']] = self.get_comprehensive_stock_analysis(
+                        stock['symbol'], stock.get('technical_data'), stock.get('fundamental_data'), news_articles
+                    )
+        
+        return results
+    
+    def _request_comprehensive_batch(self, stocks: List[Dict], news_summary: str) -> Dict[str, Dict]:
+        """Send one batched comprehensive-analysis prompt; returns the stocks it could parse."""
+        try:
+            stock_sections = []
+            for i, stock in enumerate(stocks):
+                stock_sections.append(f"""STOCK {i + 1}: {stock['symbol']}
+
+TECHNICAL ANALYSIS:
+{self._format_technical_data_for_groq(stock.get('technical_data'))}
+
+FUNDAMENTAL ANALYSIS:
+{self._format_fundamental_data_for_groq(stock.get('fundamental_data'))}""")
+            stocks_block = "\n\n".join(stock_sections)
+            
+            prompt = f"""You are a senior financial analyst. Provide a comprehensive analysis of each of the following {len(stocks)} stocks considering all available data.
+
+NEWS SENTIMENT (applies to every stock below):
+{news_summary}
+
+{stocks_block}
+
+Provide the analysis as a JSON array with exactly one object per stock, in the same order:
+[
+  {{
+    "symbol": "Stock symbol exactly as given above",
+    "overall_score": 0.0 to 1.0,
+    "recommendation": "BUY/SELL/HOLD",
+    "confidence": 0.0 to 1.0,
+    "reasoning": "Detailed reasoning for the recommendation",
+    "key_factors": ["factor1", "factor2", "factor3"],
+    "risk_assessment": "LOW/MEDIUM/HIGH",
+    "time_horizon": "SHORT/MEDIUM/LONG",
+    "price_target": "Expected price range",
+    "stop_loss": "Risk management level",
+    "technical_insights": "Technical analysis summary",
+    "fundamental_insights": "Fundamental analysis summary",
+    "sentiment_insights": "News sentiment summary",
+    "market_outlook": "Overall market perspective"
+  }}
+]
+
+Focus on:
+1. Integration of all data sources
+2. Risk-reward assessment
+3. Market timing considerations
+4. Technical and fundamental alignment
+5. News sentiment impact
+6. Actionable insights for swing trading
+
+Provide only a valid JSON array response."""
+            
+            headers = {
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json'
+            }
+            
+            # Use currently available models (desktop app models were decommissioned)
+            models_to_try = [
+                "llama-3.1-8b-instant",     # Primary working model
+                "llama-3.3-70b-versatile",  # Alternative if available
+                "llama-3.1-70b-versatile"   # Fallback if available
+            ]
+            
+            response = self._try_models_request(models_to_try, headers, prompt, timeout=30)
+            if response is None or response.status_code != 200:
+                logger.warning(f"Batched Groq analysis failed for {len(stocks)} stocks, falling back to per-stock requests")
+                return {}
+            
+            content = response.json()['choices'][0]['message']['content']
+            symbols = {stock['symbol'].upper(): stock['symbol'] for stock in stocks}
+            results = {}
+            for item in self._parse_json_array(content):
+                symbol = symbols.get(str(item.get('symbol', '')).upper().replace('.NS', '').strip())
+                if symbol and symbol not in results:
+                    try:
+                        results[symbol] = self._comprehensive_result(item)
+                    except (TypeError, ValueError) as e:
+                        logger.warning(f"Invalid batched Groq analysis for {symbol}: {str(e)}")
+            
+            if not results:
+                self._discard_cached_response(response)
+            logger.info(f"Batched Groq analysis returned {len(results)}/{len(stocks)} stocks in one request")
+            return results
+        
+        except Exception as e:
+            logger.error(f"Error in batched comprehensive analysis: {str(e)}")
+            return {}
+    
+    def _parse_json_array(self, content: str) -> List[Dict]:
+        """Parse a JSON array of objects from a model response.
+        
+        Falls back to decoding every complete top-level object when the array
+        itself is malformed or truncated.
+        """
+        if '```' in content:
+            start_idx = content.find('```')
+            start_idx = content.find('\n', start_idx) + 1
+            end_idx = content.find('```', start_idx)
+            if end_idx > start_idx:
+                content = content[start_idx:end_idx]
+        
+        start_idx = content.find('[')
+        end_idx = content.rfind(']')
+        if 0 <= start_idx < end_idx:
+            try:
+                parsed = json.loads(content[start_idx:end_idx + 1])
+                if isinstance(parsed, list):
+                    return [item for item in parsed if isinstance(item, dict)]
+            except json.JSONDecodeError:
+                pass
+        
+        # Salvage the complete objects of a broken or truncated array
+        decoder = json.JSONDecoder()
+        items = []
+        index = content.find('{')
+        while index >= 0:
+            try:
+                item, end = decoder.raw_decode(content, index)
+                if isinstance(item, dict):
+                    items.append(item)
+                index = content.find('{', end)
+            except json.JSONDecodeError:
+                index = content.find('{', index + 1)
+        return items
+    
+    def get_comprehensive_stock_analysis_batched(self, stock_symbol: str, technical_data: Dict,
+                                                 fundamental_data: Dict, news_articles: List[Dict]) -> Dict:
+        """Per-stock comprehensive analysis that joins concurrent callers into one batched request.
+        
+        Safe to call from worker threads. The first caller for a news context waits up
+        to batch_wait seconds (or until batch_size callers have joined) and then sends
+        the batch for everyone; the others wait up to batch_timeout seconds for their
+        result. A caller with no concurrent callers does not wait at all.
+        """
+        if not self.initialized:
+            return self._service_unavailable_response("Groq AI not initialized. Please set your GROQ_API_KEY.")
+        
+        request = {
+            'symbol': stock_symbol,
+            'technical_data': technical_data,
+            'fundamental_data': fundamental_data,
+            'done': threading.Event(),
+            'result': None
+        }
+        news_key = self._format_news_data_for_groq(news_articles)
+        
+        with self._batch_lock:
+            self._batch_callers += 1
+            batch = self._pending_batches.get(news_key)
+            is_leader = batch is None
+            if is_leader:
+                batch = {'requests': [], 'full': threading.Event()}
+                self._pending_batches[news_key] = batch
+            batch['requests'].append(request)
+            if len(batch['requests']) >= self.batch_size:
+                # Later callers start a new batch
+                del self._pending_batches[news_key]
+                batch['full'].set()
+        
+        try:
+            if is_leader:
+                self._send_pending_batch(batch, news_key)
+            elif not request['done'].wait(self.batch_timeout):
+                logger.warning(f"Batched analysis for {stock_symbol} timed out, requesting it alone")
+            
+            if request['result'] is None:
+                return self.get_comprehensive_stock_analysis(stock_symbol, technical_data, fundamental_data, news_articles)
+            return request['result']
+        finally:
+            with self._batch_lock:
+                self._batch_callers -= 1
+    
+    def _close_batch(self, batch: Dict, news_key: str):
+        """Stop new callers from joining a batch."""
+        with self._batch_lock:
+            if self._pending_batches.get(news_key) is batch:
+                del self._pending_batches[news_key]
+    
+    def _send_pending_batch(self, batch: Dict, news_key: str):
+        """Close a batch, send it and hand every joined caller its result.
+        
+        Stocks the batch could not answer get a None result and fall back to their
+        own request; every caller is released even if the batched request fails.
+        """
+        results = {}
+        try:
+            with self._batch_lock:
+                others_waiting = self._batch_callers > len(batch['requests'])
+            if others_waiting:
+                batch['full'].wait(self.batch_wait)
+            self._close_batch(batch, news_key)
+            
+            if len(batch['requests']) > 1:
+                results = self._request_comprehensive_batch(batch['requests'], news_key)
+        except Exception as e:
+            logger.error(f"Error in batched comprehensive analysis: {str(e)}")
+        finally:
+            self._close_batch(batch, news_key)
+            for pending in batch['requests']:
+                pending['result'] = results.get(pending['symbol'])
+                pending['done'].set()
+    
     def get_stock_specific_analysis(self, news_articles: List[Dict], stock_symbol: str) -> Dict:
         """Get stock-specific analysis."""
         try:
@@ -734,6 +1030,7 @@ Guidelines:
                     }
                 except json.JSONDecodeError as e:
                     logger.error(f"Error parsing stock-specific Groq response: {str(e)}")
+                    self._discard_cached_response(response)
                     return self._service_unavailable_response(f"Invalid JSON response: {str(e)}")
             elif response is not None:
                 logger.error(f"Groq API error for stock analysis: {response.status_code}")
@@ -758,10 +1055,19 @@ Guidelines:
             return self._service_unavailable_response(f"Analysis error: {str(e)}")
     
     def _try_models_request(self, models_to_try: List[str], headers: Dict, prompt: str, timeout: int = 30) -> Optional[requests.Response]:
-        """Try different models until one works."""
+        """Try different models until one works.
+        
+        Models whose circuit is open are skipped; the rest are tried healthiest and
+        fastest first, keeping the given order for models not used yet.
+        """
         failed_models = []
+        candidates = self.model_health.order(models_to_try)
+        skipped = [model for model in models_to_try if model not in candidates]
+        if skipped:
+            failed_models.extend(f"Model {model} skipped (circuit open)" for model in skipped)
+            logger.info(f"Skipping unavailable models: {', '.join(skipped)}")
         
-        for model in models_to_try:
+        for model in candidates:
             try:
                 data = {
                     "model": model,
@@ -776,21 +1082,22 @@ Guidelines:
                 }
                 
                 # Use retry logic for this request
-                response_data = self._make_request_with_retry(data)
+                response_data = self._make_request_with_retry(data, timeout=timeout)
                 
                 if response_data:
                     logger.info(f"✅ Successfully used model: {model}")
                     # Create a mock response object with the data
                     class MockResponse:
-                        def __init__(self, data):
+                        def __init__(self, data, payload):
                             self.status_code = 200
                             self.json_data = data
+                            self.payload = payload
                         def json(self):
                             return self.json_data
                         @property
                         def text(self):
                             return json.dumps(self.json_data)
-                    return MockResponse(response_data)
+                    return MockResponse(response_data, data)
                 else:
                     # Request failed after retries, try next model
                     error_msg = f"Model {model} failed after retries"
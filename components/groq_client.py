@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Groq Client Component
+Shared keep-alive HTTP client for the Groq API with a concurrency limit and Retry-After handling.
+"""
+
+import logging
+import threading
+import time
+import requests
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class GroqClient:
+    """One pooled requests session for every Groq call in the process.
+    
+    Connections are kept alive between calls, so only the first request pays for
+    the TLS handshake. A semaphore bounds the number of requests in flight, and a
+    429/503 response carrying Retry-After pauses every caller until the server's
+    deadline instead of each thread discovering the limit on its own.
+    """
+    
+    def __init__(self, max_concurrent: int = 4, max_retry_after: float = 60.0):
+        """Initialize Groq client.
+        
+        Args:
+            max_concurrent: Requests allowed in flight at the same time
+            max_retry_after: Upper bound in seconds on a server-requested pause
+        """
+        self.max_concurrent = max_concurrent
+        self.max_retry_after = max_retry_after
+        
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+        self.requests_sent = 0
+        self.throttled = 0
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrent)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        logger.info(f"Groq Client initialized with {max_concurrent} concurrent requests")
+    
+    def retry_after(self, response: requests.Response) -> Optional[float]:
+        """Seconds to wait according to the Retry-After header, None if absent."""
+        value = response.headers.get('retry-after')
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(delay, 0.0), self.max_retry_after)
+    
+    def _wait_if_blocked(self):
+        """Sleep until a pause requested by the server has passed."""
+        with self._lock:
+            delay = self._blocked_until - time.time()
+        if delay > 0:
+            logger.info(f"Waiting {delay:.1f}s for Groq rate limit to reset")
+            time.sleep(delay)
+    
+    def post(self, url: str, headers: Dict, payload: Dict, timeout: float = 30) -> requests.Response:
+        """POST a JSON payload over the shared session.
+        
+        A 429/503 with Retry-After delays every later request until the given time;
+        the response is returned so the caller can decide whether to retry.
+        """
+        self._wait_if_blocked()
+        with self._slots:
+            response = self.session.post(url, headers=headers, json=payload, timeout=timeout)
+        
+        with self._lock:
+            self.requests_sent += 1
+            if response.status_code in (429, 503):
+                self.throttled += 1
+                delay = self.retry_after(response)
+                if delay:
+                    self._blocked_until = max(self._blocked_until, time.time() + delay)
+        return response
+    
+    def get_stats(self) -> Dict:
+        """Get client statistics."""
+        with self._lock:
+            return {
+                'requests_sent': self.requests_sent,
+                'throttled': self.throttled,
+                'max_concurrent': self.max_concurrent,
+                'blocked_for': max(0.0, self._blocked_until - time.time())
+            }
+
+_groq_client: Optional[GroqClient] = None
+_groq_client_lock = threading.Lock()
+
+def get_groq_client() -> GroqClient:
+    """Get the Groq client shared by every Groq analyzer in this process."""
+    global _groq_client
+    with _groq_client_lock:
+        if _groq_client is None:
+            _groq_client = GroqClient()
+        return _groq_client
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Liquidity Ranker Component
+Ranks NSE symbols by average traded value and market cap from the local bar and fundamentals caches.
+"""
+
+import json
+import os
+import logging
+import threading
+import time
+import numpy as np
+from typing import Dict, Iterable, List, Optional
+from components.bar_store import BarStore
+from components.fundamentals_cache import FundamentalsCache, get_fundamentals_cache
+
+logger = logging.getLogger(__name__)
+
+class LiquidityRanker:
+    """Orders symbols by how liquid they are, using only data already cached locally.
+    
+    The average daily traded value (Close x Volume over the last ``lookback`` bars)
+    of every symbol in the bar store is kept in a small JSON file together with the
+    bar file's modification time, so a refresh only re-reads the symbols whose bars
+    changed. Market caps come from the cached ticker.info. Each metric is turned
+    into a percentile and a symbol's score is the mean of the percentiles it has.
+    """
+    
+    SUFFIX = '.NS'
+    
+    def __init__(self, bar_store: Optional[BarStore] = None,
+                 fundamentals_cache: Optional[FundamentalsCache] = None,
+                 cache_file: str = os.path.join("cache", "liquidity_rank.json"),
+                 lookback: int = 20, refresh_interval: int = 300):
+        """Initialize liquidity ranker.
+        
+        Args:
+            bar_store: Bar store to read traded values from
+            fundamentals_cache: Fundamentals cache to read market caps from
+            cache_file: JSON file holding traded values by symbol
+            lookback: Number of recent bars averaged for the traded value
+            refresh_interval: Seconds between rescans of the bar store
+        """
+        self.bar_store = bar_store or BarStore()
+        self.fundamentals_cache = fundamentals_cache or get_fundamentals_cache()
+        self.cache_file = cache_file
+        self.lookback = lookback
+        self.refresh_interval = refresh_interval
+        
+        self._lock = threading.Lock()
+        self._last_refresh = 0.0
+        self._scores: Dict[str, float] = {}
+        
+        cache_dir = os.path.dirname(cache_file)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.traded_values = self._load_cache()
+        logger.info(f"Liquidity Ranker initialized with {len(self.traded_values)} symbols")
+    
+    def _load_cache(self) -> Dict:
+        """Load cached traded values from file."""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r') as f:
+                    payload = json.load(f)
+                if payload.get('lookback') == self.lookback:
+                    return payload.get('symbols', {})
+        except Exception as e:
+            logger.warning(f"Could not load liquidity cache from {self.cache_file}: {str(e)}")
+        return {}
+    
+    def _save_cache(self):
+        """Save traded values atomically (lock must be held)."""
+        try:
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, 'w') as f:
+                json.dump({'lookback': self.lookback, 'symbols': self.traded_values}, f)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            logger.error(f"Could not save liquidity cache to {self.cache_file}: {str(e)}")
+    
+    def _base_symbol(self, symbol: str) -> Optional[str]:
+        """RELIANCE.NS -> RELIANCE; None for symbols of other exchanges."""
+        symbol = symbol.upper()
+        return symbol[:-len(self.SUFFIX)] if symbol.endswith(self.SUFFIX) else None
+    
+    @staticmethod
+    def _percentiles(values: Dict[str, float]) -> Dict[str, float]:
+        """Symbol -> percentile (0..1] of its value among all values."""
+        if not values:
+            return {}
+        symbols = list(values)
+        order = np.argsort(np.array([values[symbol] for symbol in symbols]), kind='stable')
+        ranks = np.empty(len(symbols))
+        ranks[order] = np.arange(1, len(symbols) + 1) / len(symbols)
+        return dict(zip(symbols, ranks.tolist()))
+    
+    def refresh(self, force: bool = False):
+        """Re-read traded values for changed bar files and recompute the scores."""
+        with self._lock:
+            if not force and time.time() - self._last_refresh < self.refresh_interval:
+                return
+            
+            try:
+                stored = self.bar_store.stored_files()
+                changed = False
+                
+                for symbol, mtime in stored.items():
+                    entry = self.traded_values.get(symbol)
+                    if entry and entry.get('bars_mtime') == mtime:
+                        continue
+                    self.traded_values[symbol] = {
+                        'traded_value': self.bar_store.average_traded_value(symbol, self.lookback),
+                        'bars_mtime': mtime
+                    }
+                    changed = True
+                
+                for symbol in set(self.traded_values) - set(stored):
+                    del self.traded_values[symbol]
+                    changed = True
+                
+                if changed:
+                    self._save_cache()
+                
+                traded = {}
+                for symbol, entry in self.traded_values.items():
+                    base = self._base_symbol(symbol)
+                    if base and entry.get('traded_value'):
+                        traded[base] = entry['traded_value']
+                market_caps = {}
+                for symbol, value in self.fundamentals_cache.get_market_caps().items():
+                    base = self._base_symbol(symbol)
+                    if base:
+                        market_caps[base] = value
+                
+                traded_ranks = self._percentiles(traded)
+                market_cap_ranks = self._percentiles(market_caps)
+                scores = {}
+                for symbol in set(traded_ranks) | set(market_cap_ranks):
+                    ranks = [ranks[symbol] for ranks in (traded_ranks, market_cap_ranks) if symbol in ranks]
+                    scores[symbol] = sum(ranks) / len(ranks)
+                
+                self._scores = scores
+                self._last_refresh = time.time()
+                logger.debug(f"Liquidity ranks refreshed for {len(scores)} symbols")
+            
+            except Exception as e:
+                logger.error(f"Error refreshing liquidity ranks: {str(e)}")
+    
+    def rank(self, symbols: Iterable[str], limit: Optional[int] = None) -> List[str]:
+        """Symbols ordered from most to least liquid.
+        
+        Symbols without cached data follow the ranked ones in alphabetical order.
+        """
+        self.refresh()
+        scores = self._scores
+        ordered = sorted(set(symbols), key=lambda symbol: (symbol not in scores, -scores.get(symbol, 0.0), symbol))
+        return ordered[:limit] if limit is not None else ordered
+    
+    def get_stats(self) -> Dict:
+        """Get ranker statistics."""
+        with self._lock:
+            return {
+                'ranked_symbols': len(self._scores),
+                'bar_symbols': len(self.traded_values),
+                'lookback': self.lookback,
+                'cache_file': self.cache_file
+            }
+
+_liquidity_ranker: Optional[LiquidityRanker] = None
+_liquidity_ranker_lock = threading.Lock()
+
+def get_liquidity_ranker() -> LiquidityRanker:
+    """Get the liquidity ranker shared by every component in this process."""
+    global _liquidity_ranker
+    with _liquidity_ranker_lock:
+        if _liquidity_ranker is None:
+            _liquidity_ranker = LiquidityRanker()
+        return _liquidity_ranker
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Liveness Registry Component
+Persistent record of when each symbol last traded and which symbols are delisted.
+"""
+
+import json
+import os
+import logging
+import threading
+import pandas as pd
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class LivenessRegistry:
+    """Tracks symbol -> last seen trading date and delisted flag.
+    
+    Entries are written as a side effect of the normal data fetches, so checking
+    whether a symbol is worth analyzing is a dictionary lookup instead of an extra
+    Yahoo Finance probe. Symbols flagged as delisted are never requested again.
+    """
+    
+    def __init__(self, registry_file: str = os.path.join("cache", "liveness_registry.json")):
+        """Initialize liveness registry."""
+        self.registry_file = registry_file
+        self.stale_after_days = 30   # No bar for this long before a check means the symbol stopped trading
+        self.recheck_after_days = 7  # Entries older than this are treated as unknown
+        self._lock = threading.Lock()
+        
+        registry_dir = os.path.dirname(registry_file)
+        if registry_dir:
+            os.makedirs(registry_dir, exist_ok=True)
+        self.registry = self._load_registry()
+        logger.info(f"Liveness Registry initialized with {len(self.registry)} symbols")
+    
+    def _load_registry(self) -> Dict:
+        """Load registry from file."""
+        try:
+            if os.path.exists(self.registry_file):
+                with open(self.registry_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load liveness registry from {self.registry_file}: {str(e)}")
+        return {}
+    
+    def _save_registry(self):
+        """Save registry to file atomically (lock must be held)."""
+        try:
+            temp_file = f"{self.registry_file}.tmp"
+            with open(temp_file, 'w') as f:
+                json.dump(self.registry, f, indent=2)
+            os.replace(temp_file, self.registry_file)
+        except Exception as e:
+            logger.error(f"Could not save liveness registry to {self.registry_file}: {str(e)}")
+    
+    def record_trading(self, symbol: str, last_date) -> None:
+        """Record the latest bar date seen for a symbol by a fetch made today."""
+        self.record_many({symbol: last_date})
+    
+    def record_many(self, last_dates: Dict) -> None:
+        """Record symbol -> latest bar date for many symbols with a single write."""
+        checked = datetime.now().strftime('%Y-%m-%d')
+        with self._lock:
+            changed = False
+            for symbol, last_date in last_dates.items():
+                try:
+                    last_seen = pd.Timestamp(last_date).strftime('%Y-%m-%d')
+                except Exception:
+                    continue
+                
+                key = symbol.upper()
+                entry = self.registry.get(key, {})
+                if entry.get('last_seen') == last_seen and entry.get('checked') == checked and not entry.get('delisted'):
+                    continue
+                
+                entry['last_seen'] = max(last_seen, entry.get('last_seen', ''))
+                entry['checked'] = checked
+                entry['delisted'] = False
+                entry.pop('reason', None)
+                self.registry[key] = entry
+                changed = True
+            
+            if changed:
+                self._save_registry()
+    
+    def mark_delisted(self, symbol: str, reason: str = '') -> None:
+        """Flag a symbol as delisted so it is skipped from now on."""
+        with self._lock:
+            key = symbol.upper()
+            entry = self.registry.get(key, {})
+            if entry.get('delisted'):
+                return
+            
+            entry['delisted'] = True
+            entry['reason'] = reason[:200]
+            entry['checked'] = datetime.now().strftime('%Y-%m-%d')
+            self.registry[key] = entry
+            self._save_registry()
+        logger.warning(f"Marked {symbol} as delisted: {reason[:100]}")
+    
+    def is_delisted(self, symbol: str) -> bool:
+        """Whether the symbol has been flagged as delisted."""
+        return self.registry.get(symbol.upper(), {}).get('delisted', False)
+    
+    def get_status(self, symbol: str) -> str:
+        """Get 'live', 'stale', 'delisted' or 'unknown' for a symbol.
+        
+        'stale' means the last check found no bar for stale_after_days; entries not
+        checked within recheck_after_days are 'unknown' and need a real fetch.
+        """
+        entry = self.registry.get(symbol.upper())
+        if not entry:
+            return 'unknown'
+        if entry.get('delisted'):
+            return 'delisted'
+        
+        last_seen = entry.get('last_seen')
+        checked = entry.get('checked')
+        if not last_seen or not checked:
+            return 'unknown'
+        
+        checked_date = datetime.strptime(checked, '%Y-%m-%d')
+        if datetime.now() - checked_date > timedelta(days=self.recheck_after_days):
+            return 'unknown'
+        if checked_date - datetime.strptime(last_seen, '%Y-%m-%d') > timedelta(days=self.stale_after_days):
+            return 'stale'
+        return 'live'
+    
+    def get_entry(self, symbol: str) -> Optional[Dict]:
+        """Get the raw registry entry for a symbol."""
+        entry = self.registry.get(symbol.upper())
+        return dict(entry) if entry else None
+    
+    def get_stats(self) -> Dict:
+        """Get registry statistics."""
+        statuses = [self.get_status(symbol) for symbol in list(self.registry)]
+        return {
+            'symbols': len(statuses),
+            'live': statuses.count('live'),
+            'stale': statuses.count('stale'),
+            'delisted': statuses.count('delisted'),
+            'registry_file': self.registry_file
+        }
+
+_liveness_registry: Optional[LivenessRegistry] = None
+_liveness_registry_lock = threading.Lock()
+
+def get_liveness_registry() -> LivenessRegistry:
+    """Get the liveness registry shared by every component in this process."""
+    global _liveness_registry
+    with _liveness_registry_lock:
+        if _liveness_registry is None:
+            _liveness_registry = LivenessRegistry()
+        return _liveness_registry
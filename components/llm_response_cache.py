@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache Component
+Content-addressed cache of chat-completion responses keyed by prompt, model and sampling settings.
+"""
+
+import hashlib
+import json
+import os
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+from components.cache_store import CacheStore
+
+logger = logging.getLogger(__name__)
+
+class LLMResponseCache:
+    """Caches successful LLM responses by a hash of the request that produced them.
+    
+    The key covers everything that shapes the answer (model, messages, temperature,
+    max_tokens...) but never the API key, so re-running an analysis on unchanged
+    inputs is answered locally. Entries expire after a TTL and the least recently
+    used ones are evicted once the cache holds max_entries responses. Responses are
+    kept in memory and written per key to a namespace of a cache store.
+    """
+    
+    # Request fields that change the response; anything else (e.g. stream options) is ignored
+    KEY_FIELDS = ('model', 'messages', 'temperature', 'max_tokens', 'top_p', 'response_format')
+    
+    NAMESPACE = 'llm_responses'
+    
+    def __init__(self, db_file: str = os.path.join("cache", "llm_response_cache.db"),
+                 ttl_hours: float = 6, max_entries: int = 500):
+        """Initialize LLM response cache.
+        
+        Args:
+            db_file: Cache store database holding cached responses
+            ttl_hours: Hours a response is served from the cache
+            max_entries: Responses kept before the least recently used are evicted
+        """
+        self.db_file = db_file
+        self.ttl_hours = ttl_hours
+        self.max_entries = max_entries
+        
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        self.store = CacheStore(db_file)
+        # Whole-file JSON cache written by earlier versions, imported once
+        self._import_legacy_json(os.path.join(os.path.dirname(db_file), "llm_response_cache.json"))
+        self.cache: "OrderedDict[str, Dict]" = self._load_cache()
+        logger.info(f"LLM Response Cache initialized with {len(self.cache)} responses")
+    
+    def _import_legacy_json(self, json_file: str):
+        """Move responses from the legacy JSON file into an empty store namespace."""
+        if not os.path.exists(json_file) or self.store.count(self.NAMESPACE) > 0:
+            return
+        try:
+            with open(json_file, 'r') as f:
+                entries = json.load(f)
+            self.store.put_many(self.NAMESPACE, entries)
+            os.replace(json_file, f"{json_file}.migrated")
+            logger.info(f"Imported {len(entries)} responses from {json_file} into cache store")
+        except Exception as e:
+            logger.warning(f"Could not import legacy LLM response cache {json_file}: {str(e)}")
+    
+    def _load_cache(self) -> "OrderedDict[str, Dict]":
+        """Load live responses from the store, oldest first, dropping expired ones."""
+        try:
+            entries = self.store.load(self.NAMESPACE)
+            now = time.time()
+            expired = [key for key, entry in entries.items() if entry.get('expires_at', 0) <= now]
+            self.store.delete(self.NAMESPACE, expired)
+            live = sorted(((key, entry) for key, entry in entries.items() if entry.get('expires_at', 0) > now),
+                          key=lambda item: item[1].get('used_at', 0))
+            return OrderedDict(live)
+        except Exception as e:
+            logger.warning(f"Could not load LLM response cache from {self.db_file}: {str(e)}")
+        return OrderedDict()
+    
+    def _persist(self, puts: Optional[Dict[str, Dict]] = None, deletes: Iterable[str] = ()):
+        """Write changed responses to the store (lock must be held)."""
+        try:
+            if puts:
+                self.store.put_many(self.NAMESPACE, puts)
+            self.store.delete(self.NAMESPACE, deletes)
+        except Exception as e:
+            logger.error(f"Could not save LLM response cache to {self.db_file}: {str(e)}")
+    
+    def make_key(self, payload: Dict, namespace: str = '') -> str:
+        """Stable hash of the response-shaping fields of a request payload."""
+        material = {field: payload.get(field) for field in self.KEY_FIELDS if field in payload}
+        encoded = json.dumps([namespace, material], sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+    
+    def get(self, payload: Dict, namespace: str = '') -> Optional[Dict]:
+        """Cached response for a request payload, None on a miss."""
+        key = self.make_key(payload, namespace)
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None or entry.get('expires_at', 0) <= time.time():
+                if entry is not None:
+                    del self.cache[key]
+                    self._persist(deletes=[key])
+                self.misses += 1
+                return None
+            
+            entry['used_at'] = time.time()
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return entry['response']
+    
+    def set(self, payload: Dict, response: Dict, namespace: str = ''):
+        """Store a successful response for a request payload."""
+        key = self.make_key(payload, namespace)
+        with self._lock:
+            now = time.time()
+            entry = {
+                'response': response,
+                'model': payload.get('model'),
+                'expires_at': now + self.ttl_hours * 3600,
+                'used_at': now
+            }
+            self.cache[key] = entry
+            self.cache.move_to_end(key)
+            evicted = []
+            while len(self.cache) > self.max_entries:
+                evicted.append(self.cache.popitem(last=False)[0])
+                self.evictions += 1
+            self._persist({key: entry}, evicted)
+    
+    def delete(self, payload: Dict, namespace: str = ''):
+        """Forget the cached response for a request payload (e.g. one that failed to parse)."""
+        key = self.make_key(payload, namespace)
+        with self._lock:
+            if self.cache.pop(key, None) is not None:
+                self._persist(deletes=[key])
+    
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self.cache.clear()
+            try:
+                self.store.clear(self.NAMESPACE)
+            except Exception as e:
+                logger.error(f"Could not clear LLM response cache in {self.db_file}: {str(e)}")
+    
+    def get_stats(self) -> Dict:
+        """Get cache statistics including the hit rate since startup."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.cache),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'ttl_hours': self.ttl_hours,
+                'max_entries': self.max_entries,
+                'db_file': self.db_file
+            }
+
+_llm_response_cache: Optional[LLMResponseCache] = None
+_llm_response_cache_lock = threading.Lock()
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Get the LLM response cache shared by every AI analyzer in this process."""
+    global _llm_response_cache
+    with _llm_response_cache_lock:
+        if _llm_response_cache is None:
+            _llm_response_cache = LLMResponseCache()
+        return _llm_response_cache
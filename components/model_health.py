@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Model Health Component
+Per-model circuit breaker and latency tracking used to order LLM model fallbacks.
+"""
+
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class ModelHealthTracker:
+    """Remembers how each model has behaved recently and which ones to skip.
+    
+    A model's circuit opens after ``failure_threshold`` consecutive failures and
+    stays open for ``cooldown`` seconds; after that one trial request per cooldown
+    is let through (half-open). A model reported as decommissioned or unknown
+    opens for ``permanent_cooldown`` after a single failure. Available models are ordered
+    by recent success rate, then by median latency, keeping the caller's order
+    for models that have not been used yet.
+    """
+    
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 60.0,
+                 permanent_cooldown: float = 3600.0, window: int = 20):
+        """Initialize model health tracker.
+        
+        Args:
+            failure_threshold: Consecutive failures that open a model's circuit
+            cooldown: Seconds a circuit stays open after transient failures
+            permanent_cooldown: Seconds a decommissioned/unknown model is skipped
+            window: Number of recent outcomes and latencies kept per model
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.permanent_cooldown = permanent_cooldown
+        self.window = window
+        
+        self._lock = threading.Lock()
+        self._models: Dict[str, Dict] = {}
+        logger.info("Model Health Tracker initialized")
+    
+    def _entry(self, model: str) -> Dict:
+        """Health record of a model (lock must be held)."""
+        if model not in self._models:
+            self._models[model] = {
+                'outcomes': deque(maxlen=self.window),
+                'latencies': deque(maxlen=self.window),
+                'consecutive_failures': 0,
+                'open_until': 0.0,
+                'half_open': False,
+                'last_error': ''
+            }
+        return self._models[model]
+    
+    def record_success(self, model: str, latency: float):
+        """Record a successful response and close the model's circuit."""
+        with self._lock:
+            entry = self._entry(model)
+            entry['outcomes'].append(True)
+            entry['latencies'].append(latency)
+            entry['consecutive_failures'] = 0
+            entry['open_until'] = 0.0
+            entry['half_open'] = False
+    
+    def record_failure(self, model: str, error: str = '', permanent: bool = False):
+        """Record a failed request, opening the circuit when the model looks down."""
+        with self._lock:
+            entry = self._entry(model)
+            entry['outcomes'].append(False)
+            entry['consecutive_failures'] += 1
+            entry['last_error'] = error
+            
+            if permanent:
+                entry['open_until'] = time.time() + self.permanent_cooldown
+            elif entry['half_open'] or entry['consecutive_failures'] >= self.failure_threshold:
+                entry['open_until'] = time.time() + self.cooldown
+            else:
+                return
+            entry['half_open'] = False
+            logger.warning(f"Circuit opened for model {model} until {time.strftime('%H:%M:%S', time.localtime(entry['open_until']))}: {error}")
+    
+    def is_available(self, model: str) -> bool:
+        """Whether requests may be sent to a model now (closed or due for a trial)."""
+        with self._lock:
+            entry = self._models.get(model)
+            if entry is None or entry['open_until'] == 0.0:
+                return True
+            now = time.time()
+            if now >= entry['open_until']:
+                # Let a trial request through; the next one is allowed a cooldown later
+                entry['open_until'] = now + self.cooldown
+                entry['half_open'] = True
+                return True
+            return False
+    
+    def _success_rate(self, entry: Dict) -> Optional[float]:
+        outcomes = entry['outcomes']
+        return sum(outcomes) / len(outcomes) if outcomes else None
+    
+    def order(self, models: List[str]) -> List[str]:
+        """Available models, healthiest and fastest first."""
+        ranked = []
+        for index, model in enumerate(models):
+            if not self.is_available(model):
+                logger.debug(f"Skipping model {model}: circuit open")
+                continue
+            with self._lock:
+                entry = self._models.get(model)
+                success_rate = self._success_rate(entry) if entry else None
+                p50 = statistics.median(entry['latencies']) if entry and entry['latencies'] else float('inf')
+            
+            if success_rate is None:
+                group = 1  # Not used yet: keep the caller's preference
+            elif success_rate >= 0.5:
+                group = 0
+            else:
+                group = 2
+            ranked.append(((group, -round(success_rate or 0.0, 1), p50, index), model))
+        return [model for _, model in sorted(ranked)]
+    
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-model success rate, median latency and circuit state."""
+        with self._lock:
+            now = time.time()
+            stats = {}
+            for model, entry in self._models.items():
+                success_rate = self._success_rate(entry)
+                stats[model] = {
+                    'success_rate': success_rate,
+                    'p50_latency': statistics.median(entry['latencies']) if entry['latencies'] else None,
+                    'requests': len(entry['outcomes']),
+                    'state': ('half-open' if entry['half_open'] or 0 < entry['open_until'] <= now
+                              else 'open' if entry['open_until'] > now else 'closed'),
+                    'last_error': entry['last_error']
+                }
+            return stats
+
+_model_health: Optional[ModelHealthTracker] = None
+_model_health_lock = threading.Lock()
+
+def get_model_health() -> ModelHealthTracker:
+    """Get the model health tracker shared by every AI analyzer in this process."""
+    global _model_health
+    with _model_health_lock:
+        if _model_health is None:
+            _model_health = ModelHealthTracker()
+        return _model_health
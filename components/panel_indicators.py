@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Panel Indicators Component
+Vectorized cross-sectional technical indicators over a (bars x symbols) price panel.
+"""
+
+import pandas as pd
+import numpy as np
+import logging
+from typing import Dict
+from components.rolling_kernels import rolling_mean_abs_deviation
+
+logger = logging.getLogger(__name__)
+
+class PanelIndicatorEngine:
+    """Computes the TechnicalAnalyzer indicator suite for many symbols in one vectorized pass.
+    
+    Panels are DataFrames with one column per symbol. Rows are bar positions aligned on
+    each symbol's latest bar, so symbols with shorter histories produce exactly the
+    values TechnicalAnalyzer would compute for them one at a time.
+    """
+    
+    OHLCV_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+    
+    def build_panel(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """Right-align per-symbol OHLCV frames into one (bars x symbols) panel per column."""
+        frames = {symbol: hist for symbol, hist in frames.items() if hist is not None and not hist.empty}
+        if not frames:
+            return {}
+        
+        symbols = list(frames.keys())
+        max_len = max(len(hist) for hist in frames.values())
+        panels = {}
+        
+        for column in self.OHLCV_COLUMNS:
+            data = np.full((max_len, len(symbols)), np.nan)
+            for j, symbol in enumerate(symbols):
+                hist = frames[symbol]
+                if column in hist.columns:
+                    values = hist[column].to_numpy(dtype=float)
+                    data[max_len - len(values):, j] = values
+            panels[column] = pd.DataFrame(data, columns=symbols)
+        
+        return panels
+    
+    def compute(self, high: pd.DataFrame, low: pd.DataFrame, close: pd.DataFrame,
+                volume: pd.DataFrame) -> Dict[str, Dict]:
+        """Compute indicators for every symbol column and return symbol -> analyze_stock fields."""
+        try:
+            valid = close.notna()
+            lengths = valid.sum()
+            current_price = close.iloc[-1]
+            
+            # RSI
+            delta = close.diff()
+            gain = delta.where(delta > 0, 0).where(valid).rolling(window=14).mean()
+            loss = (-delta.where(delta < 0, 0)).where(valid).rolling(window=14).mean()
+            rsi = (100 - (100 / (1 + gain / loss))).iloc[-1]
+            
+            # MACD and moving averages
+            macd = (close.ewm(span=12).mean() - close.ewm(span=26).mean()).iloc[-1]
+            sma = {}
+            for period in (10, 20, 50):
+                sma[period] = close.rolling(window=period).mean().iloc[-1].where(lengths >= period, current_price)
+            ema = {}
+            for period in (12, 26):
+                ema[period] = close.ewm(span=period).mean().iloc[-1].where(lengths >= period, current_price)
+            
+            # Bollinger Bands
+            bb_middle_series = close.rolling(window=20).mean()
+            bb_std = close.rolling(window=20).std()
+            bb_upper = (bb_middle_series + bb_std * 2).iloc[-1]
+            bb_middle = bb_middle_series.iloc[-1]
+            bb_lower = (bb_middle_series - bb_std * 2).iloc[-1]
+            
+            # Stochastic and Williams %R
+            lowest_low = low.rolling(window=14).min()
+            highest_high = high.rolling(window=14).max()
+            k_percent = 100 * ((close - lowest_low) / (highest_high - lowest_low))
+            stoch_k = k_percent.iloc[-1]
+            stoch_d = k_percent.rolling(window=3).mean().iloc[-1]
+            williams_r = (-100 * ((highest_high - close) / (highest_high - lowest_low))).iloc[-1]
+            
+            # CCI
+            typical_price = (high + low + close) / 3
+            sma_tp = typical_price.rolling(window=20).mean()
+            mean_deviation = rolling_mean_abs_deviation(typical_price, 20)
+            cci = ((typical_price - sma_tp) / (0.015 * mean_deviation)).iloc[-1]
+            
+            # MFI
+            money_flow = typical_price * volume
+            tp_valid = typical_price.notna()
+            positive_flow = money_flow.where(typical_price > typical_price.shift(1), 0).where(tp_valid).rolling(window=14).sum()
+            negative_flow = money_flow.where(typical_price < typical_price.shift(1), 0).where(tp_valid).rolling(window=14).sum()
+            mfi = (100 - (100 / (1 + positive_flow / negative_flow))).iloc[-1]
+            
+            # ATR and OBV
+            high_low = high - low
+            high_close = np.abs(high - close.shift(1))
+            low_close = np.abs(low - close.shift(1))
+            true_range = np.maximum(high_low, np.maximum(high_close, low_close))
+            atr = true_range.rolling(window=14).mean().iloc[-1]
+            obv = (volume * np.sign(close.diff())).cumsum().iloc[-1]
+            
+            # Volume analysis
+            avg_volume_5 = volume.rolling(window=5).mean().iloc[-1]
+            avg_volume_20 = volume.rolling(window=20).mean().iloc[-1]
+            current_volume = volume.iloc[-1]
+            volume_ratio_5 = (current_volume / avg_volume_5).where(avg_volume_5 > 0, 1)
+            volume_ratio_20 = (current_volume / avg_volume_20).where(avg_volume_20 > 0, 1)
+            
+            # Price analysis
+            price_change_1d = close.pct_change().iloc[-1] * 100
+            price_change_5d = close.pct_change(periods=5).iloc[-1] * 100
+            price_change_20d = close.pct_change(periods=20).iloc[-1] * 100
+            
+            # Trend analysis
+            trend_short = np.select(
+                [(current_price > sma[10]) & (sma[10] > sma[20]), (current_price < sma[10]) & (sma[10] < sma[20])],
+                [1, -1], 0
+            )
+            trend_medium = np.select([sma[20] > sma[50], sma[20] < sma[50]], [1, -1], 0)
+            trend_long = np.select([current_price > sma[50], current_price < sma[50]], [1, -1], 0)
+            
+            results = {}
+            for j, symbol in enumerate(close.columns):
+                results[symbol] = {
+                    'symbol': symbol,
+                    'current_price': current_price[symbol],
+                    
+                    # Momentum Indicators
+                    'rsi': rsi[symbol],
+                    'stochastic_k': stoch_k[symbol],
+                    'stochastic_d': stoch_d[symbol],
+                    'williams_r': williams_r[symbol],
+                    'cci': cci[symbol],
+                    'mfi': mfi[symbol],
+                    
+                    # Trend Indicators
+                    'macd': macd[symbol],
+                    'sma_10': sma[10][symbol],
+                    'sma_20': sma[20][symbol],
+                    'sma_50': sma[50][symbol],
+                    'ema_12': ema[12][symbol],
+                    'ema_26': ema[26][symbol],
+                    
+                    # Volatility Indicators
+                    'bb_upper': bb_upper[symbol],
+                    'bb_middle': bb_middle[symbol],
+                    'bb_lower': bb_lower[symbol],
+                    'atr': atr[symbol],
+                    
+                    # Volume Indicators
+                    'obv': obv[symbol],
+                    'volume_ratio_5': volume_ratio_5[symbol],
+                    'volume_ratio_20': volume_ratio_20[symbol],
+                    'current_volume': current_volume[symbol],
+                    'avg_volume_5': avg_volume_5[symbol],
+                    'avg_volume_20': avg_volume_20[symbol],
+                    
+                    # Price Analysis
+                    'price_change_1d': price_change_1d[symbol],
+                    'price_change_5d': price_change_5d[symbol],
+                    'price_change_20d': price_change_20d[symbol],
+                    
+                    # Trend Analysis
+                    'trend_short': int(trend_short[j]),
+                    'trend_medium': int(trend_medium[j]),
+                    'trend_long': int(trend_long[j]),
+                    
+                    # Additional metrics
+                    'volume_ratio': volume_ratio_20[symbol]  # For compatibility
+                }
+            
+            return results
+        
+        except Exception as e:
+            logger.error(f"Error computing panel indicators: {str(e)}")
+            return {}
@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 import yfinance as yf
 from dataclasses import dataclass
 from enum import Enum
+from components.rate_limiter import get_yahoo_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,7 @@ class PriceMonitor:
         self.stop_event = threading.Event()
         self.check_interval = 60  # Check every 60 seconds
         self.last_check_time = None
+        self.rate_limiter = get_yahoo_rate_limiter()
         
         logger.info("PriceMonitor initialized")
     
@@ -256,12 +258,24 @@ class PriceMonitor:
         except Exception as e:
             logger.error(f"Error checking stock price for {symbol}: {str(e)}")
     
+    def _fetch_intraday_bars(self, symbol: str):
+        """Fetch today's 1-minute bars through the shared Yahoo rate limiter."""
+        self.rate_limiter.acquire()
+        ticker = yf.Ticker(symbol)
+        try:
+            hist = ticker.history(period="1d", interval="1m")
+        except Exception as e:
+            if self.rate_limiter.is_throttle_error(e):
+                self.rate_limiter.report_throttled()
+            raise
+        self.rate_limiter.report_success()
+        return hist
+    
     def _get_current_price(self, symbol: str) -> Optional[float]:
         """Get current price for a symbol."""
         try:
             symbol_with_suffix = f"{symbol}.NS"
-            ticker = yf.Ticker(symbol_with_suffix)
-            hist = ticker.history(period="1d", interval="1m")
+            hist = self._fetch_intraday_bars(symbol_with_suffix)
             
             if not hist.empty:
                 return float(hist['Close'].iloc[-1])
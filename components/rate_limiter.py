@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Component
+Process-wide, thread-safe token-bucket limiter with adaptive backoff for Yahoo Finance calls.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class TokenBucketRateLimiter:
+    """Thread-safe token bucket that adapts its refill rate to provider throttling.
+    
+    Calls take a token and return immediately while the bucket has budget, so bursts up to
+    ``capacity`` never sleep. When the provider answers with a rate-limit error the refill
+    rate is halved and all callers pause for an exponentially growing cooldown; each
+    successful call then restores the rate additively back towards ``max_rate``.
+    """
+    
+    # A bare '429' would also match tickers, prices or URL paths in unrelated errors
+    THROTTLE_INDICATORS = ('rate limited', 'too many requests', 'http 429', 'status 429',
+                           'status code 429', '429 client error')
+    
+    def __init__(self, name: str, rate: float = 2.0, capacity: int = 5,
+                 min_rate: float = 0.2, recovery_step: float = 0.05, max_backoff: float = 60.0):
+        """Initialize the limiter.
+        
+        Args:
+            name: Name used in logs and stats
+            rate: Tokens refilled per second when the provider is healthy
+            capacity: Maximum burst of calls made without waiting
+            min_rate: Floor for the refill rate after repeated throttling
+            recovery_step: Rate added back after each successful call
+            max_backoff: Upper bound of the cooldown after a throttle, in seconds
+        """
+        self.name = name
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.recovery_step = recovery_step
+        self.max_backoff = max_backoff
+        
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
+        self.consecutive_throttles = 0
+        
+        self.total_acquired = 0
+        self.total_waited = 0.0
+        self.total_throttles = 0
+        
+        self._lock = threading.Lock()
+        logger.info(f"Rate limiter '{name}' initialized: {rate}/s, burst {capacity}")
+    
+    def _refill(self, now: float):
+        """Add the tokens accrued since the last refill (lock must be held)."""
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_refill = now
+    
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Take tokens, waiting only if the bucket is empty or a throttle cooldown is active.
+        
+        Returns False if timeout elapsed before the tokens became available.
+        """
+        tokens = min(tokens, self.capacity)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waited = 0.0
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                
+                if now >= self.blocked_until and self.tokens >= tokens:
+                    self.tokens -= tokens
+                    self.total_acquired += 1
+                    self.total_waited += waited
+                    return True
+                
+                if now < self.blocked_until:
+                    wait_time = self.blocked_until - now
+                else:
+                    wait_time = (tokens - self.tokens) / self.rate
+            
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait_time = min(wait_time, remaining)
+            
+            time.sleep(wait_time)
+            waited += wait_time
+    
+    def report_success(self):
+        """Record a successful call and recover the refill rate."""
+        with self._lock:
+            self.consecutive_throttles = 0
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.recovery_step)
+    
+    def report_throttled(self, retry_after: Optional[float] = None):
+        """Record a rate-limit response: halve the rate and pause every caller."""
+        with self._lock:
+            self.consecutive_throttles += 1
+            self.total_throttles += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = 0.0
+            
+            backoff = retry_after if retry_after else min(self.max_backoff, 2 ** self.consecutive_throttles)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + backoff)
+        
+        logger.warning(f"Rate limiter '{self.name}' throttled: backing off {backoff:.1f}s, rate now {self.rate:.2f}/s")
+    
+    def is_throttle_error(self, error: Exception) -> bool:
+        """Check whether an exception is a provider rate-limit response."""
+        response = getattr(error, 'response', None)
+        status_code = getattr(error, 'status_code', None) or getattr(response, 'status_code', None)
+        if status_code == 429:
+            return True
+        error_msg = str(error).lower()
+        return any(indicator in error_msg for indicator in self.THROTTLE_INDICATORS)
+    
+    def get_stats(self) -> Dict:
+        """Get limiter statistics."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                'name': self.name,
+                'rate': self.rate,
+                'max_rate': self.max_rate,
+                'tokens': self.tokens,
+                'capacity': self.capacity,
+                'total_acquired': self.total_acquired,
+                'total_waited': self.total_waited,
+                'total_throttles': self.total_throttles,
+                'consecutive_throttles': self.consecutive_throttles
+            }
+
+_yahoo_limiter: Optional[TokenBucketRateLimiter] = None
+_yahoo_limiter_lock = threading.Lock()
+
+def get_yahoo_rate_limiter() -> TokenBucketRateLimiter:
+    """Get the limiter shared by every Yahoo Finance caller in this process."""
+    global _yahoo_limiter
+    with _yahoo_limiter_lock:
+        if _yahoo_limiter is None:
+            _yahoo_limiter = TokenBucketRateLimiter('yahoo_finance', rate=2.0, capacity=5)
+        return _yahoo_limiter
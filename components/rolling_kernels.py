@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Rolling Kernels Component
+Vectorized rolling-window kernels shared by the technical indicators.
+"""
+
+import pandas as pd
+import numpy as np
+import logging
+from typing import Callable, Union
+from numpy.lib.stride_tricks import sliding_window_view
+
+logger = logging.getLogger(__name__)
+
+ArrayLike = Union[pd.Series, pd.DataFrame, np.ndarray]
+
+def sliding_windows(values: np.ndarray, window: int) -> np.ndarray:
+    """Strided (no-copy) view of every full window along the first axis.
+    
+    For an input of shape (n, ...) the result has shape (n - window + 1, ..., window).
+    """
+    return sliding_window_view(values, window, axis=0)
+
+def rolling_reduce(values: ArrayLike, window: int, reducer: Callable[[np.ndarray], np.ndarray]) -> ArrayLike:
+    """Apply a window reducer along the first axis, like rolling(window).apply(...).
+    
+    The reducer receives the strided window view and must reduce over its last axis.
+    Windows that are not yet full, or that contain NaN, yield NaN just like pandas
+    rolling with the default min_periods. Series and DataFrames keep their index
+    and columns.
+    """
+    array = np.asarray(values, dtype=float)
+    result = np.full(array.shape, np.nan)
+    
+    if window > 0 and len(array) >= window:
+        result[window - 1:] = reducer(sliding_windows(array, window))
+    
+    if isinstance(values, pd.DataFrame):
+        return pd.DataFrame(result, index=values.index, columns=values.columns)
+    if isinstance(values, pd.Series):
+        return pd.Series(result, index=values.index, name=values.name)
+    return result
+
+def _mean_abs_deviation(windows: np.ndarray) -> np.ndarray:
+    """Mean absolute deviation from the window mean over the last axis."""
+    return np.abs(windows - windows.mean(axis=-1, keepdims=True)).mean(axis=-1)
+
+def rolling_mean_abs_deviation(values: ArrayLike, window: int) -> ArrayLike:
+    """Rolling mean absolute deviation, as used by CCI.
+    
+    Equivalent to rolling(window).apply(lambda x: np.mean(np.abs(x - x.mean())))
+    without a Python callback per window.
+    """
+    return rolling_reduce(values, window, _mean_abs_deviation)
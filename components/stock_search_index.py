@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Stock Search Index Component
+Prefix trie and n-gram inverted index for ranked symbol and company-name search.
+"""
+
+import re
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+class StockSearchIndex:
+    """Answers symbol / company-name queries from prebuilt indexes.
+    
+    Two prefix tries make a prefix lookup a walk over the query's characters: the
+    symbol trie keeps the best candidates at each node, the trie over every word of
+    the company names keeps the full row set so multi-word queries can intersect.
+    An inverted index of 1-, 2- and 3-grams finds substring matches anywhere in a
+    symbol or name and, for misspelled queries, candidates with similar trigrams.
+    """
+    
+    TOP_PER_NODE = 50        # Candidates kept at each trie node
+    FUZZY_THRESHOLD = 0.35   # Minimum trigram similarity for a fuzzy match
+    
+    # Ranking tiers, higher is better
+    EXACT_SYMBOL = 100
+    SYMBOL_PREFIX = 80
+    NAME_PREFIX = 70
+    WORD_PREFIX = 60
+    SUBSTRING = 40
+    FUZZY = 20
+    
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        """Build the index from (symbol, company_name) pairs."""
+        self.symbols: List[str] = []
+        self.names: List[str] = []
+        self.keys: List[str] = []          # Searchable text per row: "SYMBOL COMPANY NAME"
+        self.symbol_trie: Dict = {}
+        self.word_trie: Dict = {}
+        self.grams: Dict[str, Set[int]] = defaultdict(set)
+        self.token_trigrams: List[List[Set[str]]] = []   # Trigram sets of the symbol and each name word
+        self.trigram_index: Dict[str, Set[int]] = defaultdict(set)
+        
+        for symbol, name in entries:
+            self._add(str(symbol).strip().upper(), self.normalize(name))
+        
+        self._rank_trie_nodes(self.symbol_trie)
+        self.grams = dict(self.grams)
+        self.trigram_index = dict(self.trigram_index)
+        logger.info(f"Stock search index built for {len(self.symbols)} stocks")
+    
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Upper-case and collapse whitespace."""
+        return ' '.join(str(text).upper().split())
+    
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        padded = f"  {text} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def _add(self, symbol: str, name: str):
+        """Add one stock to every index."""
+        row = len(self.symbols)
+        self.symbols.append(symbol)
+        self.names.append(name)
+        key = f"{symbol} {name}"
+        self.keys.append(key)
+        
+        words = set(re.findall(r'[A-Z0-9&]+', name))
+        self._insert(self.symbol_trie, symbol, row)
+        for word in words:
+            node = self.word_trie
+            for char in word:
+                node = node.setdefault(char, {})
+                node.setdefault('', set()).add(row)
+        
+        for text in (symbol, name):
+            for size in (1, 2, 3):
+                for i in range(len(text) - size + 1):
+                    self.grams[text[i:i + size]].add(row)
+        
+        token_trigrams = [self._trigrams(token) for token in [symbol] + sorted(words)]
+        self.token_trigrams.append(token_trigrams)
+        for trigrams in token_trigrams:
+            for gram in trigrams:
+                self.trigram_index[gram].add(row)
+    
+    def _insert(self, trie: Dict, word: str, row: int):
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+            node.setdefault('', []).append(row)
+    
+    def _rank_trie_nodes(self, node: Dict):
+        """Keep only the best candidates at each node: shortest symbols first."""
+        for char, child in node.items():
+            if char == '':
+                continue
+            rows = sorted(set(child['']), key=lambda row: (len(self.symbols[row]), self.symbols[row]))
+            child[''] = rows[:self.TOP_PER_NODE]
+            self._rank_trie_nodes(child)
+    
+    def _prefix_rows(self, trie: Dict, prefix: str):
+        node = trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node.get('', [])
+    
+    def _substring_rows(self, query: str) -> Set[int]:
+        """Rows whose symbol or company name contains the query."""
+        if len(query) <= 3:
+            return set(self.grams.get(query, ()))
+        
+        postings = [self.grams.get(query[i:i + 3]) for i in range(len(query) - 2)]
+        if not all(postings):
+            return set()
+        candidates = set.intersection(*sorted(postings, key=len))
+        return {row for row in candidates if query in self.symbols[row] or query in self.names[row]}
+    
+    def _fuzzy_rows(self, query: str) -> Dict[int, float]:
+        """Rows whose symbol or a name word is similar to the query (typo tolerant).
+        
+        Similarity is the Dice coefficient of padded trigram sets; only rows sharing
+        enough trigrams with the query are scored.
+        """
+        query_grams = self._trigrams(query.replace(' ', ''))
+        counts: Dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for row in self.trigram_index.get(gram, ()):
+                counts[row] += 1
+        
+        min_shared = max(2, int(len(query_grams) * self.FUZZY_THRESHOLD))
+        matches = {}
+        for row, shared in counts.items():
+            if shared < min_shared:
+                continue
+            similarity = max(2 * len(query_grams & grams) / (len(query_grams) + len(grams))
+                             for grams in self.token_trigrams[row])
+            if similarity >= self.FUZZY_THRESHOLD:
+                matches[row] = similarity
+        return matches
+    
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True) -> List[Dict]:
+        """Ranked top-k matches for a symbol or company-name query.
+        
+        Each result has symbol, company_name, score and match (the tier that matched).
+        """
+        query = self.normalize(query)
+        if not query:
+            return []
+        
+        scores: Dict[int, Tuple[float, str]] = {}
+        
+        def offer(row: int, score: float, match: str):
+            if row not in scores or scores[row][0] < score:
+                scores[row] = (score, match)
+        
+        for row in self._prefix_rows(self.symbol_trie, query):
+            if self.symbols[row] == query:
+                offer(row, self.EXACT_SYMBOL, 'exact')
+            else:
+                offer(row, self.SYMBOL_PREFIX - len(self.symbols[row]) / 100, 'symbol_prefix')
+        
+        # Symbol prefixes outrank every later tier, so a full page of them is final
+        words = query.split()
+        if words and len(scores) < limit:
+            word_rows = sorted((self._prefix_rows(self.word_trie, word) for word in words), key=len)
+            for row in set(word_rows[0]).intersection(*word_rows[1:]):
+                tier = self.NAME_PREFIX if self.names[row].startswith(query) else self.WORD_PREFIX
+                offer(row, tier - len(self.names[row]) / 1000, 'name_prefix' if tier == self.NAME_PREFIX else 'word_prefix')
+        
+        if len(scores) < limit:
+            for row in self._substring_rows(query):
+                offer(row, self.SUBSTRING - len(self.keys[row]) / 1000, 'substring')
+        
+        if fuzzy and len(scores) < limit and len(query) >= 3:
+            for row, similarity in self._fuzzy_rows(query).items():
+                offer(row, self.FUZZY * similarity, 'fuzzy')
+        
+        ranked = sorted(scores.items(), key=lambda item: (-item[1][0], len(self.symbols[item[0]]), self.symbols[item[0]]))[:limit]
+        return [
+            {'symbol': self.symbols[row], 'company_name': self.names[row], 'score': round(score, 3), 'match': match}
+            for row, (score, match) in ranked
+        ]
+    
+    def substring_matches(self, query: str) -> List[int]:
+        """Row numbers of every stock whose symbol or name contains the query, in row order."""
+        query = self.normalize(query)
+        return sorted(self._substring_rows(query)) if query else list(range(len(self.symbols)))
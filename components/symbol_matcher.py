@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Symbol Matcher Component
+Aho-Corasick multi-pattern matcher for finding stock symbols, company names and keywords in news text.
+"""
+
+import re
+import logging
+from collections import deque
+from typing import Dict, Hashable, Iterator, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Legal-form suffixes stripped from EQUITY.csv company names to build aliases
+COMPANY_SUFFIXES = re.compile(r'(\s+(LIMITED|LTD\.?|LTD-RE|CO\.?|CORPORATION|CORP\.?|INC\.?)|\s*\(.*?\))+$')
+
+class MultiPatternMatcher:
+    """Aho-Corasick automaton matching many patterns in one pass over the text.
+    
+    Each pattern carries one or more labels. Matching is case-insensitive and
+    respects word boundaries: a 'word' pattern must not be preceded or followed
+    by a letter or digit, while a 'prefix' pattern may be followed by more
+    letters (so 'PROFIT' also matches 'PROFITS').
+    """
+    
+    def __init__(self):
+        """Initialize an empty matcher."""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, Hashable, bool]]] = [[]]
+        self._built = False
+    
+    def add(self, pattern: str, label: Hashable, mode: str = 'word'):
+        """Add a pattern with a label; mode is 'word' or 'prefix'."""
+        pattern = pattern.upper()
+        if not pattern:
+            return
+        
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = next_node
+        
+        self._outputs[node].append((len(pattern), label, mode == 'word'))
+        self._built = False
+    
+    def build(self) -> 'MultiPatternMatcher':
+        """Compute failure links; called automatically before the first match."""
+        queue = deque(self._goto[0].values())
+        for node in queue:
+            self._fail[node] = 0
+        
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+        
+        self._built = True
+        return self
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Hashable]]:
+        """Yield (start, end, label) for every boundary-respecting match in text."""
+        if not self._built:
+            self.build()
+        
+        text = text.upper()
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        length = len(text)
+        node = 0
+        
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            
+            for pattern_length, label, whole_word in outputs[node]:
+                start = index - pattern_length + 1
+                end = index + 1
+                if text[start].isalnum() and start > 0 and text[start - 1].isalnum():
+                    continue
+                if whole_word and text[index].isalnum() and end < length and text[end].isalnum():
+                    continue
+                yield start, end, label
+    
+    def find_labels(self, text: str) -> Set[Hashable]:
+        """Set of labels whose patterns occur in text."""
+        return {label for _, _, label in self.iter_matches(text)}
+    
+    def __len__(self) -> int:
+        return len(self._goto)
+
+def company_aliases(company_names: Dict[str, str], min_length: int = 5) -> Dict[str, str]:
+    """Map upper-cased company names, without legal-form suffixes, to their symbols.
+    
+    'Reliance Industries Limited' becomes 'RELIANCE INDUSTRIES'. Aliases shorter than
+    min_length or shared by several symbols are dropped as ambiguous.
+    """
+    aliases: Dict[str, str] = {}
+    ambiguous = set()
+    for symbol, name in company_names.items():
+        alias = COMPANY_SUFFIXES.sub('', re.sub(r'\s+', ' ', str(name).upper()).strip()).strip(' .,-')
+        if len(alias) < min_length:
+            continue
+        if alias in aliases and aliases[alias] != symbol:
+            ambiguous.add(alias)
+        aliases[alias] = symbol
+    
+    for alias in ambiguous:
+        del aliases[alias]
+    return aliases
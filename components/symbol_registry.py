@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Symbol Registry Component
+Indexed NSE symbol universe built from EQUITY.csv and cached in binary form.
+"""
+
+import os
+import pickle
+import logging
+import threading
+import time
+import pandas as pd
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class SymbolRegistry:
+    """Symbol set, ISIN map and company-name trie for every listed NSE security.
+    
+    The index is built from EQUITY.csv with column operations and pickled next to
+    the other caches together with the CSV's modification time and size, so later
+    processes load it directly instead of parsing the CSV again.
+    """
+    
+    FORMAT_VERSION = 1
+    COLUMNS = {
+        'SYMBOL': 'symbol',
+        'NAME OF COMPANY': 'company_name',
+        'SERIES': 'series',
+        'DATE OF LISTING': 'date_of_listing',
+        'PAID UP VALUE': 'paid_up_value',
+        'MARKET LOT': 'market_lot',
+        'ISIN NUMBER': 'isin_number',
+        'FACE VALUE': 'face_value'
+    }
+    END = '\0'  # Trie key holding the rows whose name ends at a node
+    
+    def __init__(self, equity_file: str = "EQUITY.csv",
+                 cache_file: str = os.path.join("cache", "symbol_registry.pkl")):
+        """Initialize symbol registry."""
+        self.equity_file = equity_file
+        self.cache_file = cache_file
+        self.columns: Dict[str, List] = {field: [] for field in self.COLUMNS.values()}
+        self.name_trie: Dict = {}
+        self.source_stamp = None
+        
+        self.load()
+        self._build_lookups()
+        logger.info(f"Symbol Registry initialized with {len(self.symbols)} symbols")
+    
+    def _file_stamp(self) -> Optional[tuple]:
+        """Modification time and size of the equity file, None if missing."""
+        try:
+            stat = os.stat(self.equity_file)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def load(self):
+        """Load the binary index, rebuilding it when EQUITY.csv has changed."""
+        stamp = self._file_stamp()
+        if stamp is None:
+            logger.error(f"EQUITY.csv file not found at {self.equity_file}")
+            return
+        
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'rb') as f:
+                    payload = pickle.load(f)
+                if (payload.get('version') == self.FORMAT_VERSION and payload.get('stamp') == stamp
+                        and payload.get('equity_file') == os.path.abspath(self.equity_file)):
+                    self.columns = payload['columns']
+                    self.name_trie = payload['name_trie']
+                    self.source_stamp = stamp
+                    logger.debug(f"Loaded symbol registry from {self.cache_file}")
+                    return
+        except Exception as e:
+            logger.warning(f"Could not load symbol registry from {self.cache_file}: {str(e)}")
+        
+        # A failed build is neither saved nor stamped, so the next load retries it
+        if self._build_from_csv():
+            self.source_stamp = stamp
+            self._save(stamp)
+    
+    def is_stale(self) -> bool:
+        """Whether EQUITY.csv changed since this index was loaded."""
+        return self._file_stamp() != self.source_stamp
+    
+    def _build_from_csv(self) -> bool:
+        """Parse EQUITY.csv into columns and build the name trie; False on failure."""
+        try:
+            df = pd.read_csv(self.equity_file)
+            df.columns = df.columns.str.strip()
+            df = df.reindex(columns=list(self.COLUMNS))
+            
+            text_columns = df.select_dtypes(include='object').columns
+            df[text_columns] = df[text_columns].fillna('').apply(lambda column: column.str.strip())
+            df = df[df['SYMBOL'] != ''].drop_duplicates('SYMBOL').sort_values('SYMBOL').reset_index(drop=True)
+            
+            self.columns = {field: df[column].tolist() for column, field in self.COLUMNS.items()}
+            self.name_trie = self._build_name_trie(self.columns['company_name'])
+            logger.info(f"Built symbol registry from {self.equity_file} ({len(df)} symbols)")
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error building symbol registry: {str(e)}")
+            return False
+    
+    def _build_name_trie(self, names: List[str]) -> Dict:
+        """Character trie over normalized company names, leaves hold row numbers."""
+        trie: Dict = {}
+        for row, name in enumerate(names):
+            node = trie
+            for char in self.normalize_name(name):
+                node = node.setdefault(char, {})
+            node.setdefault(self.END, []).append(row)
+        return trie
+    
+    def _save(self, stamp: tuple):
+        """Write the binary index atomically."""
+        try:
+            cache_dir = os.path.dirname(self.cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            payload = {
+                'version': self.FORMAT_VERSION,
+                'stamp': stamp,
+                'equity_file': os.path.abspath(self.equity_file),
+                'columns': self.columns,
+                'name_trie': self.name_trie
+            }
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            logger.error(f"Could not save symbol registry to {self.cache_file}: {str(e)}")
+    
+    def _build_lookups(self):
+        """Derive the in-memory symbol and ISIN lookups from the columns."""
+        self.symbols: List[str] = self.columns['symbol']
+        self.symbol_set = frozenset(self.symbols)
+        self.row_index = {symbol: row for row, symbol in enumerate(self.symbols)}
+        self.isin_map = {isin: symbol for isin, symbol in zip(self.columns['isin_number'], self.symbols) if isin}
+    
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """Upper-case a company name and collapse whitespace."""
+        return ' '.join(str(name).upper().split())
+    
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.symbol_set
+    
+    def __len__(self) -> int:
+        return len(self.symbols)
+    
+    def get_record(self, symbol: str) -> Dict:
+        """All EQUITY.csv fields for a symbol (empty dict if unknown)."""
+        row = self.row_index.get(symbol)
+        if row is None:
+            return {}
+        return {field: values[row] for field, values in self.columns.items()}
+    
+    def get_name(self, symbol: str) -> str:
+        """Company name for a symbol (empty string if unknown)."""
+        row = self.row_index.get(symbol)
+        return self.columns['company_name'][row] if row is not None else ''
+    
+    def get_series(self, symbol: str) -> str:
+        """Trading series (EQ, BE, ...) for a symbol."""
+        row = self.row_index.get(symbol)
+        return self.columns['series'][row] if row is not None else ''
+    
+    def symbol_for_isin(self, isin: str) -> Optional[str]:
+        """Symbol listed under an ISIN."""
+        return self.isin_map.get(isin.strip().upper())
+    
+    def symbols_in_series(self, series: str) -> List[str]:
+        """Sorted symbols trading in a series."""
+        return [symbol for symbol, symbol_series in zip(self.symbols, self.columns['series']) if symbol_series == series]
+    
+    def company_names(self) -> Dict[str, str]:
+        """Symbol -> company name for every symbol."""
+        return dict(zip(self.symbols, self.columns['company_name']))
+    
+    def find_by_name_prefix(self, prefix: str, limit: int = 20) -> List[str]:
+        """Symbols whose company name starts with prefix, shortest names first."""
+        node = self.name_trie
+        for char in self.normalize_name(prefix):
+            node = node.get(char)
+            if node is None:
+                return []
+        
+        # Breadth-first walk yields shorter (closer) names before longer ones
+        matches = []
+        level = [node]
+        while level and len(matches) < limit:
+            next_level = []
+            for current in level:
+                for key, child in current.items():
+                    if key == self.END:
+                        matches.extend(self.symbols[row] for row in child)
+                    else:
+                        next_level.append(child)
+            level = next_level
+        return matches[:limit]
+
+_symbol_registry: Optional[SymbolRegistry] = None
+_symbol_registry_lock = threading.Lock()
+_symbol_registry_checked_at = 0.0
+STALE_CHECK_INTERVAL = 30.0  # Seconds between EQUITY.csv modification checks
+
+def get_symbol_registry() -> SymbolRegistry:
+    """Get the symbol registry shared by every component in this process.
+    
+    A new registry replaces the shared one when EQUITY.csv has been modified. The
+    file is checked at most every STALE_CHECK_INTERVAL seconds, so lookups on hot
+    paths (one per news article) do not stat it each time.
+    """
+    global _symbol_registry, _symbol_registry_checked_at
+    with _symbol_registry_lock:
+        now = time.monotonic()
+        if _symbol_registry is None:
+            _symbol_registry = SymbolRegistry()
+            _symbol_registry_checked_at = now
+        elif now - _symbol_registry_checked_at >= STALE_CHECK_INTERVAL:
+            _symbol_registry_checked_at = now
+            if _symbol_registry.is_stale():
+                _symbol_registry = SymbolRegistry()
+        return _symbol_registry
@@ -10,7 +10,12 @@ import numpy as np
 import logging
 import time
 import random
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
+from components.bar_store import BarStore
+from components.rate_limiter import get_yahoo_rate_limiter
+from components.liveness_registry import get_liveness_registry
+from components.panel_indicators import PanelIndicatorEngine
+from components.rolling_kernels import rolling_mean_abs_deviation
 
 logger = logging.getLogger(__name__)
 
@@ -18,30 +23,35 @@ class TechnicalAnalyzer:
     """Technical analysis for stocks."""
     
     def __init__(self):
-        self.request_delay = 1.0  # Base delay between requests
         self.max_retries = 3
-        self.last_request_time = 0
+        self.rate_limiter = get_yahoo_rate_limiter()
+        self.batch_size = 50  # Symbols per grouped download
+        self.panel_engine = PanelIndicatorEngine()
+        self.bar_store = BarStore()
+        self.liveness_registry = get_liveness_registry()
         logger.info("Technical Analyzer initialized")
     
-    def _fetch_stock_data_with_retry(self, symbol: str, period: str = '3mo', max_retries: int = 3) -> pd.DataFrame:
-        """Fetch stock data with retry logic for rate limiting."""
+    def _fetch_stock_data_with_retry(self, symbol: str, period: str = '3mo', max_retries: int = 3,
+                                     start: Optional[str] = None) -> pd.DataFrame:
+        """Fetch stock data with retry logic for rate limiting.
+        
+        When start is given only bars from that date are requested; an empty result then
+        just means there are no new bars and is not retried.
+        """
         for attempt in range(max_retries):
             try:
-                # Add delay to prevent rate limiting
-                current_time = time.time()
-                time_since_last_request = current_time - self.last_request_time
-                if time_since_last_request < self.request_delay:
-                    sleep_time = self.request_delay - time_since_last_request + random.uniform(0, 0.5)
-                    logger.debug(f"Rate limiting delay: {sleep_time:.2f}s")
-                    time.sleep(sleep_time)
-                
-                self.last_request_time = time.time()
+                # Wait for budget on the shared Yahoo Finance limiter
+                self.rate_limiter.acquire()
                 
                 # Fetch stock data
                 ticker = yf.Ticker(symbol)
-                hist = ticker.history(period=period)
+                hist = ticker.history(start=start) if start else ticker.history(period=period)
+                
+                self.rate_limiter.report_success()
                 
                 if hist.empty:
+                    if start:
+                        return pd.DataFrame()
                     if attempt < max_retries - 1:
                         wait_time = (2 ** attempt) + random.uniform(0, 1)
                         logger.warning(f"No data for {symbol}, waiting {wait_time:.1f}s before retry {attempt + 1}/{max_retries}")
@@ -55,17 +65,18 @@ class TechnicalAnalyzer:
                 
             except Exception as e:
                 error_msg = str(e).lower()
-                if 'rate limited' in error_msg or 'too many requests' in error_msg:
+                if self.rate_limiter.is_throttle_error(e):
+                    # The limiter pauses every caller, the next acquire() waits out the cooldown
+                    self.rate_limiter.report_throttled()
                     if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt) + random.uniform(1, 3)
-                        logger.warning(f"Rate limited for {symbol}, waiting {wait_time:.1f}s before retry {attempt + 1}/{max_retries}")
-                        time.sleep(wait_time)
+                        logger.warning(f"Rate limited for {symbol}, retry {attempt + 1}/{max_retries} after limiter backoff")
                         continue
                     else:
                         logger.error(f"Rate limited for {symbol} after {max_retries} attempts")
                         return pd.DataFrame()
                 elif self._is_likely_delisted(error_msg):
                     logger.warning(f"Stock {symbol} appears to be delisted: {str(e)}")
+                    self.liveness_registry.mark_delisted(symbol, str(e))
                     return pd.DataFrame()
                 elif 'no price data' in error_msg:
                     # Don't immediately assume delisted for "no price data" - might be temporary
@@ -89,6 +100,75 @@ class TechnicalAnalyzer:
         
         return pd.DataFrame()
     
+    def _fetch_batch_data_with_retry(self, symbols: List[str], period: str = '3mo', max_retries: int = 3,
+                                     start: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Fetch history for many symbols in one grouped download and split it per symbol."""
+        for attempt in range(max_retries):
+            try:
+                # A grouped download issues several requests, charge up to a full burst
+                self.rate_limiter.acquire(min(len(symbols), self.rate_limiter.capacity))
+                
+                # One grouped download for the whole chunk
+                range_args = {'start': start} if start else {'period': period}
+                data = yf.download(
+                    symbols, group_by='ticker', auto_adjust=True,
+                    actions=False, threads=True, progress=False, **range_args
+                )
+                
+                self.rate_limiter.report_success()
+                
+                if data is None or data.empty:
+                    if start:
+                        return {}
+                    if attempt < max_retries - 1:
+                        wait_time = (2 ** attempt) + random.uniform(0, 1)
+                        logger.warning(f"No batch data for {len(symbols)} symbols, waiting {wait_time:.1f}s before retry {attempt + 1}/{max_retries}")
+                        time.sleep(wait_time)
+                        continue
+                    else:
+                        logger.error(f"No batch data available for {len(symbols)} symbols after {max_retries} attempts")
+                        return {}
+                
+                return self._split_batch_frame(data, symbols)
+            
+            except Exception as e:
+                throttled = self.rate_limiter.is_throttle_error(e)
+                if throttled:
+                    self.rate_limiter.report_throttled()
+                if attempt < max_retries - 1:
+                    # After a throttle the limiter already enforces the cooldown
+                    wait_time = 0 if throttled else (2 ** attempt) + random.uniform(0, 1)
+                    logger.warning(f"Error fetching batch of {len(symbols)} symbols: {str(e)}, waiting {wait_time:.1f}s before retry {attempt + 1}/{max_retries}")
+                    time.sleep(wait_time)
+                    continue
+                else:
+                    logger.error(f"Error fetching batch of {len(symbols)} symbols after {max_retries} attempts: {str(e)}")
+                    return {}
+        
+        return {}
+    
+    def _split_batch_frame(self, data: pd.DataFrame, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """Split a wide grouped-download frame into one OHLCV frame per symbol."""
+        frames = {}
+        
+        if not isinstance(data.columns, pd.MultiIndex):
+            # Single ticker downloads may come back with flat columns
+            if len(symbols) == 1:
+                hist = data.dropna(how='all')
+                if not hist.empty:
+                    frames[symbols[0]] = hist
+            return frames
+        
+        available = set(data.columns.get_level_values(0))
+        for symbol in symbols:
+            if symbol not in available:
+                continue
+            hist = data[symbol].dropna(how='all')
+            if not hist.empty:
+                frames[symbol] = hist
+        
+        return frames
+    
     def _is_likely_delisted(self, error_msg: str) -> bool:
         """Check if error message indicates the stock is likely delisted."""
         error_msg_lower = error_msg.lower()
@@ -193,7 +273,7 @@ class TechnicalAnalyzer:
         try:
             typical_price = (high + low + close) / 3
             sma_tp = typical_price.rolling(window=period).mean()
-            mean_deviation = typical_price.rolling(window=period).apply(lambda x: np.mean(np.abs(x - x.mean())))
+            mean_deviation = rolling_mean_abs_deviation(typical_price, period)
             cci = (typical_price - sma_tp) / (0.015 * mean_deviation)
             return cci.iloc[-1] if not cci.empty else 0
         except:
@@ -338,14 +418,106 @@ class TechnicalAnalyzer:
 
     def analyze_stock(self, symbol: str, period: str = '3mo') -> Dict:
         """Perform comprehensive technical analysis on stock."""
-        try:
-            # Fetch stock data with retry logic
-            hist = self._fetch_stock_data_with_retry(symbol, period)
+        if self.liveness_registry.is_delisted(symbol):
+            logger.info(f"Skipping {symbol}: marked as delisted")
+            return {}
+        
+        # Read from the local bar store, fetching only missing bars (with retry logic)
+        hist = self.bar_store.get_history(symbol, period, self._fetch_stock_data_with_retry)
+        
+        if hist.empty:
+            logger.warning(f"No data available for {symbol}")
+            return {}
+        
+        self.liveness_registry.record_trading(symbol, hist.index[-1])
+        return self._analyze_history(symbol, hist)
+    
+    def analyze_stocks(self, symbols: List[str], period: str = '3mo') -> Dict[str, Dict]:
+        """Perform technical analysis on many stocks using grouped history downloads.
+        
+        Returns a dict of symbol -> analysis; symbols without data are left out so
+        callers can fall back to analyze_stock for them. Delisted symbols are skipped.
+        """
+        unique_symbols = [symbol for symbol in dict.fromkeys(symbols)
+                          if not self.liveness_registry.is_delisted(symbol)]
+        frames = self._load_batch_history(unique_symbols, period)
+        
+        self.liveness_registry.record_many({symbol: hist.index[-1] for symbol, hist in frames.items() if not hist.empty})
+        
+        results = self.analyze_frames(frames)
+        logger.info(f"Batch technical analysis completed for {len(results)}/{len(unique_symbols)} symbols")
+        return results
+    
+    def _load_batch_history(self, symbols: List[str], period: str) -> Dict[str, pd.DataFrame]:
+        """Get history for many symbols from the bar store, batching any downloads it needs."""
+        store = self.bar_store
+        frames = {}
+        stale = []
+        missing = []
+        
+        for symbol in symbols:
+            if not store.covers(symbol, period):
+                missing.append(symbol)
+            elif store.is_fresh(symbol):
+                frames[symbol] = store.slice_period(store.load(symbol), period)
+            else:
+                stale.append(symbol)
+        
+        # Stored symbols only need the bars since their last stored date
+        for offset in range(0, len(stale), self.batch_size):
+            chunk = stale[offset:offset + self.batch_size]
+            starts = {symbol: store.fetch_start(symbol) for symbol in chunk}
+            # A file emptied since covers() checked it has no start; download it in full
+            missing.extend(symbol for symbol, start in starts.items() if start is None)
+            chunk = [symbol for symbol in chunk if starts[symbol] is not None]
+            if not chunk:
+                continue
+            start = min(starts[symbol] for symbol in chunk).strftime('%Y-%m-%d')
+            tails = self._fetch_batch_data_with_retry(chunk, period, start=start)
             
-            if hist.empty:
-                logger.warning(f"No data available for {symbol}")
+            for symbol in chunk:
+                merged = store.merge(symbol, tails.get(symbol))
+                if merged is None:
+                    missing.append(symbol)
+                else:
+                    frames[symbol] = store.slice_period(merged, period)
+        
+        # Everything else is downloaded for the full period
+        for offset in range(0, len(missing), self.batch_size):
+            chunk = missing[offset:offset + self.batch_size]
+            for symbol, hist in self._fetch_batch_data_with_retry(chunk, period).items():
+                frames[symbol] = store.slice_period(store.replace(symbol, hist, period), period)
+        
+        return frames
+    
+    def analyze_frames(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+        """Run the indicator suite over many history frames in one vectorized pass."""
+        try:
+            panels = self.panel_engine.build_panel(frames)
+            if not panels:
                 return {}
             
+            results = self.panel_engine.compute(panels['High'], panels['Low'], panels['Close'], panels['Volume'])
+            timestamp = pd.Timestamp.now().isoformat()
+            
+            for analysis in results.values():
+                analysis['technical_score'] = self._calculate_technical_score({
+                    'rsi': analysis['rsi'], 'macd': analysis['macd'], 'current_price': analysis['current_price'],
+                    'sma_10': analysis['sma_10'], 'sma_20': analysis['sma_20'], 'sma_50': analysis['sma_50'],
+                    'bb_upper': analysis['bb_upper'], 'bb_lower': analysis['bb_lower'], 'atr': analysis['atr'],
+                    'williams_r': analysis['williams_r'], 'stoch_k': analysis['stochastic_k'], 'stoch_d': analysis['stochastic_d']
+                })
+                analysis['timestamp'] = timestamp
+            
+            return results
+        
+        except Exception as e:
+            logger.error(f"Error analyzing history frames: {str(e)}")
+            return {}
+    
+    def _analyze_history(self, symbol: str, hist: pd.DataFrame) -> Dict:
+        """Calculate the full indicator suite from an OHLCV history frame."""
+        try:
             # Calculate all technical indicators
             rsi = self.calculate_rsi(hist['Close'])
             macd = self.calculate_macd(hist['Close'])
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test script to verify article cache keys and the watchlist symbol index.
+"""
+
+import sys
+import os
+import time
+import json
+import hashlib
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from components.cache_keys import article_cache_key, normalize_url, normalize_title, symbol_index
+from components.cache_manager import CacheManager
+
+def _make_articles(count: int):
+    """Synthetic news articles with distinct URLs and titles."""
+    return [{
+        'url': f"https://www.example-news.com/markets/stocks/news/article-{i}/articleshow/{1000000 + i}.cms",
+        'title': f"Stock {i % 500} shares move {i % 7}% after quarterly results number {i}",
+        'description': 'Markets closed higher on broad buying.'
+    } for i in range(count)]
+
+def _legacy_cache_key(article):
+    """Article key exactly as CacheManager._generate_cache_key used to compute it."""
+    data_str = json.dumps({'url': article.get('url', ''), 'title': article.get('title', '')}, sort_keys=True, default=str)
+    return hashlib.md5(data_str.encode()).hexdigest()
+
+def _legacy_filter(stocks, watchlist):
+    """Watchlist filtering with a linear scan per stock, as before the index."""
+    kept = []
+    for stock in stocks:
+        symbol = stock.get('symbol', '').upper()
+        if not any(item.get('symbol', '').upper() == symbol for item in watchlist):
+            kept.append(stock)
+    return kept
+
+def test_article_keys_normalized():
+    """Test that cosmetic URL/title differences map to the same key."""
+    print("🧪 Testing article key normalization...")
+    
+    article = {'url': 'https://Example.com/News/Story-1/', 'title': 'Reliance  Shares Jump'}
+    variant = {'url': ' HTTPS://example.COM/News/Story-1#comments', 'title': 'reliance shares\tjump '}
+    other_path = {'url': 'https://example.com/news/story-1', 'title': 'Reliance Shares Jump'}
+    
+    assert normalize_url(article['url']) == 'https://example.com/News/Story-1'
+    assert normalize_title(variant['title']) == 'reliance shares jump'
+    assert article_cache_key(article) == article_cache_key(variant)
+    assert article_cache_key(article) != article_cache_key(other_path)
+    assert article_cache_key({}) == article_cache_key({'url': '', 'title': ''})
+    assert len(article_cache_key(article)) == 16
+    
+    print("✅ Normalization verified")
+
+def test_article_keys_distinct():
+    """Test that 10k distinct articles get 10k distinct keys."""
+    print("🧪 Testing article key uniqueness...")
+    
+    articles = _make_articles(10000)
+    assert len({article_cache_key(article) for article in articles}) == len(articles)
+    
+    print("✅ No collisions on 10k articles")
+
+def test_article_dedup():
+    """Test that cache_articles returns each article only once."""
+    print("🧪 Testing article deduplication...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_manager = CacheManager(cache_dir, write_behind=False)
+        articles = _make_articles(50)
+        
+        assert len(cache_manager.cache_articles(articles)) == 50
+        assert cache_manager.cache_articles(articles) == []
+        retitled = [dict(article, title=article['title'].upper()) for article in articles[:5]]
+        assert cache_manager.cache_articles(retitled) == []
+        cache_manager.store.close()
+    
+    print("✅ Deduplication verified")
+
+def test_watchlist_filter_parity():
+    """Test that the indexed watchlist filter keeps the same stocks as the linear scan."""
+    print("🧪 Testing watchlist filter parity...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_manager = CacheManager(cache_dir, write_behind=False)
+        watchlist = [{'symbol': f"SYM{i}"} for i in range(0, 400, 3)] + [{'name': 'no symbol'}]
+        stocks = [{'symbol': f"sym{i}" if i % 2 else f"SYM{i}"} for i in range(400)]
+        
+        expected = _legacy_filter(stocks, watchlist)
+        assert cache_manager.filter_watchlist_stocks(stocks, watchlist, allow_negative_news=False) == expected
+        assert cache_manager.is_stock_in_watchlist('sym3', watchlist)
+        assert cache_manager.is_stock_in_watchlist('SYM3', cache_manager.build_watchlist_index(watchlist))
+        assert not cache_manager.is_stock_in_watchlist('SYM4', watchlist)
+        assert symbol_index(['tcs', {'symbol': 'infy'}, {}]) == {'TCS', 'INFY'}
+        cache_manager.store.close()
+    
+    print("✅ Filter parity verified")
+
+if __name__ == "__main__":
+    print("🚀 Starting Cache Key Tests...\n")
+    
+    try:
+        test_article_keys_normalized()
+        test_article_keys_distinct()
+        test_article_dedup()
+        test_watchlist_filter_parity()
+        
+        # Micro-benchmark on 10k articles and a 500-symbol watchlist
+        articles = _make_articles(10000)
+        start = time.perf_counter()
+        legacy_keys = {_legacy_cache_key(article) for article in articles}
+        legacy_time = time.perf_counter() - start
+        start = time.perf_counter()
+        fast_keys = {article_cache_key(article) for article in articles}
+        fast_time = time.perf_counter() - start
+        print(f"\n⏱️ 10k article keys - json+md5: {legacy_time * 1000:.1f}ms, normalized blake2b: {fast_time * 1000:.1f}ms "
+              f"({legacy_time / fast_time:.1f}x)")
+        assert len(legacy_keys) == len(fast_keys) == len(articles)
+        
+        watchlist = [{'symbol': f"SYM{i}"} for i in range(500)]
+        stocks = [{'symbol': f"SYM{i % 1000}"} for i in range(10000)]
+        start = time.perf_counter()
+        _legacy_filter(stocks, watchlist)
+        legacy_time = time.perf_counter() - start
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_manager = CacheManager(cache_dir, write_behind=False)
+            start = time.perf_counter()
+            cache_manager.filter_watchlist_stocks(stocks, watchlist, allow_negative_news=False)
+            fast_time = time.perf_counter() - start
+            cache_manager.store.close()
+        print(f"⏱️ 10k stocks vs 500-symbol watchlist - linear scan: {legacy_time * 1000:.1f}ms, "
+              f"symbol index: {fast_time * 1000:.1f}ms ({legacy_time / fast_time:.1f}x)")
+        
+        print("\n🎉 All cache key tests completed successfully!")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
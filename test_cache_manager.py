@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the cache manager's SQLite-backed persistence.
+"""
+
+import sys
+import os
+import pickle
+import tempfile
+import time
+import threading
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from components.cache_manager import CacheManager
+
+def test_legacy_pickle_import():
+    """Test that a whole-dict *_cache.pkl from earlier versions is imported once."""
+    print("🧪 Testing legacy pickle import...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        legacy_file = os.path.join(cache_dir, "stocks_cache.pkl")
+        with open(legacy_file, 'wb') as f:
+            pickle.dump({
+                'stock_TCS': {'analysis': {'score': 7}, 'timestamp': datetime.now().isoformat()},
+                'stock_OLD': {'score': 1}  # Legacy entry without timestamp
+            }, f)
+        
+        cache_manager = CacheManager(cache_dir, write_behind=False)
+        assert cache_manager.get_cached_stock_analysis('TCS') == {'score': 7}
+        assert cache_manager.get_cached_stock_analysis('OLD') == {'score': 1}
+        assert cache_manager.store.count('stocks') == 2
+        assert not os.path.exists(legacy_file)
+        assert os.path.exists(f"{legacy_file}.migrated")
+        cache_manager.store.close()
+    
+    print("✅ Legacy import verified")
+
+def test_restart_persistence():
+    """Test that entries written by one manager are loaded by the next."""
+    print("🧪 Testing persistence across restarts...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_manager = CacheManager(cache_dir, write_behind=False)
+        cache_manager.cache_stock_analysis('INFY', {'score': 5})
+        cache_manager.cache_groq_analysis('news_1', {'summary': 'ok'})
+        cache_manager.cache_articles([{'url': 'https://example.com/a', 'title': 'A'}])
+        cache_manager.store.close()
+        
+        reopened = CacheManager(cache_dir, write_behind=False)
+        assert reopened.get_cached_stock_analysis('INFY') == {'score': 5}
+        assert reopened.get_cached_groq_analysis('news_1') == {'summary': 'ok'}
+        assert reopened.cache_articles([{'url': 'https://example.com/a', 'title': 'A'}]) == []
+        reopened.clear_cache('all')
+        reopened.store.close()
+        
+        cleared = CacheManager(cache_dir, write_behind=False)
+        assert cleared.get_cache_stats()['stocks'] == 0
+        cleared.store.close()
+    
+    print("✅ Restart persistence verified")
+
+def test_pending_writes_visible_before_flush():
+    """Test that write-behind changes are readable before they reach the store."""
+    print("🧪 Testing pending writes before flush...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_manager = CacheManager(cache_dir, flush_interval=60)
+        cache_manager.cache_stock_analysis('HDFC', {'score': 6})
+        
+        assert cache_manager.store.count('stocks') == 0
+        assert cache_manager.get_cached_stock_analysis('HDFC') == {'score': 6}
+        assert cache_manager.flush() == 1
+        assert cache_manager.store.count('stocks') == 1
+        cache_manager.store.close()
+        
+        reopened = CacheManager(cache_dir, write_behind=False)
+        assert reopened.get_cached_stock_analysis('HDFC') == {'score': 6}
+        reopened.store.close()
+    
+    print("✅ Pending writes verified")
+
+def test_clear_discards_pending_writes():
+    """Test that a flush after clear_cache does not bring cleared entries back."""
+    print("🧪 Testing clear versus a late flush...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_manager = CacheManager(cache_dir, flush_interval=60)
+        cache_manager.cache_stock_analysis('SBIN', {'score': 4})
+        cache_manager.clear_cache('stocks')
+        
+        assert cache_manager.flush() == 0
+        assert cache_manager.store.count('stocks') == 0
+        assert cache_manager.get_cached_stock_analysis('SBIN') is None
+        cache_manager.store.close()
+    
+    print("✅ Clear before flush verified")
+
+def test_failed_flush_is_retried():
+    """Test that changes survive a failed flush and are written by the next one."""
+    print("🧪 Testing failed flush retry...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_manager = CacheManager(cache_dir, flush_interval=60, memory_entries=0)
+        cache_manager.cache_stock_analysis('ITC', {'score': 3})
+        
+        put_many = cache_manager.store.put_many
+        def failing_put_many(namespace, items):
+            raise OSError("disk full")
+        cache_manager.store.put_many = failing_put_many
+        assert cache_manager.flush() == 0
+        cache_manager.cache_stock_analysis('ITC', {'score': 8})  # Newer than the failed batch
+        assert cache_manager.get_cached_stock_analysis('ITC') == {'score': 8}
+        
+        cache_manager.store.put_many = put_many
+        assert cache_manager.flush() == 1
+        assert cache_manager.store.get('stocks', 'stock_ITC')['analysis'] == {'score': 8}
+        cache_manager.store.close()
+    
+    print("✅ Flush retry verified")
+
+def test_expiry_through_heap():
+    """Test that expired entries are dropped without touching live ones."""
+    print("🧪 Testing heap-indexed expiry...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        legacy_file = os.path.join(cache_dir, "analysis_cache.pkl")
+        with open(legacy_file, 'wb') as f:
+            pickle.dump({
+                'stale': {'analysis': {}, 'timestamp': (datetime.now() - timedelta(hours=200)).isoformat()},
+                'fresh': {'analysis': {'ok': True}, 'timestamp': datetime.now().isoformat()}
+            }, f)
+        
+        cache_manager = CacheManager(cache_dir, write_behind=False)
+        assert cache_manager.get_cached_groq_analysis('stale') is None
+        assert cache_manager.get_cached_groq_analysis('fresh') == {'ok': True}
+        assert cache_manager.store.count('analysis') == 1
+        
+        cache_manager.stocks_cache_hours = 0.05 / 3600
+        cache_manager.cache_stock_analysis('SHORT', {})
+        cache_manager.stocks_cache_hours = 168
+        cache_manager.cache_stock_analysis('LONG', {})
+        time.sleep(0.1)
+        
+        # Rewriting a key leaves a stale heap item that must be skipped
+        cache_manager.cache_stock_analysis('LONG', {'v': 2})
+        cache_manager._clean_expired_cache('stocks')
+        assert cache_manager.get_cache_stats()['stocks'] == 1
+        assert cache_manager.get_cached_stock_analysis('SHORT') is None
+        assert cache_manager.get_cached_stock_analysis('LONG') == {'v': 2}
+        assert cache_manager.store.count('stocks') == 1
+        cache_manager.store.close()
+    
+    print("✅ Expiry verified")
+
+def test_lru_eviction_bounds():
+    """Test that the least recently used entries go once max_entries or max_bytes is exceeded."""
+    print("🧪 Testing LRU eviction...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_manager = CacheManager(cache_dir, write_behind=False, max_entries=3)
+        for symbol in ('A', 'B', 'C'):
+            cache_manager.cache_stock_analysis(symbol, {'symbol': symbol})
+        assert cache_manager.get_cached_stock_analysis('A') is not None  # A becomes most recent
+        cache_manager.cache_stock_analysis('D', {'symbol': 'D'})
+        
+        assert cache_manager.get_cached_stock_analysis('B') is None
+        assert all(cache_manager.get_cached_stock_analysis(symbol) for symbol in ('A', 'C', 'D'))
+        assert cache_manager.store.count('stocks') == 3
+        assert cache_manager.get_cache_stats()['evictions'] == 1
+        cache_manager.store.close()
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_manager = CacheManager(cache_dir, write_behind=False, max_bytes=4000)
+        articles = [{'url': f"https://example.com/{i}", 'title': f"Article {i}", 'content': 'x' * 500} for i in range(20)]
+        cache_manager.cache_articles(articles)
+        
+        stats = cache_manager.get_cache_stats()
+        assert 0 < stats['articles'] < 20
+        assert stats['cache_bytes'] <= 4000
+        assert cache_manager.store.count('articles') == stats['articles']
+        # The newest articles are the ones kept
+        assert cache_manager.cache_articles(articles[-1:]) == []
+        cache_manager.store.close()
+    
+    print("✅ Eviction verified")
+
+def test_two_tier_read_through():
+    """Test that memory misses are served from disk, promoted and counted per tier."""
+    print("🧪 Testing two-tier read-through...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_manager = CacheManager(cache_dir, flush_interval=60, memory_entries=2)
+        for symbol in ('A', 'B', 'C'):
+            cache_manager.cache_stock_analysis(symbol, {'symbol': symbol})
+        assert list(cache_manager.stocks_cache) == ['stock_B', 'stock_C']
+        
+        # A was demoted before being flushed: served from the pending changes
+        assert cache_manager.get_cached_stock_analysis('A') == {'symbol': 'A'}
+        cache_manager.flush()
+        assert cache_manager.get_cached_stock_analysis('B') == {'symbol': 'B'}
+        assert cache_manager.get_cached_stock_analysis('B') == {'symbol': 'B'}
+        assert cache_manager.get_cached_stock_analysis('Z') is None
+        
+        stats = cache_manager.get_cache_stats()
+        assert stats['stocks'] == 3
+        assert stats['memory_entries'] == 2
+        assert (stats['memory_hits'], stats['memory_misses']) == (1, 3)
+        assert (stats['disk_hits'], stats['disk_misses']) == (2, 1)
+        cache_manager.store.close()
+    
+    print("✅ Read-through verified")
+
+def test_shared_across_threads():
+    """Test that one manager serves concurrent sessions without losing writes."""
+    print("🧪 Testing shared manager under concurrency...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_manager = CacheManager(cache_dir, flush_interval=0.05, memory_entries=50)
+        
+        def session(index):
+            for i in range(100):
+                cache_manager.cache_stock_analysis(f"S{index}_{i}", {'i': i})
+                cache_manager.get_cached_stock_analysis(f"S{index}_{i // 2}")
+        
+        threads = [threading.Thread(target=session, args=(index,)) for index in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        cache_manager.flush()
+        
+        assert cache_manager.get_cache_stats()['stocks'] == 600
+        assert cache_manager.store.count('stocks') == 600
+        assert cache_manager.get_cached_stock_analysis('S3_99') == {'i': 99}
+        cache_manager.store.close()
+    
+    print("✅ Shared manager verified")
+
+if __name__ == "__main__":
+    print("🚀 Starting Cache Manager Tests...\n")
+    
+    try:
+        test_legacy_pickle_import()
+        test_restart_persistence()
+        test_pending_writes_visible_before_flush()
+        test_clear_discards_pending_writes()
+        test_failed_flush_is_retried()
+        test_expiry_through_heap()
+        test_lru_eviction_bounds()
+        test_two_tier_read_through()
+        test_shared_across_threads()
+        
+        print("\n🎉 All cache manager tests completed successfully!")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
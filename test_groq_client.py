@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script to verify Groq retries on throttled responses without calling the API.
+"""
+
+import sys
+import os
+import json
+import time
+import requests
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from components.groq_analyzer import GroqNewsAnalyzer
+from components.groq_client import GroqClient
+from components.model_health import ModelHealthTracker
+
+def _make_response(status_code, body=None, headers=None):
+    """requests.Response with a JSON body, as returned by the session."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = json.dumps(body or {}).encode('utf-8')
+    return response
+
+def _make_analyzer(responses):
+    """Analyzer whose shared client replays the given responses in order."""
+    analyzer = GroqNewsAnalyzer()
+    analyzer.api_key = 'test-key'
+    analyzer.http_client = GroqClient()
+    analyzer.model_health = ModelHealthTracker()
+    replies = iter(responses)
+    analyzer.http_client.session.post = lambda url, headers, json, timeout: next(replies)
+    return analyzer
+
+def test_503_with_retry_after_is_retried():
+    """Test that a 503 carrying Retry-After waits out the pause and retries."""
+    print("🧪 Testing 503 with Retry-After...")
+    
+    body = {'choices': [{'message': {'content': 'ok'}}]}
+    analyzer = _make_analyzer([
+        _make_response(503, headers={'Retry-After': '0.2'}),
+        _make_response(200, body)
+    ])
+    
+    start = time.time()
+    result = analyzer._post_with_retry({'model': 'test-model', 'messages': []})
+    assert result == body
+    assert time.time() - start >= 0.2  # The shared hold set by the 503 was honoured
+    assert analyzer.http_client.get_stats()['throttled'] == 1
+    
+    stats = analyzer.model_health.get_stats()['test-model']
+    assert stats['success_rate'] == 1.0
+    assert stats['last_error'] == ''
+    
+    print("✅ 503 retry verified")
+
+def test_throttle_failure_recorded_after_retries():
+    """Test that a model failure is only recorded once every retry was throttled."""
+    print("🧪 Testing throttled retries running out...")
+    
+    analyzer = _make_analyzer([_make_response(503, headers={'Retry-After': '0'}) for _ in range(3)])
+    
+    assert analyzer._post_with_retry({'model': 'test-model', 'messages': []}, max_retries=3) is None
+    stats = analyzer.model_health.get_stats()['test-model']
+    assert stats['requests'] == 1
+    assert stats['last_error'] == 'HTTP 503 after all retries'
+    
+    print("✅ Failure after retries verified")
+
+if __name__ == "__main__":
+    print("🚀 Starting Groq Client Tests...\n")
+    
+    try:
+        test_503_with_retry_after_is_retried()
+        test_throttle_failure_recorded_after_retries()
+        
+        print("\n🎉 All Groq client tests completed successfully!")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
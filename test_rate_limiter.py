@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test script to verify which errors the Yahoo Finance rate limiter treats as throttling.
+"""
+
+import sys
+import os
+import requests
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from components.rate_limiter import TokenBucketRateLimiter
+
+def test_throttle_errors_detected():
+    """Test that provider rate-limit errors are recognised."""
+    print("🧪 Testing throttle error detection...")
+    
+    limiter = TokenBucketRateLimiter('test')
+    assert limiter.is_throttle_error(Exception("Too Many Requests. Rate limited. Try after a while."))
+    assert limiter.is_throttle_error(Exception("HTTP 429 returned for RELIANCE.NS"))
+    
+    response = requests.Response()
+    response.status_code = 429
+    assert limiter.is_throttle_error(requests.HTTPError("Client error", response=response))
+    
+    print("✅ Throttle errors detected")
+
+def test_unrelated_429_not_throttle():
+    """Test that errors merely containing the digits 429 do not trigger backoff."""
+    print("🧪 Testing non-throttle errors containing 429...")
+    
+    limiter = TokenBucketRateLimiter('test')
+    assert not limiter.is_throttle_error(Exception("No price data found for 542922.BO (close 1429.5)"))
+    assert not limiter.is_throttle_error(Exception("404 Not Found: https://query1.finance.yahoo.com/v8/chart/4290.T"))
+    
+    response = requests.Response()
+    response.status_code = 404
+    assert not limiter.is_throttle_error(requests.HTTPError("Not found: /quote/429", response=response))
+    assert limiter.get_stats()['total_throttles'] == 0
+    
+    print("✅ Unrelated errors ignored")
+
+if __name__ == "__main__":
+    print("🚀 Starting Rate Limiter Tests...\n")
+    
+    try:
+        test_throttle_errors_detected()
+        test_unrelated_429_not_throttle()
+        
+        print("\n🎉 All rate limiter tests completed successfully!")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
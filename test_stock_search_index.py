@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the stock search index against a linear scan and check its ranking.
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from components.stock_search_index import StockSearchIndex
+
+ENTRIES = [
+    ('RELIANCE', 'Reliance Industries Limited'),
+    ('RELINFRA', 'Reliance Infrastructure Limited'),
+    ('RPOWER', 'Reliance Power Limited'),
+    ('TCS', 'Tata Consultancy Services Limited'),
+    ('TATAMOTORS', 'Tata Motors Limited'),
+    ('TATASTEEL', 'Tata Steel Limited'),
+    ('INFY', 'Infosys Limited'),
+    ('HDFCBANK', 'HDFC Bank Limited'),
+    ('ICICIBANK', 'ICICI Bank Limited'),
+    ('SBIN', 'State Bank of India')
+]
+
+def _linear_scan(query: str):
+    """Row numbers EquityLoader.search_stocks used to find with a full scan."""
+    query = query.upper()
+    return [row for row, (symbol, name) in enumerate(ENTRIES) if query in symbol or query in name.upper()]
+
+def test_substring_parity():
+    """Test substring matches are identical to the linear scan."""
+    print("🧪 Testing substring match parity...")
+    
+    index = StockSearchIndex(ENTRIES)
+    for query in ['', 'R', 'REL', 'rel', 'BANK', 'tata m', 'LIMITED', 'INDIA', 'XYZ', 'S']:
+        expected = _linear_scan(query) if query else list(range(len(ENTRIES)))
+        assert index.substring_matches(query) == expected, query
+    
+    print("✅ Substring parity verified")
+
+def test_ranking():
+    """Test exact, prefix, name and fuzzy matches are ranked in that order."""
+    print("🧪 Testing search ranking...")
+    
+    index = StockSearchIndex(ENTRIES)
+    
+    results = index.search('tcs')
+    assert results[0]['symbol'] == 'TCS' and results[0]['match'] == 'exact'
+    
+    results = index.search('TATA')
+    assert [r['symbol'] for r in results[:2]] == ['TATASTEEL', 'TATAMOTORS']
+    assert all(r['match'] == 'symbol_prefix' for r in results[:2])
+    
+    results = index.search('reliance ind')
+    assert results[0]['symbol'] == 'RELIANCE'
+    
+    results = index.search('bank')
+    assert {r['symbol'] for r in results} >= {'HDFCBANK', 'ICICIBANK', 'SBIN'}
+    
+    results = index.search('relaince', limit=5)
+    assert 'RELIANCE' in [r['symbol'] for r in results]
+    assert index.search('relaince', fuzzy=False) == []
+    
+    assert len(index.search('L', limit=3)) == 3
+    
+    print("✅ Ranking verified")
+
+if __name__ == "__main__":
+    print("🚀 Starting Stock Search Index Tests...\n")
+    
+    try:
+        test_substring_parity()
+        test_ranking()
+        
+        # Rough timing on the full EQUITY.csv universe
+        from components.equity_loader import get_equity_loader
+        loader = get_equity_loader()
+        loader.search_top_k('A')
+        start = time.perf_counter()
+        for query in ['A', 'REL', 'tata mot', 'hdfc bank', 'infosis']:
+            loader.search_top_k(query)
+        print(f"\n⏱️ 5 queries over {len(loader.stock_symbols)} stocks: {(time.perf_counter() - start) * 1000:.2f}ms")
+        
+        print("\n🎉 All stock search index tests completed successfully!")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()